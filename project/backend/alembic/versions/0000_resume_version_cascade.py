@@ -0,0 +1,32 @@
+"""resume versions deleted with their resume
+
+Revision ID: 0000_resume_version_cascade
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0000_resume_version_cascade"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEY = "resume_versions_resume_id_fkey"
+
+
+def upgrade() -> None:
+    # Deleting a resume used to go through the ORM relationship, loading
+    # every version first; the database does it now.
+    op.drop_constraint(FOREIGN_KEY, "resume_versions", type_="foreignkey")
+    op.create_foreign_key(
+        FOREIGN_KEY, "resume_versions", "resumes", ["resume_id"], ["id"], ondelete="CASCADE"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(FOREIGN_KEY, "resume_versions", type_="foreignkey")
+    op.create_foreign_key(FOREIGN_KEY, "resume_versions", "resumes", ["resume_id"], ["id"])
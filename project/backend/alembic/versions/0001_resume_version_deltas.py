@@ -0,0 +1,90 @@
+"""store resume versions as snapshots plus json-patch deltas
+
+Revision ID: 0001_resume_version_deltas
+Revises: 0000_resume_version_cascade
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.core.config import settings
+from app.core.json_patch import apply_patch, make_patch
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_resume_version_deltas"
+down_revision: Union[str, None] = "0000_resume_version_cascade"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+resume_versions = sa.table(
+    "resume_versions",
+    sa.column("id", UUID(as_uuid=True)),
+    sa.column("resume_id", UUID(as_uuid=True)),
+    sa.column("version", sa.Integer),
+    sa.column("is_snapshot", sa.Boolean),
+    sa.column("content", JSONB),
+    sa.column("delta", JSONB),
+)
+
+
+def _versions_by_resume(conn):
+    resume_ids = conn.execute(sa.select(resume_versions.c.resume_id).distinct()).scalars().all()
+    for resume_id in resume_ids:
+        rows = conn.execute(
+            sa.select(resume_versions)
+            .where(resume_versions.c.resume_id == resume_id)
+            .order_by(resume_versions.c.version)
+        ).all()
+        yield rows
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resume_versions",
+        sa.Column("is_snapshot", sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.add_column("resume_versions", sa.Column("delta", JSONB(), nullable=True))
+    op.alter_column("resume_versions", "content", nullable=True)
+
+    conn = op.get_bind()
+    interval = max(1, settings.RESUME_VERSION_SNAPSHOT_INTERVAL)
+    for rows in _versions_by_resume(conn):
+        previous = None
+        for row in rows:
+            if previous is not None and (row.version - 1) % interval != 0:
+                conn.execute(
+                    resume_versions.update()
+                    .where(resume_versions.c.id == row.id)
+                    .values(
+                        is_snapshot=False,
+                        content=sa.null(),
+                        delta=make_patch(previous, row.content),
+                    )
+                )
+            previous = row.content
+
+    op.alter_column("resume_versions", "is_snapshot", server_default=None)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for rows in _versions_by_resume(conn):
+        content = None
+        for row in rows:
+            if row.is_snapshot:
+                content = row.content
+                continue
+            content = apply_patch(content, row.delta or [])
+            conn.execute(
+                resume_versions.update()
+                .where(resume_versions.c.id == row.id)
+                .values(content=content)
+            )
+
+    op.alter_column("resume_versions", "content", nullable=False)
+    op.drop_column("resume_versions", "delta")
+    op.drop_column("resume_versions", "is_snapshot")
@@ -0,0 +1,63 @@
+"""content hash and last-write timestamp on resume versions
+
+Revision ID: 0002_resume_version_hashes
+Revises: 0001_resume_version_deltas
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.core.hashing import content_hash
+from app.core.json_patch import apply_patch
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_resume_version_hashes"
+down_revision: Union[str, None] = "0001_resume_version_deltas"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+resume_versions = sa.table(
+    "resume_versions",
+    sa.column("id", UUID(as_uuid=True)),
+    sa.column("resume_id", UUID(as_uuid=True)),
+    sa.column("version", sa.Integer),
+    sa.column("is_snapshot", sa.Boolean),
+    sa.column("content", JSONB),
+    sa.column("delta", JSONB),
+    sa.column("content_hash", sa.String),
+    sa.column("created_at", sa.DateTime),
+    sa.column("updated_at", sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    op.add_column("resume_versions", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.add_column("resume_versions", sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    conn = op.get_bind()
+    conn.execute(resume_versions.update().values(updated_at=resume_versions.c.created_at))
+
+    resume_ids = conn.execute(sa.select(resume_versions.c.resume_id).distinct()).scalars().all()
+    for resume_id in resume_ids:
+        rows = conn.execute(
+            sa.select(resume_versions)
+            .where(resume_versions.c.resume_id == resume_id)
+            .order_by(resume_versions.c.version)
+        ).all()
+        content = None
+        for row in rows:
+            content = row.content if row.is_snapshot else apply_patch(content, row.delta or [])
+            conn.execute(
+                resume_versions.update()
+                .where(resume_versions.c.id == row.id)
+                .values(content_hash=content_hash(content))
+            )
+
+
+def downgrade() -> None:
+    op.drop_column("resume_versions", "updated_at")
+    op.drop_column("resume_versions", "content_hash")
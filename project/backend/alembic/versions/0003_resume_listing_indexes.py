@@ -0,0 +1,35 @@
+"""composite indexes for paginated resume and version listings
+
+Revision ID: 0003_resume_listing_indexes
+Revises: 0002_resume_version_hashes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_resume_listing_indexes"
+down_revision: Union[str, None] = "0002_resume_version_hashes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_resumes_user_id_updated_at",
+        "resumes",
+        ["user_id", "updated_at", "id"],
+    )
+    op.create_index(
+        "ix_resume_versions_resume_id_version",
+        "resume_versions",
+        ["resume_id", "version"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_versions_resume_id_version", table_name="resume_versions")
+    op.drop_index("ix_resumes_user_id_updated_at", table_name="resumes")
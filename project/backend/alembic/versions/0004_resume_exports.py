@@ -0,0 +1,55 @@
+"""resume_exports job table for background PDF exports
+
+Revision ID: 0004_resume_exports
+Revises: 0003_resume_listing_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_resume_exports"
+down_revision: Union[str, None] = "0003_resume_listing_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_exports",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "resume_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("resumes.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("user_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("template_id", sa.String(), nullable=False),
+        sa.Column("language", sa.String(), nullable=False),
+        sa.Column("content", JSONB(), nullable=False),
+        sa.Column("file_key", sa.String(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_resume_exports_pending",
+        "resume_exports",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index("ix_resume_exports_resume_id", "resume_exports", ["resume_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_exports_resume_id", table_name="resume_exports")
+    op.drop_index("ix_resume_exports_pending", table_name="resume_exports")
+    op.drop_table("resume_exports")
@@ -0,0 +1,36 @@
+"""translation_memory table of previously translated strings
+
+Revision ID: 0005_translation_memory
+Revises: 0004_resume_exports
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_translation_memory"
+down_revision: Union[str, None] = "0004_resume_exports"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "translation_memory",
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("source_language", sa.String(), nullable=False),
+        sa.Column("target_language", sa.String(), nullable=False),
+        sa.Column("mode", sa.String(), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("translated_text", sa.Text(), nullable=False),
+        sa.Column("tokens", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("source_hash", "source_language", "target_language", "mode"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("translation_memory")
@@ -0,0 +1,63 @@
+"""usage period on subscriptions and the default free plan
+
+Revision ID: 0006_usage_quotas
+Revises: 0005_translation_memory
+Create Date: 2026-10-18 00:00:00
+
+"""
+import uuid
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_usage_quotas"
+down_revision: Union[str, None] = "0005_translation_memory"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+plans = sa.table(
+    "plans",
+    sa.column("id", UUID(as_uuid=True)),
+    sa.column("name", sa.String),
+    sa.column("display_name", sa.String),
+    sa.column("price_monthly", sa.Integer),
+    sa.column("max_resumes", sa.Integer),
+    sa.column("max_exports_per_month", sa.Integer),
+    sa.column("max_translations_per_month", sa.Integer),
+    sa.column("has_premium_templates", sa.Boolean),
+    sa.column("is_ad_free", sa.Boolean),
+    sa.column("created_at", sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    op.add_column("subscriptions", sa.Column("usage_period_start", sa.DateTime(), nullable=True))
+
+    # Every new user is put on the free plan, so it has to exist.
+    conn = op.get_bind()
+    has_free = conn.execute(
+        sa.select(plans.c.id).where(plans.c.name == sa.cast("FREE", sa.Enum(name="plantype")))
+    ).first()
+    if has_free is None:
+        conn.execute(
+            plans.insert().values(
+                id=uuid.uuid4(),
+                name=sa.cast("FREE", sa.Enum(name="plantype")),
+                display_name="Free",
+                price_monthly=0,
+                max_resumes=3,
+                max_exports_per_month=10,
+                max_translations_per_month=5,
+                has_premium_templates=False,
+                is_ad_free=False,
+                created_at=datetime.utcnow(),
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("subscriptions", "usage_period_start")
@@ -0,0 +1,111 @@
+"""full-text search vectors on resumes and resume versions
+
+Revision ID: 0007_resume_search
+Revises: 0006_usage_quotas
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+
+from app.core.json_patch import apply_patch
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_resume_search"
+down_revision: Union[str, None] = "0006_usage_quotas"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION resume_search_config(language resumelanguage) RETURNS regconfig
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE language
+        WHEN 'EN' THEN 'english'::regconfig
+        WHEN 'RU' THEN 'russian'::regconfig
+        WHEN 'FR' THEN 'french'::regconfig
+        ELSE 'english'::regconfig
+    END
+$$;
+
+CREATE OR REPLACE FUNCTION resume_search_vector(language resumelanguage, title text, content jsonb) RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT setweight(to_tsvector(resume_search_config(language), coalesce(title, '')), 'A')
+        || setweight(jsonb_to_tsvector(resume_search_config(language), coalesce(content, '{}'), '["string"]'), 'B')
+$$;
+
+CREATE OR REPLACE FUNCTION resume_search_text(content jsonb) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT string_agg(value #>> '{}', ' ')
+    FROM jsonb_path_query(content, 'strict $.** ? (@.type() == "string")') AS value
+$$;
+"""
+
+resume_versions = sa.table(
+    "resume_versions",
+    sa.column("id", UUID(as_uuid=True)),
+    sa.column("resume_id", UUID(as_uuid=True)),
+    sa.column("version", sa.Integer),
+    sa.column("is_snapshot", sa.Boolean),
+    sa.column("content", JSONB),
+    sa.column("delta", JSONB),
+    sa.column("search_vector", TSVECTOR),
+)
+
+
+def upgrade() -> None:
+    op.execute(SEARCH_FUNCTIONS)
+
+    # Rewrites the table once to fill the column for existing rows.
+    op.execute(
+        "ALTER TABLE resumes ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (resume_search_vector(language, title, content)) STORED"
+    )
+    op.create_index("ix_resumes_search_vector", "resumes", ["search_vector"], postgresql_using="gin")
+
+    op.add_column("resume_versions", sa.Column("search_vector", TSVECTOR(), nullable=True))
+    op.execute(
+        "UPDATE resume_versions v SET search_vector = resume_search_vector(r.language, NULL, v.content) "
+        "FROM resumes r WHERE r.id = v.resume_id AND v.is_snapshot"
+    )
+    # Delta rows only hold a patch: rebuild each one's content to index it.
+    conn = op.get_bind()
+    delta_resumes = conn.execute(
+        sa.select(resume_versions.c.resume_id).where(resume_versions.c.is_snapshot.is_(False)).distinct()
+    ).scalars().all()
+    for resume_id in delta_resumes:
+        rows = conn.execute(
+            sa.select(resume_versions)
+            .where(resume_versions.c.resume_id == resume_id)
+            .order_by(resume_versions.c.version)
+        ).all()
+        content = None
+        for row in rows:
+            if row.is_snapshot:
+                content = row.content
+                continue
+            if content is None:
+                continue
+            content = apply_patch(content, row.delta or [])
+            conn.execute(
+                sa.text(
+                    "UPDATE resume_versions v SET search_vector = resume_search_vector(r.language, NULL, :content) "
+                    "FROM resumes r WHERE r.id = v.resume_id AND v.id = :id"
+                ).bindparams(sa.bindparam("content", type_=JSONB)),
+                {"content": content, "id": row.id},
+            )
+    op.create_index(
+        "ix_resume_versions_search_vector", "resume_versions", ["search_vector"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_versions_search_vector", table_name="resume_versions")
+    op.drop_column("resume_versions", "search_vector")
+    op.drop_index("ix_resumes_search_vector", table_name="resumes")
+    op.drop_column("resumes", "search_vector")
+    op.execute("DROP FUNCTION resume_search_text(jsonb)")
+    op.execute("DROP FUNCTION resume_search_vector(resumelanguage, text, jsonb)")
+    op.execute("DROP FUNCTION resume_search_config(resumelanguage)")
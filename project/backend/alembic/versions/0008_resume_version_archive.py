@@ -0,0 +1,29 @@
+"""archived resume versions
+
+Revision ID: 0008_resume_version_archive
+Revises: 0007_resume_search
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_resume_version_archive"
+down_revision: Union[str, None] = "0007_resume_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("resume_versions", sa.Column("archive_key", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    # Stub rows are only readable through archive_key.
+    archived = op.get_bind().scalar(sa.text("SELECT count(*) FROM resume_versions WHERE archive_key IS NOT NULL"))
+    if archived:
+        raise RuntimeError(f"{archived} resume versions are archived; restore them into the table first")
+    op.drop_column("resume_versions", "archive_key")
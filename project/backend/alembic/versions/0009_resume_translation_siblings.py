@@ -0,0 +1,43 @@
+"""link translated resumes to the resume they were translated from
+
+Revision ID: 0009_resume_translation_siblings
+Revises: 0008_resume_version_archive
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_resume_translation_siblings"
+down_revision: Union[str, None] = "0008_resume_version_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Translations made before this stay unlinked, standalone resumes.
+    op.add_column(
+        "resumes",
+        sa.Column(
+            "source_resume_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("resumes.id", name="resumes_source_resume_id_fkey", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_resumes_source_resume_id_language",
+        "resumes",
+        ["source_resume_id", "language"],
+        unique=True,
+        postgresql_where=sa.text("source_resume_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_source_resume_id_language", table_name="resumes")
+    op.drop_column("resumes", "source_resume_id")
@@ -1,23 +1,27 @@
+from datetime import datetime
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, read_session
 from app.models.user import User
+from app.schemas.user import UserPrincipal
+from app.services.quota import QuotaExceeded, next_period_start, quota_service
+from app.services.user_cache import user_cache
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-
+def get_token_subject(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> str:
+    """The user id in the bearer token, without touching the database."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(credentials.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(
@@ -29,13 +33,29 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+    return user_id
+
+
+async def get_read_db(user_id: str = Depends(get_token_subject)):
+    """
+    Session for read-only endpoints: on a read replica when configured,
+    unless the user wrote in the last DB_READ_YOUR_WRITES_SECONDS.
+    """
+    async with read_session(user_id) as db:
+        yield db
+
 
-    user = db.query(User).filter(User.id == user_id).first()
+async def _load_user(user_id: str, db: AsyncSession) -> UserPrincipal:
+    user = await user_cache.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        db_user = await db.scalar(select(User).where(User.id == user_id))
+        if db_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        user = UserPrincipal.model_validate(db_user)
+        await user_cache.set(user)
 
     if not user.is_active:
         raise HTTPException(
@@ -44,3 +64,55 @@ async def get_current_user(
         )
 
     return user
+
+
+async def get_current_user(
+    user_id: str = Depends(get_token_subject),
+    db: AsyncSession = Depends(get_db)
+) -> UserPrincipal:
+    user = await _load_user(user_id, db)
+    # Lets the session note this user as a recent writer when it commits.
+    db.info["user_id"] = user.id
+    return user
+
+
+async def get_current_reader(
+    user_id: str = Depends(get_token_subject),
+    db: AsyncSession = Depends(get_read_db)
+) -> UserPrincipal:
+    """get_current_user for read-only endpoints; looks the user up on the read session."""
+    return await _load_user(user_id, db)
+
+
+def quota_exceeded_error(e: QuotaExceeded) -> HTTPException:
+    """429 with Retry-After set to when the monthly counters reset."""
+    retry_after = int((next_period_start() - datetime.utcnow()).total_seconds()) + 1
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(e),
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+def require_quota(kind: str):
+    """
+    Dependency that counts one use of a monthly quota ("exports",
+    "translations") before the endpoint runs, answering 429 when it is used
+    up. The use is given back if the endpoint then fails.
+    """
+    async def dependency(
+        current_user: UserPrincipal = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db)
+    ):
+        try:
+            await quota_service.consume(db, current_user.id, kind)
+        except QuotaExceeded as e:
+            raise quota_exceeded_error(e)
+        try:
+            yield current_user
+        except Exception:
+            await db.rollback()
+            await quota_service.release(db, current_user.id, kind)
+            raise
+
+    return dependency
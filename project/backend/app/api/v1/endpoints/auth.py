@@ -1,42 +1,68 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.database import get_db, recent_writers
+from app.core.security import password_hasher, PasswordHasherBusy, create_access_token
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 from app.models.user import User
+from app.services.quota import quota_service
 
 router = APIRouter()
 
 
+def hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry",
+        headers={"Retry-After": "1"}
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
+    # End the read transaction so the pooled connection is not held while
+    # the password is hashed.
+    await db.commit()
+
+    try:
+        hashed_password = await password_hasher.hash(user_data.password)
+    except PasswordHasherBusy:
+        raise hasher_busy()
 
     user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         full_name=user_data.full_name
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    # The new account may not have reached the replicas yet.
+    recent_writers.mark(user.id)
 
-    # TODO: Create default subscription for user
+    await quota_service.ensure_subscription(db, user.id)
 
     return user
 
 
 @router.post("/login", response_model=Token)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_data.email).first()
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.email == user_data.email))
+    await db.commit()
+
+    try:
+        valid = bool(user) and await password_hasher.verify(user_data.password, user.hashed_password)
+    except PasswordHasherBusy:
+        raise hasher_busy()
 
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
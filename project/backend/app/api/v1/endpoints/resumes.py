@@ -1,22 +1,210 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from typing import Any, Dict, Literal, Optional, Tuple, Union
 from uuid import UUID
+from datetime import datetime
+import base64
+import hashlib
+import json
+import logging
+import uuid
 
-from app.core.database import get_db
-from app.api.deps import get_current_user
-from app.schemas.resume import ResumeCreate, ResumeUpdate, ResumeResponse, ResumeVersionResponse
-from app.models.user import User
-from app.models.resume import Resume, ResumeVersion
+from app.core.database import SessionLocal, get_db, read_session, recent_writers
+from app.core.json_patch import JsonPatchError, apply_patch
+from app.api.deps import get_current_reader, get_current_user, get_read_db, quota_exceeded_error, require_quota
+from app.schemas.resume import (
+    ResumeContent,
+    ResumeCreate,
+    ResumeUpdate,
+    ResumePatch,
+    ResumeResponse,
+    ResumeSummary,
+    ResumePage,
+    ResumeSummaryPage,
+    ResumeSearchResults,
+    ResumeImportResult,
+    ResumeTranslateRequest,
+    ResumeTranslateManyRequest,
+    ResumeTranslationResponse,
+    ResumeLanguageTranslation,
+    ResumeTranslationsResponse,
+    TranslationStats,
+    ResumeVersionResponse,
+    ResumeVersionSummary,
+    ResumeVersionPage,
+)
+from app.schemas.export import ExportJobResponse
+from app.schemas.user import UserPrincipal
+from app.core.config import settings
+from app.models.export import ExportStatus, ResumeExport
+from app.models.resume import Resume, ResumeLanguage, ResumeVersion
+from app.services.versioning import resume_version_service
+from app.services.ai_translation import TranslationError, TranslationUnavailable, ai_translation_service
+from app.services.export import export_service
+from app.services.export_jobs import export_jobs
+from app.services.quota import QuotaExceeded, quota_service
+from app.services.resume_transfer import resume_transfer_service
+from app.services.search import resume_search_service
+from app.services.templates import template_service
+from app.services.version_archive import version_archive
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _encode_cursor(updated_at: datetime, resume_id: UUID) -> str:
+    raw = f"{updated_at.isoformat()}|{resume_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        updated_at, resume_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), UUID(resume_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _resume_etag(resume: Resume) -> str:
+    # current_version alone isn't enough: coalesced saves rewrite the latest
+    # version in place and title/template edits don't add one, but every
+    # write bumps updated_at.
+    raw = f"{resume.id}:{resume.current_version}:{resume.updated_at.isoformat()}"
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def _etag_matches(header: Optional[str], etag: str, weak: bool = False) -> bool:
+    """Evaluate an If-Match / If-None-Match header against `etag`."""
+    if header is None:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if weak and candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def _set_resume_headers(response: Response, resume: Resume) -> None:
+    response.headers["ETag"] = _resume_etag(resume)
+    # Cacheable by the browser only, and always revalidated with the ETag.
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def _resume_payload(resume: Resume) -> Dict[str, Any]:
+    """
+    A resume as ResumeResponse would serialize it, without validating the
+    content model by model. Every write stores ResumeContent.model_dump(),
+    so the JSONB already has the response's shape.
+    """
+    payload = ResumeSummary.model_validate(resume).model_dump(mode="json")
+    if settings.RESUME_TRUST_STORED_CONTENT:
+        payload["content"] = resume.content
+    else:
+        payload["content"] = ResumeContent.model_validate(resume.content).model_dump(mode="json")
+    return payload
+
+
+def _resume_response(resume: Resume, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    response = ORJSONResponse(_resume_payload(resume), status_code=status_code)
+    _set_resume_headers(response, resume)
+    return response
+
+
+async def _export_job_response(job: ResumeExport) -> ExportJobResponse:
+    response = ExportJobResponse.model_validate(job)
+    if job.status == ExportStatus.COMPLETED.value and job.file_key:
+        # Signed on every read so the link never goes stale in the client.
+        response.url = await export_service.generate_signed_url(job.file_key)
+    return response
+
+
+async def _original(db: AsyncSession, resume: Resume) -> Resume:
+    """The resume `resume` was translated from, or itself if it is an original."""
+    if resume.source_resume_id is None:
+        return resume
+    original = await db.scalar(select(Resume).where(Resume.id == resume.source_resume_id))
+    return original or resume
+
+
+async def _save_translations(
+    db: AsyncSession,
+    original: Resume,
+    translations: Dict[str, ResumeContent],
+) -> Dict[str, Tuple[Resume, bool]]:
+    """
+    Save translations of `original` into its sibling in each language, all
+    in one transaction: missing siblings are inserted with their first
+    version, existing ones get a new version. Returns (resume, created) by
+    language.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": original.user_id,
+            "title": f"{original.title} ({language.upper()})",
+            "language": ResumeLanguage(language),
+            "template_id": original.template_id,
+            "content": content.model_dump(),
+            "current_version": 1,
+            "source_resume_id": original.id,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for language, content in translations.items()
+    ]
+    # A sibling that already exists, or is being created concurrently, is
+    # left alone here and updated below.
+    created_ids = set((await db.scalars(
+        insert(Resume)
+        .values(rows)
+        .on_conflict_do_nothing(
+            index_elements=["source_resume_id", "language"],
+            index_where=Resume.source_resume_id.is_not(None),
+        )
+        .returning(Resume.id)
+    )).all())
+    await resume_version_service.add_first_versions(
+        db, [row for row in rows if row["id"] in created_ids], source="ai_translation"
+    )
+
+    existing = [row["language"] for row in rows if row["id"] not in created_ids]
+    if existing:
+        siblings = (await db.scalars(
+            select(Resume)
+            .where(Resume.source_resume_id == original.id, Resume.language.in_(existing))
+            .with_for_update()
+        )).all()
+        for sibling in siblings:
+            await resume_version_service.save_content(
+                db, sibling, translations[sibling.language.value].model_dump(), source="ai_translation"
+            )
+    await db.commit()
+    # The streaming path saves on a session that isn't tied to the request.
+    recent_writers.mark(original.user_id)
+
+    siblings = (await db.scalars(
+        select(Resume)
+        .where(Resume.source_resume_id == original.id, Resume.language.in_([row["language"] for row in rows]))
+        .execution_options(populate_existing=True)
+    )).all()
+    return {sibling.language.value: (sibling, sibling.id in created_ids) for sibling in siblings}
+
+
 @router.post("/", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 async def create_resume(
     resume_data: ResumeCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     resume = Resume(
         user_id=current_user.id,
@@ -26,118 +214,629 @@ async def create_resume(
         content=resume_data.content.model_dump()
     )
     db.add(resume)
-    db.commit()
-    db.refresh(resume)
+    await db.commit()
+    await db.refresh(resume)
 
     # Create initial version
-    version = ResumeVersion(
+    version = resume_version_service.build_version(
         resume_id=resume.id,
         version=1,
         content=resume_data.content.model_dump(),
         source="manual"
     )
     db.add(version)
-    db.commit()
+    await db.commit()
 
-    return resume
+    return _resume_response(resume, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/", response_model=List[ResumeResponse])
+@router.get("/", response_model=Union[ResumeSummaryPage, ResumePage])
 async def list_resumes(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    include: Optional[Literal["content"]] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_reader)
 ):
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
-    return resumes
+    query = (
+        select(Resume)
+        .where(Resume.user_id == current_user.id)
+        .order_by(Resume.updated_at.desc(), Resume.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        query = query.where(tuple_(Resume.updated_at, Resume.id) < tuple_(*_decode_cursor(cursor)))
+    if include != "content":
+        query = query.options(defer(Resume.content))
+
+    resumes = (await db.scalars(query)).all()
+    next_cursor = None
+    if len(resumes) > limit:
+        resumes = resumes[:limit]
+        next_cursor = _encode_cursor(resumes[-1].updated_at, resumes[-1].id)
+
+    if include == "content":
+        return ORJSONResponse({
+            "items": [_resume_payload(resume) for resume in resumes],
+            "next_cursor": next_cursor,
+        })
+    return ResumeSummaryPage(
+        items=[ResumeSummary.model_validate(resume) for resume in resumes],
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/search", response_model=ResumeSearchResults)
+async def search_resumes(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    include: Optional[Literal["versions"]] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_reader)
+):
+    """
+    Ranked full-text search over the user's resumes, in each resume's own
+    language. `q` takes web search syntax: words, "phrases", or, -word.
+    include=versions also searches earlier versions.
+    """
+    items = await resume_search_service.search(db, current_user.id, q, limit, offset)
+    versions = None
+    if include == "versions":
+        versions = await resume_search_service.search_versions(db, current_user.id, q)
+    return ResumeSearchResults(items=items, versions=versions)
+
+
+@router.post("/import", response_model=ResumeImportResult)
+async def import_resumes(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Create resumes in bulk from an NDJSON body, one ResumeCreate object per
+    line (an export line works too). The body is validated as it streams in
+    and saved RESUME_IMPORT_BATCH_SIZE resumes per transaction; invalid
+    lines are skipped and reported by line number.
+    """
+    return await resume_transfer_service.import_ndjson(db, current_user.id, request.stream())
+
+
+@router.get("/export")
+async def export_resumes(
+    include_versions: bool = True,
+    current_user: UserPrincipal = Depends(get_current_reader)
+):
+    """
+    All of the user's resumes as NDJSON, one ResumeResponse per line with
+    its version history under "versions". Streamed from a server-side
+    cursor, however many resumes there are.
+    """
+    async def lines():
+        # The request's session is closed once streaming starts.
+        async with read_session(str(current_user.id)) as session:
+            async for line in resume_transfer_service.export_ndjson(session, current_user.id, include_versions):
+                yield line
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="resumes.ndjson"'},
+    )
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_reader)
 ):
-    resume = db.query(Resume).filter(
+    query = select(Resume).where(
         Resume.id == resume_id,
         Resume.user_id == current_user.id
-    ).first()
+    )
+    if if_none_match:
+        # Revalidation: check the ETag before paying for the document.
+        query = query.options(defer(Resume.content))
+    resume = await db.scalar(query)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    return resume
+    if if_none_match:
+        etag = _resume_etag(resume)
+        if _etag_matches(if_none_match, etag, weak=True):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "private, no-cache"}
+            )
+        await db.refresh(resume, ["content"])
+
+    return _resume_response(resume)
 
 
 @router.put("/{resume_id}", response_model=ResumeResponse)
 async def update_resume(
     resume_id: UUID,
     resume_data: ResumeUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    # Hold the row until commit: nobody may write between the If-Match check
+    # and the save, and concurrent saves must not pick the same next version.
+    resume = await db.scalar(
+        select(Resume)
+        .where(Resume.id == resume_id, Resume.user_id == current_user.id)
+        .with_for_update()
+    )
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
+    if if_match and not _etag_matches(if_match, _resume_etag(resume)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resume was modified since it was loaded",
+            headers={"ETag": _resume_etag(resume)}
+        )
+
     update_data = resume_data.model_dump(exclude_unset=True)
 
-    if "content" in update_data:
-        # Create new version
-        new_version = resume.current_version + 1
-        version = ResumeVersion(
-            resume_id=resume.id,
-            version=new_version,
-            content=update_data["content"],
-            source="manual"
+    if update_data.pop("content", None) is not None:
+        # exclude_unset also strips defaults inside the nested content; store
+        # the full document so content hashes stay comparable.
+        await resume_version_service.save_content(
+            db, resume, resume_data.content.model_dump(), source="manual"
         )
-        db.add(version)
-        resume.current_version = new_version
 
     for field, value in update_data.items():
-        if field == "content":
-            setattr(resume, field, value)
-        else:
-            setattr(resume, field, value)
+        setattr(resume, field, value)
+
+    await db.commit()
+    await db.refresh(resume)
+    return _resume_response(resume)
+
 
-    db.commit()
-    db.refresh(resume)
+@router.patch("/{resume_id}", response_model=ResumeSummary)
+async def patch_resume(
+    resume_id: UUID,
+    patch: ResumePatch,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Apply an RFC 6902 JSON Patch to the resume content; used by autosave so
+    each save sends only what changed.
+
+    Responds 409 when `base_version` is no longer the current version.
+    Coalesced saves rewrite the current version in place, so clients should
+    also send If-Match to catch edits made on top of the same version. The
+    response omits the content: the client already has it.
+    """
+    resume = await db.scalar(
+        select(Resume)
+        .where(Resume.id == resume_id, Resume.user_id == current_user.id)
+        .with_for_update()
+    )
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    if if_match and not _etag_matches(if_match, _resume_etag(resume)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resume was modified since it was loaded",
+            headers={"ETag": _resume_etag(resume)}
+        )
+
+    if patch.base_version != resume.current_version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Patch is based on version {patch.base_version}, "
+                   f"but the resume is at version {resume.current_version}",
+            headers={"ETag": _resume_etag(resume)}
+        )
+
+    operations = [op.model_dump(by_alias=True, exclude_unset=True) for op in patch.operations]
+    try:
+        content = ResumeContent.model_validate(apply_patch(resume.content, operations))
+    except JsonPatchError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid patch: {e}")
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    await resume_version_service.save_content(db, resume, content.model_dump(), source="manual")
+    await db.commit()
+    await db.refresh(resume, ["current_version", "updated_at"])
+    _set_resume_headers(response, resume)
     return resume
 
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_resume(
     resume_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
-    resume = db.query(Resume).filter(
+    resume = await db.scalar(select(Resume).where(
         Resume.id == resume_id,
         Resume.user_id == current_user.id
-    ).first()
+    ))
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    db.delete(resume)
-    db.commit()
+    # Versions go with the resume (ON DELETE CASCADE); archived ones also
+    # have objects in storage.
+    archive_keys = (await db.scalars(
+        select(ResumeVersion.archive_key)
+        .where(ResumeVersion.resume_id == resume_id, ResumeVersion.archive_key.is_not(None))
+        .distinct()
+    )).all()
+    await db.delete(resume)
+    await db.commit()
+    await version_archive.delete(list(archive_keys))
 
 
-@router.get("/{resume_id}/versions", response_model=List[ResumeVersionResponse])
+@router.get("/{resume_id}/versions", response_model=ResumeVersionPage)
 async def list_resume_versions(
     resume_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_reader)
 ):
-    resume = db.query(Resume).filter(
+    resume = await db.scalar(select(Resume.id).where(
         Resume.id == resume_id,
         Resume.user_id == current_user.id
-    ).first()
+    ))
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    return resume.versions
+    query = (
+        select(
+            ResumeVersion.id,
+            ResumeVersion.resume_id,
+            ResumeVersion.version,
+            ResumeVersion.source,
+            ResumeVersion.content_hash,
+            ResumeVersion.created_at,
+        )
+        .where(ResumeVersion.resume_id == resume_id)
+        .order_by(ResumeVersion.version.desc())
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        query = query.where(ResumeVersion.version < cursor)
+
+    rows = (await db.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = str(rows[-1].version)
+
+    return ResumeVersionPage(
+        items=[ResumeVersionSummary.model_validate(row) for row in rows],
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/{resume_id}/versions/{version}", response_model=ResumeVersionResponse)
+async def get_resume_version(
+    resume_id: UUID,
+    version: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_reader)
+):
+    resume = await db.scalar(select(Resume.id).where(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    row = await db.scalar(select(ResumeVersion).where(
+        ResumeVersion.resume_id == resume_id,
+        ResumeVersion.version == version
+    ))
+    content = await resume_version_service.get_content(db, resume_id, version) if row else None
+
+    if content is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+
+    return ResumeVersionResponse(
+        id=row.id,
+        resume_id=row.resume_id,
+        version=row.version,
+        source=row.source,
+        content_hash=row.content_hash,
+        created_at=row.created_at,
+        content=content
+    )
+
+
+@router.get("/{resume_id}/preview", response_class=HTMLResponse)
+async def preview_resume(
+    resume_id: UUID,
+    template_id: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_reader)
+):
+    """
+    The resume rendered to HTML by the same templates as PDF export, with
+    the stylesheet inlined. `template_id` previews a template other than
+    the resume's own.
+    """
+    query = select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    )
+    if if_none_match:
+        query = query.options(defer(Resume.content))
+    resume = await db.scalar(query)
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    template_id = template_id or resume.template_id
+    if template_id not in template_service.template_ids():
+        raise HTTPException(status_code=400, detail=f"Unknown template: {template_id}")
+
+    raw = f"{_resume_etag(resume)}:{template_id}:{template_service.template_version(template_id)}"
+    etag = '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match:
+        if _etag_matches(if_none_match, etag, weak=True):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        await db.refresh(resume, ["content"])
+
+    html = template_service.render(
+        ResumeContent.model_validate(resume.content),
+        template_id,
+        resume.language.value if resume.language else "en",
+        inline_css=True,
+        # The ETag already pins the content, template and its version.
+        digest=etag,
+    )
+    return HTMLResponse(html, headers=headers)
+
+
+@router.post(
+    "/{resume_id}/export",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def export_resume(
+    resume_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(require_quota("exports"))
+):
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    if resume.template_id not in template_service.template_ids():
+        raise HTTPException(status_code=400, detail=f"Unknown template: {resume.template_id}")
+
+    job, created = await export_jobs.enqueue(db, resume)
+    if not created:
+        # Same export already queued; only the first request counts.
+        await quota_service.release(db, current_user.id, "exports")
+    return await _export_job_response(job)
+
+
+@router.get("/{resume_id}/exports/{export_id}", response_model=ExportJobResponse)
+async def get_export(
+    resume_id: UUID,
+    export_id: UUID,
+    wait: float = Query(0, ge=0, le=settings.EXPORT_STATUS_MAX_WAIT_SECONDS),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Export job status. With `wait`, long-polls for up to that many seconds
+    until the job completes or fails.
+    """
+    job = await export_jobs.wait(db, export_id, current_user.id, timeout=wait)
+
+    if not job or job.resume_id != resume_id:
+        raise HTTPException(status_code=404, detail="Export not found")
+
+    return await _export_job_response(job)
+
+
+@router.post(
+    "/{resume_id}/translate",
+    response_model=ResumeTranslationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def translate_resume(
+    resume_id: UUID,
+    request: ResumeTranslateRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(require_quota("translations"))
+):
+    """
+    Translate a resume into its sibling in the target language: a new
+    resume the first time, a new version of that resume after that.
+    Translating a translation goes to the original's siblings.
+
+    With `stream`, responds with NDJSON: a {"section", "content"} line per
+    translated section as it completes, then {"resume", "translation"} with
+    the saved translation, or {"error": ...} if translation failed.
+    `translation` reports translation-memory hits and tokens saved.
+    """
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    if resume.language == request.target_language:
+        raise HTTPException(status_code=400, detail="Resume is already in that language")
+
+    original = await _original(db, resume)
+    if original.language == request.target_language:
+        raise HTTPException(status_code=400, detail="The original resume is in that language")
+
+    # Translation takes a while; don't hold a pooled connection for it.
+    await db.commit()
+
+    content = ResumeContent.model_validate(resume.content)
+    target_language = request.target_language.value
+    source_language = resume.language.value if resume.language else "en"
+    stats = TranslationStats()
+
+    if request.stream:
+        async def stream_sections():
+            document = content.model_dump()
+            result = None
+            try:
+                async for section, translated in ai_translation_service.translate_sections(
+                    content, target_language, request.mode, source_language, stats
+                ):
+                    document = ai_translation_service.apply_section(document, section, translated)
+                    yield json.dumps({"section": section, "content": translated}, ensure_ascii=False) + "\n"
+                result = ResumeContent.model_validate(document)
+                # The request's session is closed once streaming starts.
+                async with SessionLocal() as session:
+                    saved = await _save_translations(session, original, {target_language: result})
+            except Exception as e:
+                # Headers are already sent: end the stream with an error
+                # line instead of cutting it off, and give the quota back.
+                if isinstance(e, TranslationError):
+                    error = f"Translation failed: {e}"
+                elif isinstance(e, ValidationError):
+                    error = "Translation failed: the translated resume is not valid"
+                elif result is None:
+                    logger.exception("Translating resume %s failed", resume_id)
+                    error = "Translation failed"
+                else:
+                    logger.exception("Could not save the translation of resume %s", resume_id)
+                    error = "Could not save the translation"
+                async with SessionLocal() as session:
+                    await quota_service.release(session, current_user.id, "translations")
+                yield json.dumps({"error": error}) + "\n"
+                return
+            translated_resume = saved[target_language][0]
+            yield json.dumps({
+                "resume": ResumeResponse.model_validate(translated_resume).model_dump(mode="json"),
+                "translation": stats.model_dump(),
+            }) + "\n"
+
+        return StreamingResponse(stream_sections(), media_type="application/x-ndjson")
+
+    try:
+        result = await ai_translation_service.translate_resume(
+            content, target_language, request.mode, source_language, stats
+        )
+    except TranslationUnavailable:
+        raise HTTPException(status_code=502, detail="Translation service unavailable")
+    except TranslationError as e:
+        raise HTTPException(status_code=502, detail=f"Translation failed: {e}")
+
+    translated_resume = (await _save_translations(db, original, {target_language: result}))[target_language][0]
+    return ResumeTranslationResponse(
+        **ResumeResponse.model_validate(translated_resume).model_dump(),
+        translation=stats
+    )
+
+
+@router.post("/{resume_id}/translations", response_model=ResumeTranslationsResponse)
+async def translate_resume_many(
+    resume_id: UUID,
+    request: ResumeTranslateManyRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Translate a resume into several languages concurrently, saving each
+    into its sibling like /translate does, all in one transaction.
+
+    Languages fail independently: each result has a `status` of "created",
+    "updated" or "failed" (with `error`). Every language counts against the
+    monthly translations quota; failed ones are given back.
+    """
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    original = await _original(db, resume)
+    languages = list(dict.fromkeys(language.value for language in request.target_languages))
+    errors: Dict[str, str] = {}
+    for language in languages:
+        if resume.language and language == resume.language.value:
+            errors[language] = "Resume is already in that language"
+        elif original.language and language == original.language.value:
+            errors[language] = "The original resume is in that language"
+    targets = [language for language in languages if language not in errors]
+
+    if targets:
+        try:
+            await quota_service.consume(db, current_user.id, "translations", count=len(targets))
+        except QuotaExceeded as e:
+            raise quota_exceeded_error(e)
+    # Translation takes a while; don't hold a pooled connection for it.
+    await db.commit()
+
+    translated = await ai_translation_service.translate_many(
+        ResumeContent.model_validate(resume.content),
+        targets,
+        request.mode,
+        resume.language.value if resume.language else "en",
+    ) if targets else {}
+    for language, result in translated.items():
+        if isinstance(result, TranslationUnavailable):
+            errors[language] = "Translation service unavailable"
+        elif isinstance(result, TranslationError):
+            errors[language] = f"Translation failed: {result}"
+    succeeded = {
+        language: result for language, result in translated.items()
+        if not isinstance(result, TranslationError)
+    }
+
+    failed = len(targets) - len(succeeded)
+    if failed:
+        await quota_service.release(db, current_user.id, "translations", count=failed)
+
+    saved: Dict[str, Tuple[Resume, bool]] = {}
+    if succeeded:
+        try:
+            saved = await _save_translations(
+                db, original, {language: content for language, (content, _) in succeeded.items()}
+            )
+        except Exception:
+            await db.rollback()
+            await quota_service.release(db, current_user.id, "translations", count=len(succeeded))
+            raise
+
+    results = []
+    for language in languages:
+        if language in errors:
+            results.append(ResumeLanguageTranslation(language=language, status="failed", error=errors[language]))
+            continue
+        sibling, created = saved[language]
+        results.append(ResumeLanguageTranslation(
+            language=language,
+            status="created" if created else "updated",
+            resume=ResumeResponse.model_validate(sibling),
+            translation=succeeded[language][1],
+        ))
+    return ResumeTranslationsResponse(results=results)
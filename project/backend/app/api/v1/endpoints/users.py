@@ -2,13 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.api.deps import get_current_user
-from app.schemas.user import UserResponse
-from app.models.user import User
+from app.api.deps import get_current_reader
+from app.schemas.user import UserResponse, UserPrincipal
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: UserPrincipal = Depends(get_current_reader)):
     return current_user
@@ -1,18 +1,110 @@
-from sqlalchemy import create_engine
+import random
+from typing import Optional
+
+from sqlalchemy import Select, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+engine = _create_engine(settings.ASYNC_DATABASE_URL)
+replica_engines = [_create_engine(url) for url in settings.ASYNC_DATABASE_REPLICA_URLS]
+
+
+class RecentWriters:
+    """
+    Users who committed a write in the last `window` seconds. Their reads
+    stay on the primary so they see their own changes despite replica lag.
+    Kept per process: with several workers, a user's next read only sees
+    the mark if it lands on the same worker.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._users = LRUCache(max_size=100_000, ttl=window)
+
+    def mark(self, user_id) -> None:
+        if self.window > 0:
+            self._users.set(str(user_id), True)
+
+    def __contains__(self, user_id) -> bool:
+        return self._users.get(str(user_id)) is not None
+
+
+recent_writers = RecentWriters(settings.DB_READ_YOUR_WRITES_SECONDS)
+
+
+class RoutingSession(Session):
+    """
+    Sessions opened with info={"read_only": True} read from a replica, the
+    same one for the whole session; everything else, and anything flushed,
+    goes to the primary. A primary session acting for a user (its id in
+    info["user_id"]) marks the user in recent_writers when it commits a
+    write.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("read_only") and replica_engines and not self._flushing:
+            if "replica" not in self.info:
+                self.info["replica"] = random.choice(replica_engines).sync_engine
+            return self.info["replica"]
+        if not isinstance(clause, Select):
+            # A flush, an INSERT/UPDATE/DELETE, or raw SQL.
+            self.info["wrote"] = True
+        return engine.sync_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_writer(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if session.info.pop("wrote", False) and user_id is not None:
+        recent_writers.mark(user_id)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_write(session: Session) -> None:
+    session.info.pop("wrote", None)
+
+
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def read_session(user_id: Optional[str] = None) -> AsyncSession:
+    """
+    A session for read-only work: on a replica, unless none are configured
+    or `user_id` wrote recently.
+    """
+    read_only = bool(replica_engines) and (user_id is None or user_id not in recent_writers)
+    return SessionLocal(info={"read_only": read_only})
+
+
+async def dispose_engines() -> None:
+    for each in (engine, *replica_engines):
+        await each.dispose()
@@ -0,0 +1,169 @@
+"""
+Minimal RFC 6902 JSON Patch support for resume documents.
+
+Resume content is plain JSON (dicts, lists, scalars), so we only need
+`make_patch` to diff two documents and `apply_patch` to replay a patch.
+"""
+import copy
+from typing import Any, Dict, List
+
+Operation = Dict[str, Any]
+
+
+class JsonPatchError(ValueError):
+    pass
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _split_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def make_patch(src: Any, dst: Any, path: str = "") -> List[Operation]:
+    """Return the operations that turn `src` into `dst`."""
+    if src == dst:
+        return []
+
+    if isinstance(src, dict) and isinstance(dst, dict):
+        ops: List[Operation] = []
+        for key in src:
+            if key not in dst:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in dst.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in src:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(src[key], value, child))
+        return ops
+
+    if isinstance(src, list) and isinstance(dst, list):
+        ops = []
+        common = min(len(src), len(dst))
+        for index in range(common):
+            ops.extend(make_patch(src[index], dst[index], f"{path}/{index}"))
+        for index in range(common, len(dst)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": dst[index]})
+        for index in range(len(src) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        return ops
+
+    return [{"op": "replace", "path": path, "value": dst}]
+
+
+def _resolve_parent(doc: Any, tokens: List[str]) -> Any:
+    target = doc
+    for token in tokens[:-1]:
+        target = _get_child(target, token)
+    return target
+
+
+def _list_index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    limit = len(container) + 1 if allow_end else len(container)
+    if index >= limit:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _get_child(container: Any, token: str) -> Any:
+    if isinstance(container, dict):
+        if token not in container:
+            raise JsonPatchError(f"Path segment not found: {token!r}")
+        return container[token]
+    if isinstance(container, list):
+        return container[_list_index(container, token)]
+    raise JsonPatchError(f"Cannot traverse into {type(container).__name__}")
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    target = doc
+    for token in _split_pointer(pointer):
+        target = _get_child(target, token)
+    return target
+
+
+def _add(doc: Any, pointer: str, value: Any) -> Any:
+    tokens = _split_pointer(pointer)
+    if not tokens:
+        return value
+    parent = _resolve_parent(doc, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to {type(parent).__name__}")
+    return doc
+
+
+def _remove(doc: Any, pointer: str) -> Any:
+    tokens = _split_pointer(pointer)
+    if not tokens:
+        raise JsonPatchError("Cannot remove the document root")
+    parent = _resolve_parent(doc, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"Path segment not found: {token!r}")
+        del parent[token]
+    elif isinstance(parent, list):
+        del parent[_list_index(parent, token)]
+    else:
+        raise JsonPatchError(f"Cannot remove from {type(parent).__name__}")
+    return doc
+
+
+def apply_patch(doc: Any, ops: List[Operation]) -> Any:
+    """Apply `ops` to a copy of `doc` and return the result."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        try:
+            doc = _apply_operation(doc, op)
+        except (KeyError, TypeError):
+            raise JsonPatchError(f"Malformed operation: {op!r}")
+    return doc
+
+
+def _apply_operation(doc: Any, op: Operation) -> Any:
+    name = op["op"]
+    path = op["path"]
+    if name == "add":
+        doc = _add(doc, path, copy.deepcopy(op["value"]))
+    elif name == "remove":
+        doc = _remove(doc, path)
+    elif name == "replace":
+        _get(doc, path)
+        if path == "":
+            doc = copy.deepcopy(op["value"])
+        else:
+            doc = _add(_remove(doc, path), path, copy.deepcopy(op["value"]))
+    elif name == "move":
+        value = _get(doc, op["from"])
+        if path.startswith(op["from"] + "/"):
+            raise JsonPatchError("Cannot move a value into one of its children")
+        doc = _add(_remove(doc, op["from"]), path, value)
+    elif name == "copy":
+        doc = _add(doc, path, copy.deepcopy(_get(doc, op["from"])))
+    elif name == "test":
+        if _get(doc, path) != op["value"]:
+            raise JsonPatchError(f"Test failed at {path!r}")
+    else:
+        raise JsonPatchError(f"Unknown operation: {name!r}")
+    return doc
@@ -0,0 +1,305 @@
+"""
+Request timing and SQL instrumentation, exposed in the Prometheus text
+format on /metrics.
+
+MetricsMiddleware starts a RequestStats for every HTTP request and keeps it
+in a context variable. SQLAlchemy cursor events and `track()` blocks around
+external calls (Anthropic, S3, bcrypt) add to whatever request is current;
+work outside a request (export workers) still lands in the global metrics.
+Metrics live in process memory, so each worker process is scraped on its
+own.
+"""
+import bisect
+import logging
+import time
+from collections import Counter as Tally, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = defaultdict(float)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        self._values[self._key(labels)] += amount
+
+    def samples(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_labels(self.label_names, key)} {value:g}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        # Per label set: counts per bucket (last one is +Inf), and the sum.
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = defaultdict(float)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def samples(self) -> Iterator[str]:
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound:g}"'
+                yield f"{self.name}_bucket{_labels(self.label_names, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.label_names, key)} {self._sums[key]:g}"
+            yield f"{self.name}_count{_labels(self.label_names, key)} {cumulative}"
+
+
+class CallbackMetric(Metric):
+    """Values read from `collect()` at scrape time, e.g. cache statistics."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labels: Tuple[str, ...],
+        collect: Callable[[], Dict[LabelValues, float]],
+    ):
+        super().__init__(name, help, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self) -> Iterator[str]:
+        for key, value in sorted(self.collect().items()):
+            yield f"{self.name}{_labels(self.label_names, key)} {value:g}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "HTTP requests handled.", ("method", "route", "status")
+))
+http_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "Time until the response was sent.", ("method", "route")
+))
+sql_statements = registry.register(Histogram(
+    "http_request_sql_statements", "SQL statements executed per request.", ("route",), COUNT_BUCKETS
+))
+sql_duration = registry.register(Histogram(
+    "sql_statement_duration_seconds", "Time spent executing each SQL statement."
+))
+external_duration = registry.register(Histogram(
+    "external_call_duration_seconds", "Time spent in calls to external services.", ("service",)
+))
+query_warnings = registry.register(Counter(
+    "http_request_query_warnings_total",
+    "Requests that ran more SQL statements than METRICS_QUERY_WARN_THRESHOLD.",
+    ("route",),
+))
+
+
+@dataclass
+class RequestStats:
+    started: float = field(default_factory=time.perf_counter)
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    statements: Tally = field(default_factory=Tally)
+    external: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+    def server_timing(self) -> str:
+        parts = [f"app;dur={(time.perf_counter() - self.started) * 1000:.1f}"]
+        parts.append(f'db;dur={self.sql_seconds * 1000:.1f};desc="{self.sql_count} queries"')
+        for service, seconds in sorted(self.external.items()):
+            parts.append(f"{service};dur={seconds * 1000:.1f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+@contextmanager
+def track(service: str) -> Iterator[None]:
+    """Time a call to an external service, for /metrics and Server-Timing."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        external_duration.observe(elapsed, service=service)
+        stats = _current.get()
+        if stats is not None:
+            stats.external[service] += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time every statement run on `engine` (the sync engine of an AsyncEngine)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        sql_duration.observe(elapsed)
+        stats = _current.get()
+        if stats is not None:
+            stats.sql_count += 1
+            stats.sql_seconds += elapsed
+            stats.statements[statement] += 1
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("query_started") if context.connection else None
+        if started:
+            started.pop()
+
+
+class MetricsMiddleware:
+    """
+    Records wall time, status and SQL statement count of every HTTP request
+    by route template, optionally reports the breakdown to the client in a
+    Server-Timing header, and logs requests that run suspiciously many
+    statements (usually an N+1 query loop).
+
+    Plain ASGI rather than BaseHTTPMiddleware so streamed responses pass
+    through untouched and the context variable reaches the endpoint.
+    """
+
+    def __init__(self, app, server_timing: bool = False, query_warn_threshold: int = 0):
+        self.app = app
+        self.server_timing = server_timing
+        self.query_warn_threshold = query_warn_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = 500
+        responded = None
+
+        async def send_wrapper(message):
+            nonlocal status, responded
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                responded = time.perf_counter()
+                if self.server_timing:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", stats.server_timing().encode())
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            self._record(scope, stats, status, (responded or time.perf_counter()) - stats.started)
+
+    def _record(self, scope, stats: RequestStats, status: int, elapsed: float) -> None:
+        route = getattr(scope.get("route"), "path", None) or "unmatched"
+        method = scope["method"]
+        http_requests.inc(method=method, route=route, status=str(status))
+        http_duration.observe(elapsed, method=method, route=route)
+        sql_statements.observe(stats.sql_count, route=route)
+
+        if self.query_warn_threshold and stats.sql_count > self.query_warn_threshold:
+            query_warnings.inc(route=route)
+            statement, repeats = stats.statements.most_common(1)[0]
+            repeated = ""
+            if repeats > 1:
+                # The same statement over and over is the N+1 signature.
+                repeated = f"; {repeats}x: {' '.join(statement.split())[:200]}"
+            logger.warning(
+                "%s %s ran %d SQL statements (%.1f ms)%s",
+                method, route, stats.sql_count, stats.sql_seconds * 1000, repeated,
+            )
+
+
+_caches: Dict[str, Callable[[], Dict[str, int]]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], Dict[str, int]]) -> None:
+    """Expose an LRUCache-style stats() dict as cache_* metrics labelled by cache."""
+    _caches[name] = stats
+
+
+def _cache_values(key: str) -> Callable[[], Dict[LabelValues, float]]:
+    return lambda: {(name,): stats().get(key, 0) for name, stats in _caches.items()}
+
+
+for _name, _kind, _key, _help in (
+    ("cache_hits_total", "counter", "hits", "Cache lookups that found an entry."),
+    ("cache_misses_total", "counter", "misses", "Cache lookups that found nothing or an expired entry."),
+    ("cache_evictions_total", "counter", "evictions", "Entries dropped to stay within max_size."),
+    ("cache_entries", "gauge", "size", "Entries currently cached."),
+):
+    registry.register(CallbackMetric(_name, _help, _kind, ("cache",), _cache_values(_key)))
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -5,6 +7,7 @@ from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.metrics import track
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -17,6 +20,57 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool and its queue are full."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification on a dedicated thread pool so a burst
+    of logins does not stall the event loop (bcrypt releases the GIL while it
+    works). At most `workers + queue_limit` calls are admitted at once; beyond
+    that callers get PasswordHasherBusy instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.capacity = workers + queue_limit
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+
+    async def _run(self, func, *args):
+        if self._in_flight >= self.capacity:
+            raise PasswordHasherBusy()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hasher"
+            )
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            with track("bcrypt"):
+                return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
+
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
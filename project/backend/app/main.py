@@ -1,21 +1,66 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.database import dispose_engines, engine, replica_engines
+from app.core.metrics import MetricsMiddleware, instrument_engine, register_cache, registry
+from app.core.security import password_hasher
+from app.services.export_jobs import export_jobs
+from app.services.pdf import pdf_renderer
+from app.services.storage import object_storage
+from app.services.templates import template_service
+from app.services.translation_memory import translation_memory
+from app.services.version_archive import version_archive
+from app.services.user_cache import user_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    template_service.load()
+    if settings.PDF_RENDER_PREWARM:
+        pdf_renderer.start()
+    export_jobs.start()
+    version_archive.start()
+    yield
+    await version_archive.stop()
+    await export_jobs.stop()
+    pdf_renderer.shutdown()
+    password_hasher.shutdown()
+    await dispose_engines()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+for each in (engine, *replica_engines):
+    instrument_engine(each.sync_engine)
+register_cache("user", user_cache.stats)
+register_cache("translation_memory", translation_memory.stats)
+register_cache("presigned_url", object_storage.stats)
+register_cache("template_html", template_service.html_cache.stats)
+register_cache("version_archive", version_archive.stats)
+
+app.add_middleware(
+    MetricsMiddleware,
+    server_timing=settings.METRICS_SERVER_TIMING,
+    query_warn_threshold=settings.METRICS_QUERY_WARN_THRESHOLD,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing"],
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -23,4 +68,14 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "version": settings.VERSION}
+    return {
+        "status": "healthy",
+        "version": settings.VERSION,
+        "user_cache": user_cache.stats(),
+    }
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -1,3 +1,5 @@
 from app.models.user import User
 from app.models.resume import Resume, ResumeVersion
+from app.models.export import ResumeExport
 from app.models.subscription import Plan, Subscription
+from app.models.translation import TranslationMemory
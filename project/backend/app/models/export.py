@@ -0,0 +1,43 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+import uuid
+import enum
+
+from app.core.database import Base
+
+
+class ExportStatus(str, enum.Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ResumeExport(Base):
+    __tablename__ = "resume_exports"
+    __table_args__ = (
+        # Workers claim the oldest pending job; keep that scan on a small index.
+        Index(
+            "ix_resume_exports_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index("ix_resume_exports_resume_id", "resume_id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    status = Column(String, nullable=False, default=ExportStatus.PENDING.value)
+    template_id = Column(String, nullable=False, default="default")
+    language = Column(String, nullable=False, default="en")
+    # Content as it was when the export was requested, so later edits don't
+    # change a queued job's output.
+    content = Column(JSONB, nullable=False)
+    file_key = Column(String, nullable=True)  # S3 key once rendered
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Enum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, DDL, String, DateTime, ForeignKey, Integer, Enum, Boolean, Index, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID, JSONB
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import uuid
 import enum
@@ -14,8 +14,54 @@ class ResumeLanguage(str, enum.Enum):
     FR = "fr"
 
 
+# Text search configuration (stemming, stop words) for each resume language.
+SEARCH_CONFIGS = {
+    ResumeLanguage.EN: "english",
+    ResumeLanguage.RU: "russian",
+    ResumeLanguage.FR: "french",
+}
+
+# resume_search_vector() backs the generated resumes.search_vector column and
+# is also applied to each version's content when it is written. The title
+# weighs more than the body when ranking. resume_search_text() is the same
+# strings as plain text, for ts_headline() snippets. Both are declared
+# IMMUTABLE, which generated columns require and which holds as long as the
+# text search configurations themselves aren't changed.
+SEARCH_FUNCTIONS_DDL = """
+CREATE OR REPLACE FUNCTION resume_search_config(language resumelanguage) RETURNS regconfig
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE language %s ELSE 'english'::regconfig END
+$$;
+
+CREATE OR REPLACE FUNCTION resume_search_vector(language resumelanguage, title text, content jsonb) RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT setweight(to_tsvector(resume_search_config(language), coalesce(title, '')), 'A')
+        || setweight(jsonb_to_tsvector(resume_search_config(language), coalesce(content, '{}'), '["string"]'), 'B')
+$$;
+
+CREATE OR REPLACE FUNCTION resume_search_text(content jsonb) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT string_agg(value #>> '{}', ' ')
+    FROM jsonb_path_query(content, 'strict $.** ? (@.type() == "string")') AS value
+$$;
+""" % " ".join(f"WHEN '{language.name}' THEN '{config}'::regconfig" for language, config in SEARCH_CONFIGS.items())
+
+
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Keyset pagination of a user's resumes by (updated_at, id)
+        Index("ix_resumes_user_id_updated_at", "user_id", "updated_at", "id"),
+        Index("ix_resumes_search_vector", "search_vector", postgresql_using="gin"),
+        # One translation per language of each original.
+        Index(
+            "ix_resumes_source_resume_id_language",
+            "source_resume_id",
+            "language",
+            unique=True,
+            postgresql_where=text("source_resume_id IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -24,21 +70,70 @@ class Resume(Base):
     content = Column(JSONB, nullable=False, default=dict)
     template_id = Column(String, default="default")
     current_version = Column(Integer, default=1)
+    # The original this resume is an AI translation of; translating again
+    # updates it instead of adding another. Kept when the original goes.
+    source_resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Maintained by Postgres on every insert and update of the row.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("resume_search_vector(language, title, content)", persisted=True),
+    ))
 
     user = relationship("User", back_populates="resumes")
-    versions = relationship("ResumeVersion", back_populates="resume", order_by="desc(ResumeVersion.version)")
+    # History can run to thousands of rows: never loaded through the
+    # relationship, and deleted by the database along with the resume.
+    versions = relationship(
+        "ResumeVersion",
+        back_populates="resume",
+        order_by="desc(ResumeVersion.version)",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class ResumeVersion(Base):
     __tablename__ = "resume_versions"
+    __table_args__ = (
+        Index("ix_resume_versions_resume_id_version", "resume_id", "version", unique=True),
+        Index("ix_resume_versions_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=False)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
     version = Column(Integer, nullable=False)
-    content = Column(JSONB, nullable=False)
-    source = Column(String, default="manual")  # manual, ai_translation
+    # Snapshots carry the full document in `content`; the versions in between
+    # only store a JSON patch against the previous version in `delta`.
+    is_snapshot = Column(Boolean, nullable=False, default=True)
+    content = Column(JSONB, nullable=True)
+    delta = Column(JSONB, nullable=True)
+    content_hash = Column(String(64), nullable=True)  # sha256 of the canonical JSON
+    source = Column(String, default="manual")  # manual, ai_translation, import
+    # Saves from the same source within RESUME_VERSION_COALESCE_SECONDS of
+    # this overwrite the row instead of adding a new version.
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # resume_search_vector() of the full content at this version, set when the
+    # row is written (delta rows don't hold the content to compute it from).
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    # Set once the version has been moved to object storage: the row stays
+    # as a stub with its metadata, and content, delta and search_vector are
+    # cleared. The object holds its whole snapshot block.
+    archive_key = Column(String, nullable=True)
 
     resume = relationship("Resume", back_populates="versions")
+
+
+# Migrations create the functions; this covers metadata.create_all().
+event.listen(Resume.__table__, "before_create", DDL(SEARCH_FUNCTIONS_DDL))
+event.listen(
+    Resume.__table__,
+    "before_drop",
+    DDL(
+        "DROP FUNCTION IF EXISTS resume_search_text(jsonb), "
+        "resume_search_vector(resumelanguage, text, jsonb), "
+        "resume_search_config(resumelanguage) CASCADE"
+    ),
+)
@@ -20,6 +20,7 @@ class Plan(Base):
     name = Column(Enum(PlanType), unique=True, nullable=False)
     display_name = Column(String, nullable=False)
     price_monthly = Column(Integer, default=0)  # in cents
+    # Limits; NULL means unlimited.
     max_resumes = Column(Integer, default=3)
     max_exports_per_month = Column(Integer, default=10)
     max_translations_per_month = Column(Integer, default=5)
@@ -38,6 +39,9 @@ class Subscription(Base):
     status = Column(String, default="active")  # active, canceled, past_due
     current_period_start = Column(DateTime, nullable=True)
     current_period_end = Column(DateTime, nullable=True)
+    # Usage counters for the calendar month (UTC) starting at
+    # usage_period_start; the first increment in a new month resets them.
+    usage_period_start = Column(DateTime, nullable=True)
     exports_used = Column(Integer, default=0)
     translations_used = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text
+from datetime import datetime
+
+from app.core.database import Base
+
+
+class TranslationMemory(Base):
+    """One translated string, shared across resumes and users."""
+
+    __tablename__ = "translation_memory"
+
+    source_hash = Column(String(64), primary_key=True)  # sha256 of source_text
+    source_language = Column(String, primary_key=True)
+    target_language = Column(String, primary_key=True)
+    mode = Column(String, primary_key=True)  # standard, professional
+    source_text = Column(Text, nullable=False)
+    translated_text = Column(Text, nullable=False)
+    # Share of the model's input + output tokens spent on this string, i.e.
+    # what a cache hit saves.
+    tokens = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,2 +1,2 @@
 from app.schemas.user import UserCreate, UserResponse, UserLogin, Token
-from app.schemas.resume import ResumeCreate, ResumeUpdate, ResumeResponse, ResumeContent
+from app.schemas.resume import ResumeCreate, ResumeUpdate, ResumeResponse, ResumeSummary, ResumeContent, ResumeTranslateRequest
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class ExportJobResponse(BaseModel):
+    id: UUID
+    resume_id: UUID
+    status: str  # pending, processing, completed, failed
+    url: Optional[str] = None  # signed download URL once completed
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field, computed_field
+from typing import Any, Literal, Optional, List
 from uuid import UUID
 from datetime import datetime
 
@@ -71,14 +71,50 @@ class ResumeUpdate(BaseModel):
     content: Optional[ResumeContent] = None
 
 
-class ResumeResponse(BaseModel):
+class PatchOperation(BaseModel):
+    """One RFC 6902 operation on the resume content."""
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(None, alias="from")
+
+
+class ResumePatch(BaseModel):
+    base_version: int  # current_version the operations were computed against
+    operations: List[PatchOperation]
+
+
+class ResumeTranslateRequest(BaseModel):
+    target_language: ResumeLanguage
+    mode: Literal["standard", "professional"] = "standard"
+    stream: bool = False  # NDJSON, one line per translated section
+
+
+class ResumeTranslateManyRequest(BaseModel):
+    target_languages: List[ResumeLanguage] = Field(..., min_length=1)
+    mode: Literal["standard", "professional"] = "standard"
+
+
+class TranslationStats(BaseModel):
+    strings: int = 0  # translatable strings in the resume
+    from_memory: int = 0  # strings served from translation memory
+    tokens_used: int = 0
+    tokens_saved: int = 0  # tokens the memory hits originally cost
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        return round(self.from_memory / self.strings, 4) if self.strings else 0.0
+
+
+class ResumeSummary(BaseModel):
     id: UUID
     user_id: UUID
     title: str
     language: ResumeLanguage
     template_id: str
-    content: ResumeContent
     current_version: int
+    source_resume_id: Optional[UUID] = None  # set on translations: the resume they were translated from
     created_at: datetime
     updated_at: datetime
 
@@ -86,13 +122,84 @@ class ResumeResponse(BaseModel):
         from_attributes = True
 
 
-class ResumeVersionResponse(BaseModel):
+class ResumeResponse(ResumeSummary):
+    content: ResumeContent
+
+
+class ResumeTranslationResponse(ResumeResponse):
+    translation: TranslationStats
+
+
+class ResumeLanguageTranslation(BaseModel):
+    language: ResumeLanguage
+    status: Literal["created", "updated", "failed"]
+    resume: Optional[ResumeResponse] = None
+    translation: Optional[TranslationStats] = None
+    error: Optional[str] = None  # why the language failed
+
+
+class ResumeTranslationsResponse(BaseModel):
+    results: List[ResumeLanguageTranslation]  # in the order requested
+
+
+class ResumeSummaryPage(BaseModel):
+    items: List[ResumeSummary]
+    next_cursor: Optional[str] = None
+
+
+class ResumePage(BaseModel):
+    items: List[ResumeResponse]
+    next_cursor: Optional[str] = None
+
+
+class ResumeSearchHit(ResumeSummary):
+    rank: float
+    snippet: str  # HTML-escaped, matches wrapped in <mark>
+
+
+class ResumeVersionSearchHit(BaseModel):
+    resume_id: UUID
+    title: str
+    version: int
+    source: str
+    created_at: datetime
+    rank: float
+    snippet: str
+
+
+class ResumeSearchResults(BaseModel):
+    items: List[ResumeSearchHit]
+    # Earlier versions that match, when requested with include=versions.
+    versions: Optional[List[ResumeVersionSearchHit]] = None
+
+
+class ResumeImportError(BaseModel):
+    line: int  # 1-based line number in the NDJSON body
+    detail: str
+
+
+class ResumeImportResult(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: List[ResumeImportError] = []  # the first RESUME_IMPORT_MAX_ERRORS rejected lines
+
+
+class ResumeVersionSummary(BaseModel):
     id: UUID
     resume_id: UUID
     version: int
-    content: ResumeContent
     source: str
+    content_hash: Optional[str] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class ResumeVersionResponse(ResumeVersionSummary):
+    content: ResumeContent
+
+
+class ResumeVersionPage(BaseModel):
+    items: List[ResumeVersionSummary]
+    next_cursor: Optional[str] = None
@@ -27,6 +27,19 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class UserPrincipal(BaseModel):
+    """The authenticated user as seen by request handlers; safe to cache."""
+    id: UUID
+    email: EmailStr
+    full_name: Optional[str]
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
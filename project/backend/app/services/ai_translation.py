@@ -1,46 +1,343 @@
-from anthropic import Anthropic
-from typing import Dict, Any
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 
 from app.core.config import settings
-from app.schemas.resume import ResumeContent
+from app.core.json_patch import apply_patch
+from app.core.metrics import track
+from app.schemas.resume import ResumeContent, TranslationStats
+from app.services.translation_memory import TranslationMemoryService, translation_memory
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationError(Exception):
+    pass
+
+
+class TranslationUnavailable(TranslationError):
+    """The model API failed or could not be reached."""
+
+
+# Text fields that get translated. Names, contact details, dates, company
+# and school names and skill/proficiency levels are kept as written.
+TRANSLATABLE_FIELDS = {
+    "personal_info": ("location", "summary"),
+    "work_experience": ("position", "location", "description", "achievements"),
+    "education": ("degree", "field_of_study", "location", "achievements"),
+    "skills": ("name",),
+    "languages": ("name",),
+}
+
+# Lists whose entries are too short to be worth a request each.
+GROUPED_SECTIONS = ("skills", "languages")
+
+LANGUAGE_NAMES = {
+    "en": "English",
+    "ru": "Russian",
+    "fr": "French"
+}
+
+
+def _flatten(value: Any, prefix: str = "") -> Dict[str, str]:
+    """Non-blank strings in `value`, keyed by their JSON pointer below it."""
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    elif isinstance(value, str) and value.strip():
+        return {prefix: value}
+    else:
+        return {}
+    strings = {}
+    for key, item in items:
+        strings.update(_flatten(item, f"{prefix}/{key}" if prefix else str(key)))
+    return strings
+
+
+def _pick(item: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    return {field: item.get(field) for field in fields}
+
+
+class TranslationSource:
+    """
+    A resume prepared for translation: dumped and split into sections once,
+    then shared read-only by every target language it is translated into.
+    """
+
+    def __init__(self, document: Dict[str, Any], sections: List[Tuple[str, Dict[str, str]]], language: str):
+        self.document = document
+        self.sections = sections
+        self.language = language
+        self.texts = list(dict.fromkeys(text for _, strings in sections for text in strings.values()))
 
 
 class AITranslationService:
-    def __init__(self):
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+    """
+    Translates a resume section by section.
+
+    The resume is split into independent sections (personal info, each work
+    experience and education entry, the skill and language lists) holding
+    only their translatable strings. Strings already in the translation
+    memory are reused; the rest of each section is translated concurrently,
+    at most `max_concurrency` requests at a time across the process, and
+    each reply must come back with exactly the keys that were sent before
+    it is merged into the document.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        max_tokens: int,
+        max_concurrency: int,
+        client: Optional["AsyncAnthropic"] = None,
+        memory: Optional[TranslationMemoryService] = None,
+    ):
+        self._client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.memory = memory
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    @property
+    def client(self) -> "AsyncAnthropic":
+        # The anthropic SDK takes a couple of hundred milliseconds to import;
+        # only processes that actually translate pay for it.
+        if self._client is None:
+            from anthropic import AsyncAnthropic
+
+            self._client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                base_url=settings.ANTHROPIC_BASE_URL or None,
+                timeout=settings.TRANSLATION_TIMEOUT_SECONDS,
+            )
+        return self._client
+
+    @client.setter
+    def client(self, client: "AsyncAnthropic") -> None:
+        self._client = client
+
+    def prepare(self, content: ResumeContent, source_language: str = "en") -> TranslationSource:
+        document = content.model_dump()
+        return TranslationSource(document, self.split_sections(document), source_language)
 
     async def translate_resume(
+        self,
+        content: Union[ResumeContent, TranslationSource],
+        target_language: str,
+        mode: str = "standard",  # standard or professional
+        source_language: str = "en",
+        stats: Optional[TranslationStats] = None,
+    ) -> ResumeContent:
+        source = content if isinstance(content, TranslationSource) else self.prepare(content, source_language)
+        document = source.document
+        async for section, translated in self.translate_sections(source, target_language, mode, stats=stats):
+            document = self.apply_section(document, section, translated)
+        return ResumeContent.model_validate(document)
+
+    async def translate_many(
         self,
         content: ResumeContent,
+        target_languages: Sequence[str],
+        mode: str = "standard",
+        source_language: str = "en",
+    ) -> Dict[str, Union[Tuple[ResumeContent, TranslationStats], TranslationError]]:
+        """
+        Translate one resume into several languages at once, from a single
+        prepared source. Languages succeed or fail independently: each maps
+        to (content, stats) or to the TranslationError it failed with.
+        """
+        source = self.prepare(content, source_language)
+
+        async def translate(target_language: str):
+            stats = TranslationStats()
+            return await self.translate_resume(source, target_language, mode, stats=stats), stats
+
+        results = await asyncio.gather(
+            *(translate(language) for language in target_languages), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, TranslationError):
+                raise result
+        return dict(zip(target_languages, results))
+
+    async def translate_sections(
+        self,
+        content: Union[ResumeContent, TranslationSource],
         target_language: str,
-        mode: str = "standard"  # standard or professional
+        mode: str = "standard",
+        source_language: str = "en",
+        stats: Optional[TranslationStats] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, str]]]:
+        """
+        Yield (section, {pointer: translated string}) pairs in completion
+        order, sections answered entirely from memory first. Counts go into
+        `stats` when given. A prepared TranslationSource brings its own
+        source language.
+        """
+        stats = stats if stats is not None else TranslationStats()
+        source = content if isinstance(content, TranslationSource) else self.prepare(content, source_language)
+        source_language = source.language
+        sections = source.sections
+        known = {}
+        if self.memory is not None:
+            known = await self.memory.lookup(source.texts, source_language, target_language, mode)
+        system = self._build_translation_prompt(target_language, mode)
+
+        async def run(section: str, pending: Dict[str, str], done: Dict[str, str]):
+            translated, tokens = await self._translate_section(pending, system)
+            stats.tokens_used += tokens
+            await self._remember(pending, translated, tokens, source_language, target_language, mode)
+            return section, {**done, **translated}
+
+        ready = []
+        tasks = []
+        for section, strings in sections:
+            done, pending = {}, {}
+            for key, text in strings.items():
+                if text in known:
+                    done[key], tokens = known[text]
+                    stats.from_memory += 1
+                    stats.tokens_saved += tokens
+                else:
+                    pending[key] = text
+            stats.strings += len(strings)
+            if pending:
+                tasks.append(asyncio.ensure_future(run(section, pending, done)))
+            else:
+                ready.append((section, done))
+
+        try:
+            for item in ready:
+                yield item
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The caller stopped early or a section failed: don't keep paying
+            # for the rest.
+            for task in tasks:
+                task.cancel()
+
+    def split_sections(self, document: Dict[str, Any]) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Break a resume into (section, strings) pairs. Sections and the keys
+        of their strings are JSON pointer paths: section "work_experience/0"
+        holds "position", "achievements/1", ...
+        """
+        sections = []
+        info = _flatten(_pick(document["personal_info"], TRANSLATABLE_FIELDS["personal_info"]))
+        if info:
+            sections.append(("personal_info", info))
+
+        for name in ("work_experience", "education"):
+            for index, item in enumerate(document[name]):
+                strings = _flatten(_pick(item, TRANSLATABLE_FIELDS[name]))
+                if strings:
+                    sections.append((f"{name}/{index}", strings))
+
+        for name in GROUPED_SECTIONS:
+            strings = _flatten([_pick(item, TRANSLATABLE_FIELDS[name]) for item in document[name]])
+            if strings:
+                sections.append((name, strings))
+
+        return sections
+
+    @staticmethod
+    def apply_section(
+        document: Dict[str, Any],
+        section: str,
+        translated: Dict[str, str],
     ) -> Dict[str, Any]:
-        prompt = self._build_translation_prompt(content, target_language, mode)
-
-        message = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+        return apply_patch(document, [
+            {"op": "replace", "path": f"/{section}/{key}", "value": text}
+            for key, text in translated.items()
+        ])
+
+    async def _translate_section(self, strings: Dict[str, str], system: str) -> Tuple[Dict[str, str], int]:
+        """Translate one section's strings; returns them with the tokens spent."""
+        from anthropic import APIError
+
+        request = json.dumps(strings, ensure_ascii=False)
+        tokens = 0
+        async with self._semaphore:
+            for attempt in range(2):
+                try:
+                    with track("anthropic"):
+                        message = await self.client.messages.create(
+                            model=self.model,
+                            max_tokens=self.max_tokens,
+                            system=system,
+                            messages=[
+                                {"role": "user", "content": request}
+                            ]
+                        )
+                except APIError as e:
+                    raise TranslationUnavailable(str(e)) from e
+                tokens += message.usage.input_tokens + message.usage.output_tokens
+                try:
+                    return self._check_shape(strings, self._parse_json(message.content[0].text)), tokens
+                except TranslationError:
+                    # Models occasionally wrap or truncate the JSON; ask once more.
+                    if attempt:
+                        raise
 
-        # Parse the response and return structured JSON
-        # TODO: Implement proper JSON parsing from response
-        return message.content[0].text
+    async def _remember(
+        self,
+        sources: Dict[str, str],
+        translated: Dict[str, str],
+        tokens: int,
+        source_language: str,
+        target_language: str,
+        mode: str,
+    ) -> None:
+        if self.memory is None:
+            return
+        # Attribute the request's tokens to its strings by length.
+        total = sum(len(text) for text in sources.values()) or 1
+        entries = [
+            (sources[key], translated[key], round(tokens * len(sources[key]) / total))
+            for key in sources
+        ]
+        try:
+            await self.memory.store(entries, source_language, target_language, mode)
+        except Exception:
+            # Losing a memory write only costs a future model call.
+            logger.exception("Failed to store translations in translation memory")
+
+    @staticmethod
+    def _parse_json(text: str) -> Any:
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            text = text[text.find("\n") + 1:] if "\n" in text else text
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            raise TranslationError(f"Model returned invalid JSON: {e}")
+
+    def _check_shape(self, original: Any, translated: Any) -> Any:
+        """Ensure the reply mirrors the request: same keys, list lengths and types."""
+        if isinstance(original, dict):
+            if not isinstance(translated, dict) or translated.keys() != original.keys():
+                raise TranslationError("Translated section has different fields")
+            return {key: self._check_shape(original[key], translated[key]) for key in original}
+        if isinstance(original, list):
+            if not isinstance(translated, list) or len(translated) != len(original):
+                raise TranslationError("Translated section has a different number of items")
+            return [self._check_shape(a, b) for a, b in zip(original, translated)]
+        if not isinstance(translated, str):
+            raise TranslationError("Translated value is not a string")
+        return translated
 
     def _build_translation_prompt(
         self,
-        content: ResumeContent,
         target_language: str,
         mode: str
     ) -> str:
-        language_names = {
-            "en": "English",
-            "ru": "Russian",
-            "fr": "French"
-        }
-
         mode_instruction = ""
         if mode == "professional":
             mode_instruction = """
@@ -49,15 +346,19 @@ class AITranslationService:
             """
 
         return f"""
-        Translate the following resume JSON to {language_names.get(target_language, target_language)}.
+        You translate sections of a resume to {LANGUAGE_NAMES.get(target_language, target_language)}.
         {mode_instruction}
 
-        Maintain the exact JSON structure. Only translate the text values, not the keys.
+        Each message is a JSON object mapping the paths of fields in one resume section to their text.
+        Maintain the exact JSON structure: the same keys, each mapped to its translation.
+        Only translate the text values, not the keys.
         Return only valid JSON, no additional text.
-
-        Resume JSON:
-        {content.model_dump_json(indent=2)}
         """
 
 
-ai_translation_service = AITranslationService()
+ai_translation_service = AITranslationService(
+    model=settings.TRANSLATION_MODEL,
+    max_tokens=settings.TRANSLATION_MAX_TOKENS,
+    max_concurrency=settings.TRANSLATION_MAX_CONCURRENCY,
+    memory=translation_memory,
+)
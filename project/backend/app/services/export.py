@@ -1,59 +1,92 @@
-import boto3
-from botocore.config import Config
-from datetime import timedelta
+import asyncio
 from typing import Optional
-import uuid
 
 from app.core.config import settings
+from app.core.hashing import content_hash
+from app.schemas.resume import ResumeContent
+from app.services.export_cache import LocalFileCache
+from app.services.pdf import pdf_renderer, RENDERER_VERSION
+from app.services.storage import ObjectStorage, object_storage
+from app.services.templates import template_service
 
 
 class ExportService:
-    def __init__(self):
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION,
-            config=Config(signature_version='s3v4')
-        )
-        self.bucket = settings.AWS_S3_BUCKET
-
-    async def export_to_pdf(self, resume_id: str, html_content: str) -> str:
+    def __init__(self, storage: ObjectStorage = object_storage):
+        self.storage = storage
+        self.local_cache = LocalFileCache(settings.EXPORT_CACHE_DIR, settings.EXPORT_CACHE_MAX_BYTES)
+
+    async def export_to_pdf(
+        self,
+        resume_id: str,
+        content: ResumeContent,
+        template_id: str = "default",
+        language: str = "en"
+    ) -> str:
         """
         Export resume to PDF and upload to S3.
         Returns a signed URL for download.
         """
-        # TODO: Implement HTML to PDF conversion (e.g., using weasyprint or puppeteer)
-        pdf_content = self._render_html_to_pdf(html_content)
+        file_key = await self.render_to_storage(resume_id, content, template_id, language)
+        return await self.generate_signed_url(file_key)
+
+    async def render_to_storage(
+        self,
+        resume_id: str,
+        content: ResumeContent,
+        template_id: str = "default",
+        language: str = "en"
+    ) -> str:
+        """
+        Render the resume and upload it unless it is already stored.
+        Returns the S3 key of the PDF.
+
+        Exports are content-addressed: an unchanged resume maps to the same
+        object, which is reused without rendering or uploading again. The PDF
+        is rendered into a file in the local cache directory and uploaded
+        from there, so it is never loaded into this process's memory. If the
+        object has gone from the bucket (expired or cleaned up), the local
+        copy is uploaded again instead of rendering it anew.
+        """
+        digest = self.export_digest(content, template_id, language)
+        cache_key = f"{resume_id}/{digest}.pdf"
+        file_key = f"exports/{cache_key}"
+
+        if await self.storage.exists(file_key):
+            return file_key
 
-        file_key = f"exports/{resume_id}/{uuid.uuid4()}.pdf"
+        cached = await asyncio.to_thread(self.local_cache.get, cache_key)
+        if cached is not None:
+            try:
+                await self.storage.upload_file(cached, file_key, 'application/pdf')
+                return file_key
+            except FileNotFoundError:
+                pass  # evicted from the local cache in the meantime
 
-        self.s3_client.put_object(
-            Bucket=self.bucket,
-            Key=file_key,
-            Body=pdf_content,
-            ContentType='application/pdf'
-        )
+        html_content = template_service.render(content, template_id, language, digest=digest)
+        tmp_path = await asyncio.to_thread(self.local_cache.temp_path, cache_key)
+        try:
+            await pdf_renderer.render_to_file(html_content, tmp_path, template_id)
+            await self.storage.upload_file(tmp_path, file_key, 'application/pdf')
+            await asyncio.to_thread(self.local_cache.put_file, cache_key, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
-        return self._generate_signed_url(file_key)
+        return file_key
 
-    def _render_html_to_pdf(self, html_content: str) -> bytes:
-        """Convert HTML to PDF bytes."""
-        # TODO: Implement PDF rendering
-        # Options: weasyprint, puppeteer, wkhtmltopdf
-        raise NotImplementedError("PDF rendering not yet implemented")
+    @staticmethod
+    def export_digest(content: ResumeContent, template_id: str, language: str) -> str:
+        """Hash of everything that determines the rendered PDF."""
+        return content_hash([
+            content.model_dump(mode="json"),
+            template_id,
+            template_service.template_version(template_id),
+            language,
+            RENDERER_VERSION,
+        ])
 
-    def _generate_signed_url(self, file_key: str, expires_in: int = 3600) -> str:
+    async def generate_signed_url(self, file_key: str, expires_in: Optional[int] = None) -> str:
         """Generate a signed URL for S3 file access."""
-        url = self.s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': self.bucket,
-                'Key': file_key
-            },
-            ExpiresIn=expires_in
-        )
-        return url
+        return await self.storage.presigned_url(file_key, expires_in or settings.EXPORT_URL_EXPIRES_SECONDS)
 
 
 export_service = ExportService()
@@ -0,0 +1,115 @@
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LocalFileCache:
+    """
+    Size-bounded LRU cache of rendered files on the local filesystem. The
+    object store stays authoritative; a local copy is uploaded again when its
+    object has gone from there, sparing a render. Keys are relative paths
+    such as "<resume_id>/<digest>.pdf". Recency survives restarts through
+    file mtimes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self._load_lock = Lock()
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Index the directory on first use rather than at import time."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+    def _load(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files = [path for path in self.directory.rglob("*") if path.is_file() and not path.name.startswith(".")]
+        for path in sorted(files, key=lambda path: path.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.relative_to(self.directory).as_posix()] = size
+            self._size += size
+        self._evict()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key
+
+    def get(self, key: str) -> Optional[Path]:
+        self._ensure_loaded()
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        return path
+
+    def temp_path(self, key: str) -> Path:
+        """
+        A fresh temporary file next to where `key` will live, for writers that
+        stream into the cache; hand it over with `put_file`.
+        """
+        self._ensure_loaded()
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        os.close(fd)
+        return Path(tmp_name)
+
+    def put_file(self, key: str, source: Path) -> Path:
+        """Move a finished file into the cache under `key`."""
+        self._ensure_loaded()
+        path = self.path_for(key)
+        size = source.stat().st_size
+        # Same directory, so the rename is atomic and readers never see a
+        # partial PDF.
+        os.replace(source, path)
+        self._track(key, size)
+        return path
+
+    def put(self, key: str, data: bytes) -> Path:
+        tmp_path = self.temp_path(key)
+        tmp_path.write_bytes(data)
+        return self.put_file(key, tmp_path)
+
+    def _track(self, key: str, size: int) -> None:
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+
+    def _evict(self) -> None:
+        while True:
+            with self._lock:
+                if self._size <= self.max_bytes or not self._entries:
+                    return
+                key, size = self._entries.popitem(last=False)
+                self._size -= size
+            try:
+                self.path_for(key).unlink()
+            except FileNotFoundError:
+                pass
+            logger.debug("Evicted %s from the local export cache", key)
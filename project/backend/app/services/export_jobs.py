@@ -0,0 +1,272 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.export import ExportStatus, ResumeExport
+from app.models.resume import Resume
+from app.schemas.resume import ResumeContent
+from app.services.export import export_service
+from app.services.quota import quota_service
+from app.services.templates import UnknownTemplateError
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (ExportStatus.PENDING.value, ExportStatus.PROCESSING.value)
+
+
+class ExportJobQueue:
+    """
+    Queue of PDF export jobs kept in the `resume_exports` table.
+
+    Workers claim the oldest pending job with SELECT ... FOR UPDATE SKIP
+    LOCKED, so workers in any number of API processes share one queue
+    without handing a job out twice and without running a separate broker.
+    Enqueueing wakes this process's idle workers immediately; other
+    processes pick the job up on their next poll.
+
+    A job whose worker died mid-render stays `processing`; the sweeper puts
+    it back in the queue once it is older than `stale_after`, until it has
+    used up `max_attempts`.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        poll_interval: float,
+        max_attempts: int,
+        stale_after: int,
+    ):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max(1, max_attempts)
+        self.stale_after = timedelta(seconds=stale_after)
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        # Long-poll waiters, per job, so a finished job only wakes its own.
+        self._finished: Dict[UUID, asyncio.Event] = {}
+        self._waiters: Dict[UUID, int] = {}
+
+    # --- Producer side ----------------------------------------------------
+
+    async def enqueue(self, db: AsyncSession, resume: Resume) -> Tuple[ResumeExport, bool]:
+        """
+        Queue an export of the resume's current content and commit. A
+        double-click returns the job already queued for the same content.
+        Returns the job and whether it was newly created.
+        """
+        language = resume.language.value if resume.language else "en"
+        job = await db.scalar(
+            select(ResumeExport).where(
+                ResumeExport.resume_id == resume.id,
+                ResumeExport.status.in_(ACTIVE_STATUSES),
+                ResumeExport.template_id == resume.template_id,
+                ResumeExport.language == language,
+                ResumeExport.content == resume.content,
+            ).limit(1)
+        )
+        created = job is None
+        if created:
+            job = ResumeExport(
+                resume_id=resume.id,
+                user_id=resume.user_id,
+                status=ExportStatus.PENDING.value,
+                template_id=resume.template_id,
+                language=language,
+                content=resume.content,
+                attempts=0,
+            )
+            db.add(job)
+        await db.commit()
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job, created
+
+    async def wait(
+        self,
+        db: AsyncSession,
+        job_id: UUID,
+        user_id: UUID,
+        timeout: float,
+    ) -> Optional[ResumeExport]:
+        """
+        Return the job once it has finished or `timeout` seconds have passed,
+        whichever comes first. The session's connection is released while
+        waiting.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            job = await db.scalar(
+                select(ResumeExport)
+                .where(ResumeExport.id == job_id, ResumeExport.user_id == user_id)
+                .execution_options(populate_existing=True)
+            )
+            await db.commit()
+            remaining = deadline - loop.time()
+            if job is None or job.status not in ACTIVE_STATUSES or remaining <= 0:
+                return job
+            # Jobs finished by another process don't signal us; re-check on
+            # the poll interval.
+            await self._wait_for_finish(job_id, min(remaining, self.poll_interval))
+
+    async def _wait_for_finish(self, job_id: UUID, timeout: float) -> None:
+        event = self._finished.setdefault(job_id, asyncio.Event())
+        self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters[job_id] -= 1
+            if not self._waiters[job_id]:
+                del self._waiters[job_id]
+                self._finished.pop(job_id, None)
+
+    # --- Consumer side ----------------------------------------------------
+
+    async def claim(self, db: AsyncSession) -> Optional[ResumeExport]:
+        """Mark the oldest pending job as processing and return it."""
+        job = await db.scalar(
+            select(ResumeExport)
+            .where(ResumeExport.status == ExportStatus.PENDING.value)
+            .order_by(ResumeExport.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if job is not None:
+            job.status = ExportStatus.PROCESSING.value
+            job.started_at = datetime.utcnow()
+            job.attempts += 1
+        await db.commit()
+        return job
+
+    async def requeue_stale(self, db: AsyncSession) -> int:
+        """Return jobs abandoned by a dead worker to the queue, or fail them."""
+        cutoff = datetime.utcnow() - self.stale_after
+        stale = (
+            ResumeExport.status == ExportStatus.PROCESSING.value,
+            ResumeExport.started_at < cutoff,
+        )
+        requeued = await db.execute(
+            update(ResumeExport)
+            .where(*stale, ResumeExport.attempts < self.max_attempts)
+            .values(status=ExportStatus.PENDING.value, started_at=None)
+        )
+        failed = await db.scalars(
+            update(ResumeExport)
+            .where(*stale, ResumeExport.attempts >= self.max_attempts)
+            .values(
+                status=ExportStatus.FAILED.value,
+                error="Export worker stopped responding",
+                finished_at=datetime.utcnow(),
+            )
+            .returning(ResumeExport.user_id)
+        )
+        failed_user_ids = failed.all()
+        await db.commit()
+        for user_id in failed_user_ids:
+            await quota_service.release(db, user_id, "exports")
+        return requeued.rowcount
+
+    async def process(self, job: ResumeExport) -> None:
+        try:
+            file_key = await export_service.render_to_storage(
+                str(job.resume_id),
+                ResumeContent.model_validate(job.content),
+                job.template_id,
+                job.language,
+            )
+        except asyncio.CancelledError:
+            # Shutting down: hand the job to another worker rather than
+            # leaving it for the stale sweep.
+            await self._finish(job.id, status=ExportStatus.PENDING.value, started_at=None)
+            raise
+        except (UnknownTemplateError, ValidationError) as e:
+            await self._fail(job, str(e))
+        except Exception as e:
+            logger.exception("Export %s failed (attempt %s)", job.id, job.attempts)
+            if job.attempts < self.max_attempts:
+                await self._finish(job.id, status=ExportStatus.PENDING.value, started_at=None)
+            else:
+                await self._fail(job, str(e) or "Export failed")
+        else:
+            await self._finish(job.id, status=ExportStatus.COMPLETED.value, file_key=file_key)
+
+    async def _fail(self, job: ResumeExport, error: str) -> None:
+        await self._finish(job.id, status=ExportStatus.FAILED.value, error=error)
+        # The user shouldn't pay for an export they never got.
+        async with SessionLocal() as db:
+            await quota_service.release(db, job.user_id, "exports")
+
+    async def _finish(self, job_id: UUID, **values) -> None:
+        if values["status"] in (ExportStatus.COMPLETED.value, ExportStatus.FAILED.value):
+            values["finished_at"] = datetime.utcnow()
+        async with SessionLocal() as db:
+            await db.execute(update(ResumeExport).where(ResumeExport.id == job_id).values(**values))
+            await db.commit()
+        event = self._finished.get(job_id)
+        if event is not None:
+            event.set()
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                async with SessionLocal() as db:
+                    job = await self.claim(db)
+                if job is not None:
+                    await self.process(job)
+                    continue
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Export worker error")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _sweeper(self) -> None:
+        interval = max(self.poll_interval, min(self.stale_after.total_seconds() / 4, 60))
+        while True:
+            try:
+                async with SessionLocal() as db:
+                    if await self.requeue_stale(db):
+                        self._wakeup.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Export sweeper error")
+            await asyncio.sleep(interval)
+
+    def start(self) -> None:
+        if self._tasks or self.concurrency <= 0:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._sweeper()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+
+
+export_jobs = ExportJobQueue(
+    concurrency=settings.EXPORT_WORKER_CONCURRENCY,
+    poll_interval=settings.EXPORT_JOB_POLL_SECONDS,
+    max_attempts=settings.EXPORT_JOB_MAX_ATTEMPTS,
+    stale_after=settings.EXPORT_JOB_STALE_SECONDS,
+)
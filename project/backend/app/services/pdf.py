@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.services.templates import TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+# Renderer identity; part of the export cache key, bump when output changes.
+RENDERER_VERSION = "weasyprint-61.0/1"
+
+
+class PDFRenderError(Exception):
+    pass
+
+
+class PDFRenderTimeout(PDFRenderError):
+    pass
+
+
+# --- Worker process state -------------------------------------------------
+# WeasyPrint is only imported inside the worker processes. Each worker parses
+# the template stylesheets and builds its font configuration once, in the
+# pool initializer, and reuses them for every job it runs.
+
+_font_config = None
+_stylesheets: Dict[str, object] = {}
+_base_url: Optional[str] = None
+
+
+def _init_worker(templates_dir: str) -> None:
+    global _font_config, _base_url
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+    _font_config = FontConfiguration()
+    _base_url = templates_dir
+    for path in Path(templates_dir).glob("*.css"):
+        _stylesheets[path.stem] = CSS(filename=str(path), font_config=_font_config)
+
+
+def _warm_up() -> bool:
+    return _font_config is not None
+
+
+def _render(html: str, template_id: str, target: Optional[str] = None) -> Optional[bytes]:
+    from weasyprint import HTML
+
+    stylesheets = [_stylesheets[template_id]] if template_id in _stylesheets else []
+    return HTML(string=html, base_url=_base_url).write_pdf(
+        target=target,
+        stylesheets=stylesheets,
+        font_config=_font_config,
+    )
+
+
+# --- Pool -----------------------------------------------------------------
+
+class PDFRenderer:
+    """
+    Renders HTML to PDF on a pool of pre-warmed WeasyPrint worker processes,
+    keeping the CPU-heavy layout work off the event loop.
+
+    Workers are recycled to cap memory growth: once the pool has run
+    `workers * max_tasks_per_child` jobs it is replaced by a fresh one while
+    the old one drains. (ProcessPoolExecutor's own max_tasks_per_child can
+    deadlock on Python 3.11.) A job that exceeds `timeout` tears the pool
+    down, since a stuck worker cannot be cancelled individually.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        timeout: float,
+        max_tasks_per_child: int,
+        templates_dir: Path = TEMPLATES_DIR,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self.templates_dir = templates_dir
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs = 0
+        self._warming: Optional["asyncio.Task[bool]"] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if (
+            self._executor is not None
+            and self.max_tasks_per_child
+            and self._jobs >= self.workers * self.max_tasks_per_child
+        ):
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(str(self.templates_dir),),
+            )
+            self._jobs = 0
+        return self._executor
+
+    def start(self) -> "asyncio.Task[bool]":
+        """
+        Spawn the workers now instead of on the first export. Returns the
+        warm-up task, which resolves to whether every worker came up; a
+        failure is logged there and leaves exports to a fresh pool.
+        """
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(executor, _warm_up) for _ in range(self.workers)]
+        self._warming = asyncio.create_task(self._warm_up(executor, futures))
+        return self._warming
+
+    async def _warm_up(self, executor: ProcessPoolExecutor, futures: List[asyncio.Future]) -> bool:
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if not errors:
+            return True
+        logger.error(
+            "PDF worker warm-up failed on %s of %s workers", len(errors), len(futures), exc_info=errors[0]
+        )
+        self._recycle(executor)
+        return False
+
+    async def render(self, html: str, template_id: str = "default") -> bytes:
+        return await self._submit(html, template_id)
+
+    async def render_to_file(self, html: str, path: Path, template_id: str = "default") -> None:
+        """
+        Render straight into `path`. The worker writes the file itself, so the
+        PDF never passes through this process's memory.
+        """
+        await self._submit(html, template_id, str(path))
+
+    async def _submit(self, html: str, template_id: str, target: Optional[str] = None):
+        executor = self._get_executor()
+        self._jobs += 1
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(executor, _render, html, template_id, target),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error("PDF render exceeded %ss; recycling the worker pool", self.timeout)
+            self._recycle(executor)
+            raise PDFRenderTimeout(f"PDF rendering timed out after {self.timeout}s")
+        except BrokenProcessPool:
+            self._recycle(executor)
+            raise PDFRenderError("PDF worker crashed")
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is executor:
+            self._executor = None
+        # ProcessPoolExecutor cannot cancel a running job; terminate its
+        # processes so a stuck render does not keep burning a core.
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._warming is not None:
+            self._warming.cancel()
+            self._warming = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+pdf_renderer = PDFRenderer(
+    workers=settings.PDF_RENDER_WORKERS,
+    timeout=settings.PDF_RENDER_TIMEOUT_SECONDS,
+    max_tasks_per_child=settings.PDF_RENDER_MAX_TASKS_PER_CHILD,
+)
@@ -0,0 +1,172 @@
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.subscription import Plan, PlanType, Subscription
+
+# Quota kind -> (usage counter column, plan limit column)
+QUOTAS = {
+    "exports": ("exports_used", "max_exports_per_month"),
+    "translations": ("translations_used", "max_translations_per_month"),
+}
+
+
+class QuotaExceeded(Exception):
+    def __init__(self, kind: str, limit: int):
+        super().__init__(f"Monthly {kind} limit of {limit} reached")
+        self.kind = kind
+        self.limit = limit
+
+
+def current_period_start(now: Optional[datetime] = None) -> datetime:
+    now = now or datetime.utcnow()
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_period_start(now: Optional[datetime] = None) -> datetime:
+    start = current_period_start(now)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+class QuotaService:
+    """
+    Monthly usage quotas enforced on the subscriptions row.
+
+    A check is one conditional UPDATE ... WHERE used < limit RETURNING: the
+    row lock is held only for that statement and Postgres re-checks the
+    condition after waiting for a concurrent increment, so parallel requests
+    can never push a counter past its limit. Plan limits are cached in
+    process and inlined into the statement as a CASE on plan_id.
+
+    Counters belong to the calendar month (UTC) in usage_period_start. The
+    first increment after the month changes resets them in the same
+    statement, so no rollover job is needed.
+    """
+
+    def __init__(self, plan_cache_ttl: int):
+        self.plan_cache_ttl = plan_cache_ttl
+        self._plans: Dict[UUID, Plan] = {}
+        self._free_plan_id: Optional[UUID] = None
+        self._loaded_at = 0.0
+
+    async def _load_plans(self, db: AsyncSession, force: bool = False) -> Dict[UUID, Plan]:
+        if force or not self._plans or time.monotonic() - self._loaded_at > self.plan_cache_ttl:
+            plans = (await db.scalars(select(Plan))).all()
+            self._plans = {plan.id: plan for plan in plans}
+            self._free_plan_id = next((plan.id for plan in plans if plan.name == PlanType.FREE), None)
+            self._loaded_at = time.monotonic()
+        return self._plans
+
+    async def consume(self, db: AsyncSession, user_id: UUID, kind: str, count: int = 1) -> Tuple[int, Optional[int]]:
+        """
+        Count `count` uses of `kind` against the user's plan, all or none,
+        and commit. Returns (used, limit), limit None meaning unlimited;
+        raises QuotaExceeded.
+        """
+        for attempt in range(2):
+            plans = await self._load_plans(db, force=bool(attempt))
+            row = (await db.execute(self._increment(user_id, kind, plans, count))).first()
+            if row is not None:
+                await db.commit()
+                used, plan_id = row
+                return used, self._limit(plans, plan_id, kind)
+
+            # Over the limit, a plan we haven't cached, or no subscription yet.
+            plan_id = await db.scalar(select(Subscription.plan_id).where(Subscription.user_id == user_id))
+            if plan_id is None:
+                await self.ensure_subscription(db, user_id)
+                continue
+            if plan_id in plans:
+                await db.commit()
+                raise QuotaExceeded(kind, self._limit(plans, plan_id, kind))
+
+        await db.commit()
+        raise QuotaExceeded(kind, 0)
+
+    def _increment(self, user_id: UUID, kind: str, plans: Dict[UUID, Plan], count: int = 1):
+        period_start = current_period_start()
+        rolled_over = or_(
+            Subscription.usage_period_start.is_(None),
+            Subscription.usage_period_start < period_start,
+        )
+        counters = {
+            name: case((rolled_over, 0), else_=getattr(Subscription, name))
+            for name, _ in QUOTAS.values()
+        }
+        used_column, limit_column = QUOTAS[kind]
+
+        limited = {
+            plan_id: getattr(plan, limit_column)
+            for plan_id, plan in plans.items()
+            if getattr(plan, limit_column) is not None
+        }
+        unlimited = [plan_id for plan_id in plans if plan_id not in limited]
+        # Plans missing from the cache get a limit of 0 and send us back to
+        # refresh it.
+        limit = case(limited, value=Subscription.plan_id, else_=0) if limited else literal(0)
+
+        values = dict(counters, usage_period_start=period_start)
+        values[used_column] = counters[used_column] + count
+        return (
+            update(Subscription)
+            .where(
+                Subscription.user_id == user_id,
+                or_(Subscription.plan_id.in_(unlimited), counters[used_column] + count <= limit),
+            )
+            .values(**values)
+            .returning(getattr(Subscription, used_column), Subscription.plan_id)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _limit(self, plans: Dict[UUID, Plan], plan_id: UUID, kind: str) -> Optional[int]:
+        return getattr(plans[plan_id], QUOTAS[kind][1])
+
+    async def release(self, db: AsyncSession, user_id: UUID, kind: str, count: int = 1) -> None:
+        """Give back `count` uses, e.g. when the operation they paid for failed."""
+        used_column = getattr(Subscription, QUOTAS[kind][0])
+        await db.execute(
+            update(Subscription)
+            .where(
+                Subscription.user_id == user_id,
+                Subscription.usage_period_start == current_period_start(),
+            )
+            .values({used_column: func.greatest(used_column - count, 0)})
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    async def ensure_subscription(self, db: AsyncSession, user_id: UUID) -> None:
+        """Put the user on the free plan unless they already have a subscription."""
+        await self._load_plans(db)
+        if self._free_plan_id is None:
+            await self._load_plans(db, force=True)
+        if self._free_plan_id is None:
+            raise RuntimeError("The free plan is missing; run the database migrations")
+        await db.execute(
+            insert(Subscription)
+            .values(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                plan_id=self._free_plan_id,
+                status="active",
+                usage_period_start=current_period_start(),
+                exports_used=0,
+                translations_used=0,
+                created_at=datetime.utcnow(),
+                updated_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id"])
+        )
+        await db.commit()
+
+
+quota_service = QuotaService(plan_cache_ttl=settings.PLAN_CACHE_TTL_SECONDS)
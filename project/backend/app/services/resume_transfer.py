@@ -0,0 +1,228 @@
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import case, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.resume import Resume, ResumeVersion
+from app.schemas.resume import ResumeCreate, ResumeImportError, ResumeImportResult
+from app.services.versioning import ResumeVersionService, resume_version_service
+
+# Exported per resume, in this order; what ResumeSummary serializes.
+_RESUME_FIELDS = (
+    "id", "user_id", "title", "language", "template_id", "current_version", "source_resume_id",
+    "created_at", "updated_at",
+)
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+        for item in error.errors()
+    )
+
+
+class ResumeTransferService:
+    """
+    Moves a user's resumes in and out as NDJSON, one resume per line.
+
+    Imports are validated line by line as the body arrives and written
+    RESUME_IMPORT_BATCH_SIZE resumes per transaction: one multi-row INSERT
+    for the resumes and one INSERT ... SELECT for their first versions.
+    Exports read through a server-side cursor. Neither side holds more than
+    a batch, or one resume's history, in memory.
+
+    An export line is a ResumeResponse with its "versions", so it can be
+    imported again as is (the extra fields are ignored).
+    """
+
+    def __init__(
+        self,
+        versions: ResumeVersionService = resume_version_service,
+        batch_size: Optional[int] = None,
+        max_line_bytes: Optional[int] = None,
+        max_errors: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+    ):
+        self.versions = versions
+        self.batch_size = max(1, batch_size or settings.RESUME_IMPORT_BATCH_SIZE)
+        self.max_line_bytes = max_line_bytes or settings.RESUME_IMPORT_MAX_LINE_BYTES
+        self.max_errors = settings.RESUME_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+        self.fetch_size = max(1, fetch_size or settings.RESUME_EXPORT_FETCH_SIZE)
+
+    async def lines(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+        """
+        (line number, line) for every non-blank line of a byte stream. Lines
+        over max_line_bytes come out as None instead of being buffered.
+        """
+        number = 0
+        buffer = b""
+        oversized = False
+        async for chunk in chunks:
+            buffer += chunk
+            *complete, buffer = buffer.split(b"\n")
+            for line in complete:
+                number += 1
+                if oversized or len(line) > self.max_line_bytes:
+                    oversized = False
+                    yield number, None
+                elif line.strip():
+                    yield number, line
+            if len(buffer) > self.max_line_bytes:
+                # Drop the line so far; the rest is skipped up to its newline.
+                oversized = True
+                buffer = b""
+        if oversized:
+            yield number + 1, None
+        elif buffer.strip():
+            yield number + 1, buffer
+
+    async def import_ndjson(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        chunks: AsyncIterator[bytes],
+    ) -> ResumeImportResult:
+        """
+        Create a resume for every valid ResumeCreate line. Each batch commits
+        on its own, so a failure part way keeps the batches before it; lines
+        that don't validate are skipped and reported.
+        """
+        result = ResumeImportResult()
+        batch: List[ResumeCreate] = []
+        async for number, line in self.lines(chunks):
+            if line is None:
+                self._reject(result, number, f"Line is longer than {self.max_line_bytes} bytes")
+                continue
+            try:
+                batch.append(ResumeCreate.model_validate_json(line))
+            except ValidationError as e:
+                self._reject(result, number, _describe(e))
+                continue
+            if len(batch) >= self.batch_size:
+                result.imported += await self.insert_batch(db, user_id, batch)
+                batch = []
+        if batch:
+            result.imported += await self.insert_batch(db, user_id, batch)
+        return result
+
+    def _reject(self, result: ResumeImportResult, line: int, detail: str) -> None:
+        result.failed += 1
+        if len(result.errors) < self.max_errors:
+            result.errors.append(ResumeImportError(line=line, detail=detail))
+
+    async def insert_batch(self, db: AsyncSession, user_id: UUID, records: List[ResumeCreate]) -> int:
+        """Insert resumes and their first versions in one transaction."""
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "title": record.title,
+                "language": record.language,
+                "template_id": record.template_id,
+                "content": record.content.model_dump(),
+                "current_version": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for record in records
+        ]
+        await db.execute(insert(Resume), rows)
+        await self.versions.add_first_versions(db, rows, source="import")
+        await db.commit()
+        return len(rows)
+
+    async def export_ndjson(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        include_versions: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """
+        Every resume of the user as an NDJSON line, oldest first, with each
+        version's rebuilt content under "versions" (oldest first) unless
+        `include_versions` is off.
+        """
+        columns = [getattr(Resume, field).label(f"resume_{field}") for field in _RESUME_FIELDS]
+        if not include_versions:
+            rows = await db.stream(
+                select(*columns, Resume.content.label("resume_content"))
+                .where(Resume.user_id == user_id)
+                .order_by(Resume.created_at, Resume.id)
+                .execution_options(yield_per=self.fetch_size)
+            )
+            async for row in rows:
+                yield self._line(row, row.resume_content)
+            return
+
+        # One row per version. The resume's own content comes along only
+        # with its current version, instead of repeating it on every row.
+        rows = await db.stream(
+            select(
+                *columns,
+                case(
+                    (or_(ResumeVersion.version.is_(None), ResumeVersion.version == Resume.current_version),
+                     Resume.content),
+                ).label("resume_content"),
+                ResumeVersion.version,
+                ResumeVersion.is_snapshot,
+                ResumeVersion.content,
+                ResumeVersion.delta,
+                ResumeVersion.archive_key,
+                ResumeVersion.content_hash,
+                ResumeVersion.source,
+                ResumeVersion.created_at,
+            )
+            .outerjoin(ResumeVersion, ResumeVersion.resume_id == Resume.id)
+            .where(Resume.user_id == user_id)
+            .order_by(Resume.created_at, Resume.id, ResumeVersion.version)
+            .execution_options(yield_per=self.fetch_size)
+        )
+        resume = None
+        content = None
+        history = []
+        async for row in rows:
+            if resume is None or row.resume_id != resume.resume_id:
+                if resume is not None:
+                    yield self._line(resume, content, history, await self.versions.rehydrate(history))
+                resume, content, history = row, None, []
+            if row.resume_content is not None:
+                content = row.resume_content
+            if row.version is not None:
+                history.append(row)
+        if resume is not None:
+            yield self._line(resume, content, history, await self.versions.rehydrate(history))
+
+    def _line(
+        self,
+        resume,
+        content: Optional[Dict[str, Any]],
+        history: Optional[list] = None,
+        archived: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> bytes:
+        document = {field: getattr(resume, f"resume_{field}") for field in _RESUME_FIELDS}
+        document["content"] = content
+        if history is not None:
+            document["versions"] = [
+                {
+                    "version": row.version,
+                    "source": row.source,
+                    "content_hash": row.content_hash,
+                    "created_at": row.created_at,
+                    "content": rebuilt,
+                }
+                for row, rebuilt in self.versions.replay(history, archived)
+            ]
+            if content is None and document["versions"]:
+                document["content"] = document["versions"][-1]["content"]
+        # default=str covers asyncpg's own UUID type.
+        return orjson.dumps(document, default=str) + b"\n"
+
+
+resume_transfer_service = ResumeTransferService()
@@ -0,0 +1,179 @@
+import html
+from typing import Any, Iterator, List
+from uuid import UUID
+
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.resume import Resume, ResumeLanguage, ResumeVersion, SEARCH_CONFIGS
+from app.schemas.resume import ResumeSearchHit, ResumeVersionSearchHit
+from app.services.versioning import ResumeVersionService, resume_version_service
+
+# ts_headline() marks matches with control characters so the snippet can be
+# HTML-escaped before they become <mark> tags.
+_MATCH_START, _MATCH_END = "\x02", "\x03"
+HEADLINE_OPTIONS = (
+    f"StartSel={_MATCH_START}, StopSel={_MATCH_END}, "
+    "MaxFragments=2, MaxWords=20, MinWords=8, FragmentDelimiter=\" … \""
+)
+
+
+def _strings(value: Any) -> Iterator[str]:
+    """The string values in a document, in the order resume_search_text() collects them."""
+    if isinstance(value, dict):
+        # jsonb stores object keys shortest first, then bytewise.
+        for key in sorted(value, key=lambda key: (len(key.encode()), key.encode())):
+            yield from _strings(value[key])
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+    elif isinstance(value, str):
+        yield value
+
+
+def _snippet(headline: str) -> str:
+    return html.escape(headline).replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
+
+
+class ResumeSearchService:
+    """
+    Full-text search over a user's resumes and their version history.
+
+    Each resume is indexed in its own language's text search configuration,
+    so the query is parsed in every configuration and the results OR-ed:
+    one tsquery, matched against the GIN-indexed vectors. Ranking uses
+    cover density with the title weighted above the body, and snippets are
+    built only for the page of results returned.
+    """
+
+    def __init__(self, versions: ResumeVersionService = resume_version_service):
+        self.versions = versions
+
+    @staticmethod
+    def tsquery(text: str):
+        """websearch syntax: words, "quoted phrases", or, -excluded."""
+        query = None
+        for config in SEARCH_CONFIGS.values():
+            parsed = func.websearch_to_tsquery(cast(config, REGCONFIG), text)
+            query = parsed if query is None else query.op("||")(parsed)
+        return query
+
+    async def search(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        text: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[ResumeSearchHit]:
+        query = self.tsquery(text)
+        rank = func.ts_rank_cd(Resume.search_vector, query)
+        ranked = (
+            select(Resume.id, rank.label("rank"))
+            .where(Resume.user_id == user_id, Resume.search_vector.op("@@")(query))
+            .order_by(rank.desc(), Resume.updated_at.desc(), Resume.id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        # Joined back for the page only: ts_headline re-parses the document.
+        headline = func.ts_headline(
+            func.resume_search_config(Resume.language),
+            func.resume_search_text(Resume.content),
+            query,
+            HEADLINE_OPTIONS,
+        )
+        rows = (await db.execute(
+            select(
+                Resume.id,
+                Resume.user_id,
+                Resume.title,
+                Resume.language,
+                Resume.template_id,
+                Resume.current_version,
+                Resume.source_resume_id,
+                Resume.created_at,
+                Resume.updated_at,
+                ranked.c.rank,
+                headline.label("snippet"),
+            )
+            .join(ranked, ranked.c.id == Resume.id)
+            .order_by(ranked.c.rank.desc(), Resume.updated_at.desc(), Resume.id)
+        )).all()
+        return [
+            ResumeSearchHit.model_validate({**row._mapping, "snippet": _snippet(row.snippet or "")})
+            for row in rows
+        ]
+
+    async def search_versions(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        text: str,
+        limit: int = 10,
+    ) -> List[ResumeVersionSearchHit]:
+        """Matching versions other than each resume's current one."""
+        query = self.tsquery(text)
+        rank = func.ts_rank_cd(ResumeVersion.search_vector, query)
+        rows = (await db.execute(
+            select(
+                ResumeVersion.resume_id,
+                ResumeVersion.version,
+                ResumeVersion.source,
+                ResumeVersion.created_at,
+                ResumeVersion.is_snapshot,
+                ResumeVersion.content,
+                Resume.title,
+                Resume.language,
+                rank.label("rank"),
+            )
+            .join(Resume, Resume.id == ResumeVersion.resume_id)
+            .where(
+                Resume.user_id == user_id,
+                ResumeVersion.version != Resume.current_version,
+                ResumeVersion.search_vector.op("@@")(query),
+            )
+            .order_by(rank.desc(), ResumeVersion.created_at.desc())
+            .limit(limit)
+        )).all()
+        if not rows:
+            return []
+
+        # Delta versions have to be rebuilt for their snippet.
+        texts = []
+        for row in rows:
+            content = row.content if row.is_snapshot else await self.versions.get_content(
+                db, row.resume_id, row.version
+            )
+            texts.append(" ".join(_strings(content or {})))
+        languages = [(row.language or ResumeLanguage.EN).name for row in rows]
+        documents = func.unnest(
+            cast(languages, ARRAY(Text)), cast(texts, ARRAY(Text))
+        ).table_valued("language", "document", with_ordinality="position").render_derived()
+        headlines = (await db.scalars(
+            select(func.ts_headline(
+                func.resume_search_config(cast(documents.c.language, Resume.language.type)),
+                documents.c.document,
+                query,
+                HEADLINE_OPTIONS,
+            ))
+            .select_from(documents)
+            .order_by(documents.c.position)
+        )).all()
+
+        return [
+            ResumeVersionSearchHit(
+                resume_id=row.resume_id,
+                title=row.title,
+                version=row.version,
+                source=row.source,
+                created_at=row.created_at,
+                rank=row.rank,
+                snippet=_snippet(headline or ""),
+            )
+            for row, headline in zip(rows, headlines)
+        ]
+
+
+resume_search_service = ResumeSearchService()
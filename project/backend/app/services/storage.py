@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, List, Optional
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.metrics import track
+
+
+class ObjectStorage:
+    """
+    S3 (or S3-compatible) bucket access for exports and archived resume
+    versions.
+
+    One boto3 client with a connection pool sized for concurrent uploads is
+    shared by every caller; boto3 clients are thread-safe, and all blocking
+    calls run in worker threads. Uploads stream from a file on disk and
+    switch to parallel multipart uploads above the multipart threshold, so a
+    large document is never held in memory. Presigned URLs are cached per
+    key and reused until they get close to expiry.
+
+    boto3 is imported and the client built on first use rather than at
+    import time: together they cost a few hundred milliseconds, which would
+    otherwise be paid by every process start, including ones that never
+    touch S3.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        max_pool_connections: int = 10,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        multipart_chunksize: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        url_min_remaining: int = 300,
+    ):
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.max_pool_connections = max_pool_connections
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+        self.max_concurrency = max_concurrency
+        self.url_min_remaining = url_min_remaining
+        self._urls = LRUCache(max_size=10_000)
+        self._client: Any = None
+        self._transfer_config: Any = None
+        self._connect_lock = threading.Lock()
+
+    def _connect(self) -> None:
+        with self._connect_lock:
+            if self._client is not None:
+                return
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
+
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_chunksize,
+                max_concurrency=self.max_concurrency,
+            )
+            self._client = boto3.client(
+                's3',
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_REGION,
+                endpoint_url=self.endpoint_url or None,
+                config=Config(
+                    signature_version='s3v4',
+                    max_pool_connections=self.max_pool_connections,
+                    tcp_keepalive=True,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                )
+            )
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._connect()
+        return self._client
+
+    async def _connected(self):
+        """The client, built in a worker thread the first time so the event loop isn't held up."""
+        if self._client is None:
+            await asyncio.to_thread(self._connect)
+        return self._client
+
+    async def upload_file(self, path: Path, key: str, content_type: str) -> None:
+        client = await self._connected()
+        with track("s3"):
+            await asyncio.to_thread(
+                client.upload_file,
+                str(path),
+                self.bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=self._transfer_config,
+            )
+
+    async def put_bytes(self, key: str, body: bytes, content_type: str) -> None:
+        """Store a small object in one request."""
+        client = await self._connected()
+        with track("s3"):
+            await asyncio.to_thread(
+                client.put_object, Bucket=self.bucket, Key=key, Body=body, ContentType=content_type
+            )
+
+    async def get_bytes(self, key: str) -> bytes:
+        client = await self._connected()
+
+        def read() -> bytes:
+            return client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+        with track("s3"):
+            return await asyncio.to_thread(read)
+
+    async def delete(self, keys: List[str]) -> None:
+        client = await self._connected()
+        for start in range(0, len(keys), 1000):  # DeleteObjects takes up to 1000 keys
+            batch = [{"Key": key} for key in keys[start:start + 1000]]
+            with track("s3"):
+                await asyncio.to_thread(
+                    client.delete_objects, Bucket=self.bucket, Delete={"Objects": batch, "Quiet": True}
+                )
+
+    async def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        client = await self._connected()
+        try:
+            with track("s3"):
+                await asyncio.to_thread(client.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    async def presigned_url(self, key: str, expires_in: int = 3600) -> str:
+        """
+        Signed GET URL for `key`. A cached URL is handed out again while it
+        still has at least `url_min_remaining` seconds to live. Signing is
+        local, but the first one may have to build the client.
+        """
+        cache_key = (key, expires_in)
+        url = self._urls.get(cache_key)
+        if url is None:
+            client = await self._connected()
+            url = client.generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': self.bucket,
+                    'Key': key
+                },
+                ExpiresIn=expires_in
+            )
+            reuse_for = expires_in - self.url_min_remaining
+            if reuse_for > 0:
+                self._urls.set(cache_key, url, ttl=reuse_for)
+        return url
+
+    def stats(self) -> dict:
+        return self._urls.stats()
+
+
+object_storage = ObjectStorage(
+    bucket=settings.AWS_S3_BUCKET,
+    endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+    multipart_threshold=settings.S3_MULTIPART_THRESHOLD_BYTES,
+    multipart_chunksize=settings.S3_MULTIPART_CHUNK_BYTES,
+    max_concurrency=settings.S3_UPLOAD_CONCURRENCY,
+    url_min_remaining=settings.EXPORT_URL_MIN_REMAINING_SECONDS,
+)
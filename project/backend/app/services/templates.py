@@ -0,0 +1,120 @@
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound, select_autoescape
+from markupsafe import Markup
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.hashing import content_hash
+from app.schemas.resume import ResumeContent
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "resume"
+
+
+class UnknownTemplateError(ValueError):
+    pass
+
+
+class TemplateService:
+    """
+    Renders ResumeContent to HTML with the Jinja2 template for a template_id.
+
+    Templates are compiled once (load() at startup) and never reloaded, so
+    a template change needs a restart; compiled bytecode is kept in
+    `bytecode_cache_dir` so restarts and sibling workers skip the compile.
+    Rendered documents are memoized by content hash, template and language.
+    """
+
+    def __init__(
+        self,
+        templates_dir: Path = TEMPLATES_DIR,
+        bytecode_cache_dir: str = settings.TEMPLATE_BYTECODE_CACHE_DIR,
+        html_cache_size: int = settings.TEMPLATE_HTML_CACHE_SIZE,
+    ):
+        self.templates_dir = templates_dir
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self.html_cache = LRUCache(max_size=html_cache_size)
+        self._env: Optional[Environment] = None
+        self._template_ids: Optional[List[str]] = None
+        self._versions: Dict[str, str] = {}
+        self._stylesheets: Dict[str, Markup] = {}
+
+    @property
+    def env(self) -> Environment:
+        # Built on first use, so that importing the service touches no files.
+        if self._env is None:
+            bytecode_cache = None
+            if self.bytecode_cache_dir:
+                Path(self.bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(self.bytecode_cache_dir)
+            self._env = Environment(
+                loader=FileSystemLoader(str(self.templates_dir)),
+                autoescape=select_autoescape(["html"]),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                auto_reload=False,
+                bytecode_cache=bytecode_cache,
+            )
+        return self._env
+
+    def load(self) -> None:
+        """Compile every template now rather than on its first render."""
+        for template_id in self.template_ids():
+            self.env.get_template(f"{template_id}.html")
+
+    def template_ids(self) -> List[str]:
+        if self._template_ids is None:
+            self._template_ids = sorted(path.stem for path in self.templates_dir.glob("*.html"))
+        return self._template_ids
+
+    def stylesheet_path(self, template_id: str) -> Path:
+        return self.templates_dir / f"{template_id}.css"
+
+    def stylesheet(self, template_id: str) -> Markup:
+        if template_id not in self._stylesheets:
+            path = self.stylesheet_path(template_id)
+            self._stylesheets[template_id] = Markup(path.read_text() if path.exists() else "")
+        return self._stylesheets[template_id]
+
+    def template_version(self, template_id: str) -> str:
+        """Digest of a template's HTML and CSS; changes whenever either file does."""
+        if template_id not in self._versions:
+            digest = hashlib.sha256()
+            for path in (self.templates_dir / f"{template_id}.html", self.stylesheet_path(template_id)):
+                if path.exists():
+                    digest.update(path.read_bytes())
+            self._versions[template_id] = digest.hexdigest()[:16]
+        return self._versions[template_id]
+
+    def render(
+        self,
+        content: ResumeContent,
+        template_id: str = "default",
+        language: str = "en",
+        inline_css: bool = False,
+        digest: Optional[str] = None,
+    ) -> str:
+        """
+        The resume as an HTML document. PDF rendering applies the template's
+        stylesheet itself; `inline_css` embeds it for display in a browser.
+
+        `digest` identifies the content for the rendered-HTML cache; callers
+        that already hold one (the export digest, an ETag) skip hashing it.
+        """
+        digest = digest or content_hash(content.model_dump(mode="json"))
+        key = (digest, template_id, language, inline_css)
+        html = self.html_cache.get(key)
+        if html is None:
+            try:
+                template = self.env.get_template(f"{template_id}.html")
+            except TemplateNotFound:
+                raise UnknownTemplateError(f"Unknown template: {template_id}")
+            stylesheet = self.stylesheet(template_id) if inline_css else None
+            html = template.render(content=content, language=language, stylesheet=stylesheet)
+            self.html_cache.set(key, html)
+        return html
+
+
+template_service = TemplateService()
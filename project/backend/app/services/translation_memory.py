@@ -0,0 +1,111 @@
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.hashing import content_hash
+from app.models.translation import TranslationMemory
+
+# (translated text, tokens it cost)
+MemoryEntry = Tuple[str, int]
+
+
+class TranslationMemoryService:
+    """
+    Previously translated strings, keyed by (source text hash, source
+    language, target language, mode) and shared by every resume and user.
+
+    Lookups go to an in-process LRU first and fetch whatever it misses from
+    Postgres in one query. Uses its own short sessions so callers don't hold
+    a connection across model calls.
+    """
+
+    def __init__(self, cache_size: int):
+        self._cache = LRUCache(max_size=cache_size)
+
+    async def lookup(
+        self,
+        texts: Iterable[str],
+        source_language: str,
+        target_language: str,
+        mode: str,
+    ) -> Dict[str, MemoryEntry]:
+        found: Dict[str, MemoryEntry] = {}
+        missing: Dict[str, str] = {}
+        for text in set(texts):
+            source_hash = content_hash(text)
+            entry = self._cache.get((source_hash, source_language, target_language, mode))
+            if entry is not None:
+                found[text] = entry
+            else:
+                missing[source_hash] = text
+
+        if missing:
+            async with SessionLocal() as db:
+                rows = await db.execute(
+                    select(
+                        TranslationMemory.source_hash,
+                        TranslationMemory.translated_text,
+                        TranslationMemory.tokens,
+                    ).where(
+                        TranslationMemory.source_hash.in_(missing),
+                        TranslationMemory.source_language == source_language,
+                        TranslationMemory.target_language == target_language,
+                        TranslationMemory.mode == mode,
+                    )
+                )
+                for source_hash, translated_text, tokens in rows:
+                    entry = (translated_text, tokens)
+                    found[missing[source_hash]] = entry
+                    self._cache.set((source_hash, source_language, target_language, mode), entry)
+
+        return found
+
+    async def store(
+        self,
+        entries: List[Tuple[str, str, int]],
+        source_language: str,
+        target_language: str,
+        mode: str,
+    ) -> None:
+        """Remember (source text, translated text, tokens) triples."""
+        if not entries:
+            return
+        rows = {}
+        for source_text, translated_text, tokens in entries:
+            source_hash = content_hash(source_text)
+            rows[source_hash] = {
+                "source_hash": source_hash,
+                "source_language": source_language,
+                "target_language": target_language,
+                "mode": mode,
+                "source_text": source_text,
+                "translated_text": translated_text,
+                "tokens": tokens,
+            }
+            self._cache.set(
+                (source_hash, source_language, target_language, mode),
+                (translated_text, tokens),
+            )
+
+        statement = insert(TranslationMemory).values(list(rows.values()))
+        async with SessionLocal() as db:
+            await db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["source_hash", "source_language", "target_language", "mode"],
+                    set_={
+                        "translated_text": statement.excluded.translated_text,
+                        "tokens": statement.excluded.tokens,
+                    },
+                )
+            )
+            await db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+translation_memory = TranslationMemoryService(cache_size=settings.TRANSLATION_MEMORY_CACHE_SIZE)
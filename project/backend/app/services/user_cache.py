@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from typing import Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache, SharedCacheBackend, get_shared_cache_backend
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.user import UserPrincipal
+
+logger = logging.getLogger(__name__)
+
+_pending_invalidations: Set[asyncio.Task] = set()
+
+
+class UserCache:
+    """
+    Caches authenticated user principals by id so get_current_user does not
+    hit the database on every request. An optional shared backend lets
+    several workers see each other's entries and invalidations.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: int,
+        shared: Optional[SharedCacheBackend] = None,
+    ):
+        self.ttl = ttl
+        self.local = LRUCache(max_size=max_size, ttl=ttl)
+        self.shared = shared
+        self.shared_hits = 0
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"user:{user_id}"
+
+    async def get(self, user_id) -> Optional[UserPrincipal]:
+        principal = self.local.get(str(user_id))
+        if principal is not None or self.shared is None:
+            return principal
+
+        raw = await self.shared.get(self._key(user_id))
+        if raw is None:
+            return None
+        principal = UserPrincipal.model_validate_json(raw)
+        self.local.set(str(user_id), principal)
+        self.shared_hits += 1
+        return principal
+
+    async def set(self, principal: UserPrincipal) -> None:
+        self.local.set(str(principal.id), principal)
+        if self.shared is not None:
+            await self.shared.set(self._key(principal.id), principal.model_dump_json(), self.ttl)
+
+    async def invalidate(self, user_id) -> None:
+        self.local.delete(str(user_id))
+        if self.shared is not None:
+            await self.shared.delete(self._key(user_id))
+
+    def stats(self) -> dict:
+        stats = self.local.stats()
+        stats["shared_hits"] = self.shared_hits
+        return stats
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    shared=get_shared_cache_backend(settings.USER_CACHE_SHARED_BACKEND),
+)
+
+
+# Any ORM update or delete of a User (deactivation, profile edits) drops the
+# cached principal once the transaction commits.
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _track_changed_user(mapper, connection, target: User) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_user_ids", set()).add(str(target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    user_ids: Set[str] = session.info.pop("changed_user_ids", set())
+    if not user_ids:
+        return
+    for user_id in user_ids:
+        user_cache.local.delete(user_id)
+    if user_cache.shared is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No event loop; shared user cache not invalidated for %s", user_ids)
+        return
+    for user_id in user_ids:
+        task = loop.create_task(user_cache.shared.delete(user_cache._key(user_id)))
+        _pending_invalidations.add(task)
+        task.add_done_callback(_pending_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop("changed_user_ids", None)
@@ -0,0 +1,228 @@
+import asyncio
+import gzip
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import and_, func, null, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.resume import Resume, ResumeVersion
+from app.services.storage import object_storage
+
+logger = logging.getLogger(__name__)
+
+
+class VersionArchive:
+    """
+    Cold storage for old resume versions in the S3 bucket.
+
+    History is archived a snapshot block at a time (a snapshot and the
+    deltas up to the next one), so an archived version is rebuilt from the
+    one object holding its block. A pass writes one gzipped JSON object per
+    resume covering every block it archives, then turns those rows into
+    stubs: the metadata stays, and content, delta and search_vector are
+    cleared, which is what keeps the table and its GIN index small. The
+    block holding the current version is never archived, so saves never
+    touch the archive.
+
+    Objects are immutable and named after their version range: a pass that
+    is interrupted, or runs in two processes at once, writes the same object
+    again. Reads go through an LRU of decoded objects.
+    """
+
+    def __init__(
+        self,
+        storage=object_storage,
+        prefix: str = "version-archive",
+        after_days: int = 30,
+        keep_versions: int = 100,
+        batch_size: int = 200,
+        interval: float = 3600,
+        cache_size: int = 256,
+    ):
+        self.storage = storage
+        self.prefix = prefix.rstrip("/")
+        self.after = timedelta(days=after_days) if after_days > 0 else None
+        self.keep_versions = keep_versions
+        self.batch_size = max(1, batch_size)
+        self.interval = interval
+        self.cache = LRUCache(max_size=cache_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def key(self, resume_id: UUID, first: int, last: int) -> str:
+        return f"{self.prefix}/{resume_id}/{first:08d}-{last:08d}.json.gz"
+
+    # --- Reading ----------------------------------------------------------
+
+    async def load(self, key: str) -> Dict[int, Dict[str, Any]]:
+        """The versions stored in one object, by version number. Treat as read-only: it is cached."""
+        entries = self.cache.get(key)
+        if entries is None:
+            payload = orjson.loads(gzip.decompress(await self.storage.get_bytes(key)))
+            entries = {entry["version"]: entry for entry in payload["versions"]}
+            self.cache.set(key, entries)
+        return entries
+
+    async def rehydrate(self, rows) -> Dict[int, Dict[str, Any]]:
+        """Stored content and delta of the archived ones among `rows` (of one resume), by version."""
+        keys = {row.archive_key for row in rows if row.archive_key}
+        archived: Dict[int, Dict[str, Any]] = {}
+        for entries in await asyncio.gather(*(self.load(key) for key in keys)):
+            archived.update(entries)
+        return archived
+
+    # --- Archiving --------------------------------------------------------
+
+    async def candidates(self, db: AsyncSession) -> List[Tuple[UUID, int]]:
+        """
+        (resume id, boundary) for resumes with history to archive: every
+        version below `boundary`, a snapshot, is past a threshold.
+        """
+        previous = aliased(ResumeVersion)
+        past_threshold = []
+        if self.after is not None:
+            past_threshold.append(previous.created_at < datetime.utcnow() - self.after)
+        if self.keep_versions > 0:
+            past_threshold.append(previous.version <= Resume.current_version - self.keep_versions)
+        if not past_threshold:
+            return []
+        rows = await db.execute(
+            select(ResumeVersion.resume_id, func.max(ResumeVersion.version))
+            .join(previous, and_(
+                previous.resume_id == ResumeVersion.resume_id,
+                previous.version == ResumeVersion.version - 1,
+            ))
+            .join(Resume, Resume.id == ResumeVersion.resume_id)
+            .where(
+                ResumeVersion.is_snapshot.is_(True),
+                previous.archive_key.is_(None),
+                or_(*past_threshold),
+            )
+            .group_by(ResumeVersion.resume_id)
+            .limit(self.batch_size)
+        )
+        return [tuple(row) for row in rows.all()]
+
+    async def archive_resume(self, db: AsyncSession, resume_id: UUID, boundary: int) -> int:
+        """Archive the resume's unarchived versions below `boundary`; returns how many."""
+        rows = (await db.execute(
+            select(
+                ResumeVersion.version,
+                ResumeVersion.is_snapshot,
+                ResumeVersion.content,
+                ResumeVersion.delta,
+                ResumeVersion.content_hash,
+            )
+            .where(
+                ResumeVersion.resume_id == resume_id,
+                ResumeVersion.version < boundary,
+                ResumeVersion.archive_key.is_(None),
+            )
+            .order_by(ResumeVersion.version)
+        )).all()
+        # Not holding a connection during the upload.
+        await db.commit()
+        if not rows:
+            return 0
+        if not rows[0].is_snapshot:
+            logger.warning("Resume %s: version %s to archive has no snapshot", resume_id, rows[0].version)
+            return 0
+
+        first, last = rows[0].version, rows[-1].version
+        key = self.key(resume_id, first, last)
+        body = orjson.dumps({
+            "resume_id": str(resume_id),
+            "versions": [
+                {
+                    "version": row.version,
+                    "is_snapshot": row.is_snapshot,
+                    "content": row.content if row.is_snapshot else None,
+                    "delta": None if row.is_snapshot else row.delta,
+                    "content_hash": row.content_hash,
+                }
+                for row in rows
+            ],
+        })
+        await self.storage.put_bytes(key, gzip.compress(body, compresslevel=6), "application/gzip")
+
+        # Versions below the current block are never written again, so the
+        # rows read above are still what was uploaded.
+        result = await db.execute(
+            update(ResumeVersion)
+            .where(
+                ResumeVersion.resume_id == resume_id,
+                ResumeVersion.version.between(first, last),
+                ResumeVersion.archive_key.is_(None),
+            )
+            .values(archive_key=key, content=null(), delta=null(), search_vector=null())
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if not result.rowcount and await db.scalar(select(Resume.id).where(Resume.id == resume_id)) is None:
+            # Deleted while we uploaded.
+            await self.delete([key])
+        return result.rowcount
+
+    async def archive_pass(self) -> Tuple[int, int]:
+        """One round over up to batch_size resumes; returns (resumes, versions) archived."""
+        archived = 0
+        async with SessionLocal() as db:
+            candidates = await self.candidates(db)
+            await db.commit()
+            for resume_id, boundary in candidates:
+                archived += await self.archive_resume(db, resume_id, boundary)
+        return len(candidates), archived
+
+    async def delete(self, keys: List[str]) -> None:
+        """Remove archive objects, e.g. of a deleted resume. Failures are logged, not raised."""
+        if not keys:
+            return
+        for key in keys:
+            self.cache.delete(key)
+        try:
+            await self.storage.delete(keys)
+        except Exception:
+            logger.exception("Could not delete %s archived version objects", len(keys))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                # A full pass means there is probably more to do right away.
+                while (await self.archive_pass())[0] >= self.batch_size:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Version archival pass failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+version_archive = VersionArchive(
+    prefix=settings.RESUME_ARCHIVE_PREFIX,
+    after_days=settings.RESUME_ARCHIVE_AFTER_DAYS,
+    keep_versions=settings.RESUME_ARCHIVE_KEEP_VERSIONS,
+    batch_size=settings.RESUME_ARCHIVE_BATCH_SIZE,
+    # Nowhere to archive to without a bucket.
+    interval=settings.RESUME_ARCHIVE_INTERVAL_SECONDS if settings.AWS_S3_BUCKET else 0,
+    cache_size=settings.RESUME_ARCHIVE_CACHE_SIZE,
+)
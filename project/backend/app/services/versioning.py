@@ -0,0 +1,257 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import String, cast, func, insert, literal, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.hashing import content_hash
+from app.core.json_patch import apply_patch, make_patch
+from app.models.resume import Resume, ResumeVersion
+from app.services.version_archive import VersionArchive, version_archive
+
+
+class ResumeVersionService:
+    """
+    Stores resume history as a full snapshot every
+    RESUME_VERSION_SNAPSHOT_INTERVAL versions with JSON-patch deltas in
+    between, so rebuilding any version replays at most interval - 1 patches.
+
+    Saves whose content hash matches the current version are no-ops, and
+    saves from the same source within the coalescing window of the latest
+    version's creation overwrite it instead of adding a row.
+
+    Old snapshot blocks may have been moved to object storage by the
+    VersionArchive; reads fetch them back from there transparently.
+    """
+
+    def __init__(
+        self,
+        snapshot_interval: Optional[int] = None,
+        coalesce_seconds: Optional[int] = None,
+        archive: VersionArchive = version_archive,
+    ):
+        self.archive = archive
+        self.snapshot_interval = max(1, snapshot_interval or settings.RESUME_VERSION_SNAPSHOT_INTERVAL)
+        if coalesce_seconds is None:
+            coalesce_seconds = settings.RESUME_VERSION_COALESCE_SECONDS
+        self.coalesce_window = timedelta(seconds=coalesce_seconds)
+
+    def is_snapshot_version(self, version: int) -> bool:
+        return (version - 1) % self.snapshot_interval == 0
+
+    @staticmethod
+    def search_vector(resume_id: UUID, content: Dict[str, Any]):
+        """SQL for a version's search vector, in its resume's language."""
+        language = select(Resume.language).where(Resume.id == resume_id).scalar_subquery()
+        return func.resume_search_vector(language, None, literal(content, JSONB))
+
+    def build_version(
+        self,
+        resume_id: UUID,
+        version: int,
+        content: Dict[str, Any],
+        previous_content: Optional[Dict[str, Any]] = None,
+        source: str = "manual",
+    ) -> ResumeVersion:
+        if previous_content is None or self.is_snapshot_version(version):
+            return ResumeVersion(
+                resume_id=resume_id,
+                version=version,
+                is_snapshot=True,
+                content=content,
+                content_hash=content_hash(content),
+                search_vector=self.search_vector(resume_id, content),
+                source=source,
+            )
+
+        return ResumeVersion(
+            resume_id=resume_id,
+            version=version,
+            is_snapshot=False,
+            delta=make_patch(previous_content, content),
+            content_hash=content_hash(content),
+            search_vector=self.search_vector(resume_id, content),
+            source=source,
+        )
+
+    async def add_first_versions(
+        self,
+        db: AsyncSession,
+        resumes: List[Dict[str, Any]],
+        source: str = "manual",
+    ) -> None:
+        """
+        Version 1 of each resume in `resumes` (dicts with "id" and "content"),
+        which must already be inserted in this transaction. One INSERT ...
+        SELECT for all of them: content and search vectors come from the
+        resume rows rather than being sent again.
+        """
+        if not resumes:
+            return
+        now = datetime.utcnow()
+        batch = func.unnest(
+            cast([uuid.uuid4() for _ in resumes], ARRAY(PG_UUID(as_uuid=True))),
+            cast([resume["id"] for resume in resumes], ARRAY(PG_UUID(as_uuid=True))),
+            cast([content_hash(resume["content"]) for resume in resumes], ARRAY(String)),
+        ).table_valued("id", "resume_id", "content_hash").render_derived()
+        await db.execute(insert(ResumeVersion).from_select(
+            [
+                "id", "resume_id", "version", "is_snapshot", "content", "content_hash",
+                "source", "created_at", "updated_at", "search_vector",
+            ],
+            select(
+                batch.c.id,
+                Resume.id,
+                literal(1),
+                true(),
+                Resume.content,
+                batch.c.content_hash,
+                literal(source),
+                literal(now),
+                literal(now),
+                func.resume_search_vector(Resume.language, None, Resume.content),
+            ).join(batch, batch.c.resume_id == Resume.id),
+        ))
+
+    async def save_content(
+        self,
+        db: AsyncSession,
+        resume: Resume,
+        content: Dict[str, Any],
+        source: str = "manual",
+    ) -> Optional[ResumeVersion]:
+        """
+        Record `content` as the resume's current content. Returns the new or
+        overwritten version row, or None when the content is unchanged.
+        """
+        latest = await db.scalar(
+            select(ResumeVersion).where(
+                ResumeVersion.resume_id == resume.id,
+                ResumeVersion.version == resume.current_version,
+            )
+        )
+        new_hash = content_hash(content)
+        if latest is not None and latest.content_hash == new_hash:
+            return None
+
+        if latest is not None and self._can_coalesce(latest, source):
+            await self._overwrite(db, latest, content, new_hash)
+            resume.content = content
+            return latest
+
+        version = self.build_version(
+            resume_id=resume.id,
+            version=resume.current_version + 1,
+            content=content,
+            previous_content=resume.content,
+            source=source,
+        )
+        db.add(version)
+        resume.current_version = version.version
+        resume.content = content
+        return version
+
+    def _can_coalesce(self, latest: ResumeVersion, source: str) -> bool:
+        if not self.coalesce_window or latest.source != source:
+            return False
+        # Counted from when the version was created, not from its last
+        # overwrite: a steady stream of saves still gets a version per window.
+        return latest.created_at is not None and datetime.utcnow() - latest.created_at < self.coalesce_window
+
+    async def _overwrite(
+        self,
+        db: AsyncSession,
+        latest: ResumeVersion,
+        content: Dict[str, Any],
+        new_hash: str,
+    ) -> None:
+        latest.content_hash = new_hash
+        latest.search_vector = self.search_vector(latest.resume_id, content)
+        if latest.is_snapshot:
+            latest.content = content
+            return
+        previous = await self.get_content(db, latest.resume_id, latest.version - 1)
+        latest.delta = make_patch(previous, content)
+
+    async def get_content(
+        self,
+        db: AsyncSession,
+        resume_id: UUID,
+        version: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Rebuild the content of one version from its nearest snapshot."""
+        base = (
+            select(func.max(ResumeVersion.version))
+            .where(
+                ResumeVersion.resume_id == resume_id,
+                ResumeVersion.version <= version,
+                ResumeVersion.is_snapshot.is_(True),
+            )
+            .scalar_subquery()
+        )
+        rows = await db.scalars(
+            select(ResumeVersion)
+            .where(
+                ResumeVersion.resume_id == resume_id,
+                ResumeVersion.version >= base,
+                ResumeVersion.version <= version,
+            )
+            .order_by(ResumeVersion.version)
+        )
+        chain = rows.all()
+        if not chain or chain[-1].version != version:
+            return None
+        return self.replay(chain, await self.rehydrate(chain))[-1][1]
+
+    async def get_history(
+        self,
+        db: AsyncSession,
+        resume_id: UUID,
+    ) -> List[Tuple[ResumeVersion, Dict[str, Any]]]:
+        """Return every version of a resume with its rebuilt content, newest first."""
+        rows = await db.scalars(
+            select(ResumeVersion)
+            .where(ResumeVersion.resume_id == resume_id)
+            .order_by(ResumeVersion.version)
+        )
+        chain = rows.all()
+        return list(reversed(self.replay(chain, await self.rehydrate(chain))))
+
+    async def rehydrate(self, rows: List[ResumeVersion]) -> Dict[int, Dict[str, Any]]:
+        """What replay() needs for the archived ones among `rows`, fetched from the archive."""
+        if not any(row.archive_key for row in rows):
+            return {}
+        return await self.archive.rehydrate(rows)
+
+    def replay(
+        self,
+        rows: List[ResumeVersion],
+        archived: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> List[Tuple[ResumeVersion, Dict[str, Any]]]:
+        """
+        Rebuild content for rows ordered by version, starting at a snapshot.
+        Archived rows are stubs: their content and delta come from
+        `archived`, as returned by rehydrate().
+        """
+        history = []
+        content = None
+        for row in rows:
+            stored = archived[row.version] if row.archive_key else None
+            if row.is_snapshot:
+                content = stored["content"] if stored else row.content
+            elif content is None:
+                raise ValueError(
+                    f"Version {row.version} of resume {row.resume_id} has no base snapshot"
+                )
+            else:
+                delta = stored["delta"] if stored else row.delta
+                content = apply_patch(content, delta or [])
+            history.append((row, content))
+        return history
+
+
+resume_version_service = ResumeVersionService()
@@ -0,0 +1,102 @@
+"""
+Request bytes and server CPU per autosave, replaying the same synthetic edit
+history as full-document PUTs and as JSON Patch PATCHes.
+
+Server CPU is process time spent inside the app per request (the client's
+share is excluded), so it covers validation, diffing, hashing and the
+database driver.
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.autosave_patch --saves 200 --experiences 10
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from benchmarks.common import app_client, reset_schema
+
+from app.core.json_patch import make_patch
+from app.main import app
+from benchmarks.synthetic import edit_history
+
+
+class ServerCPU:
+    """ASGI wrapper recording the process time spent in each request."""
+
+    def __init__(self, app):
+        self.app = app
+        self.samples = []
+
+    async def __call__(self, scope, receive, send):
+        started = time.process_time()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if scope["type"] == "http":
+                self.samples.append(time.process_time() - started)
+
+
+def body_size(payload) -> int:
+    return len(json.dumps(payload).encode())
+
+
+async def replay(client, headers, meter, history, mode: str) -> dict:
+    created = await client.post("/api/v1/resumes/", json={"content": history[0]}, headers=headers)
+    resume = created.json()
+    meter.samples.clear()
+    sent = received = 0
+    previous = history[0]
+    for content in history[1:]:
+        if mode == "put":
+            payload = {"content": content}
+            response = await client.put(f"/api/v1/resumes/{resume['id']}", json=payload, headers=headers)
+        else:
+            payload = {"base_version": resume["current_version"], "operations": make_patch(previous, content)}
+            response = await client.patch(f"/api/v1/resumes/{resume['id']}", json=payload, headers=headers)
+        response.raise_for_status()
+        resume = response.json()
+        sent += body_size(payload)
+        received += len(response.content)
+        previous = content
+    cpu = sum(meter.samples)
+
+    stored = (await client.get(f"/api/v1/resumes/{resume['id']}", headers=headers)).json()["content"]
+    assert stored == history[-1], f"{mode}: stored content differs from the last save"
+
+    saves = len(history) - 1
+    return {
+        "request_bytes_per_save": round(sent / saves),
+        "response_bytes_per_save": round(received / saves),
+        "server_cpu_ms_per_save": round(cpu / saves * 1000, 3),
+    }
+
+
+async def run(saves: int, experiences: int) -> dict:
+    history = edit_history(saves, experiences=experiences)
+    meter = ServerCPU(app)
+    async with app_client(meter) as client:
+        credentials = {"email": f"{uuid.uuid4()}@example.com", "password": "benchmark-password"}
+        await client.post("/api/v1/auth/register", json=credentials)
+        token = (await client.post("/api/v1/auth/login", json=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        return {
+            mode: await replay(client, headers, meter, history, mode)
+            for mode in ("put", "patch")
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--saves", type=int, default=200)
+    parser.add_argument("--experiences", type=int, default=10)
+    args = parser.parse_args()
+
+    reset_schema()
+    results = asyncio.run(run(args.saves + 1, args.experiences))
+    print(json.dumps({"saves": args.saves, "experiences": args.experiences, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Bulk NDJSON import against one POST /resumes per resume, then the NDJSON
+export of accounts of growing size: its throughput over HTTP, and the peak
+Python memory allocated while generating it (tracemalloc), which should
+stay flat as the account grows. The peak is taken on the export generator
+itself: httpx's in-process ASGI transport buffers whole responses.
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bulk_transfer --resumes 2000 --accounts 1000,10000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+import uuid
+
+from benchmarks.common import app_client, reset_schema
+from benchmarks.synthetic import make_resume
+
+from app.core.database import read_session
+from app.main import app
+from app.services.resume_transfer import resume_transfer_service
+
+
+def records(count: int, experiences: int, seed: int = 3):
+    rng = random.Random(seed)
+    for number in range(count):
+        yield {
+            "title": f"Imported {number}",
+            "language": rng.choice(["en", "ru", "fr"]),
+            "content": make_resume(rng, experiences),
+        }
+
+
+async def new_user(client) -> dict:
+    credentials = {"email": f"bulk-{uuid.uuid4().hex[:12]}@example.com", "password": "benchmark-pw"}
+    (await client.post("/api/v1/auth/register", json=credentials)).raise_for_status()
+    token = (await client.post("/api/v1/auth/login", json=credentials)).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def one_by_one(client, count: int, experiences: int) -> float:
+    headers = await new_user(client)
+    started = time.perf_counter()
+    for record in records(count, experiences):
+        (await client.post("/api/v1/resumes/", json=record, headers=headers)).raise_for_status()
+    return time.perf_counter() - started
+
+
+async def bulk(client, count: int, experiences: int, headers=None) -> float:
+    headers = headers or await new_user(client)
+
+    async def body():
+        for record in records(count, experiences):
+            yield json.dumps(record).encode() + b"\n"
+
+    started = time.perf_counter()
+    response = await client.post("/api/v1/resumes/import", content=body(), headers=headers, timeout=None)
+    response.raise_for_status()
+    assert response.json()["imported"] == count, response.json()
+    return time.perf_counter() - started
+
+
+async def export(client, headers, include_versions: bool) -> dict:
+    started = time.perf_counter()
+    params = {"include_versions": str(include_versions).lower()}
+    response = await client.get("/api/v1/resumes/export", params=params, headers=headers, timeout=None)
+    response.raise_for_status()
+    return {"bytes": len(response.content), "seconds": time.perf_counter() - started}
+
+
+async def export_peak(user_id: str, include_versions: bool) -> int:
+    tracemalloc.start()
+    async with read_session() as session:
+        async for _ in resume_transfer_service.export_ndjson(session, user_id, include_versions):
+            pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+async def run(args) -> None:
+    reset_schema()
+    async with app_client(app) as client:
+        single = await one_by_one(client, args.resumes, args.experiences)
+        batched = await bulk(client, args.resumes, args.experiences)
+        print(f"{args.resumes} resumes, {args.experiences} work experiences each")
+        print(f"  POST /resumes one by one  {single:6.2f} s  {args.resumes / single:7.0f} resumes/s")
+        print(f"  POST /resumes/import      {batched:6.2f} s  {args.resumes / batched:7.0f} resumes/s  "
+              f"({single / batched:.1f}x)")
+
+        print("\nexport")
+        for size in args.accounts:
+            headers = await new_user(client)
+            await bulk(client, size, args.experiences, headers)
+            user_id = (await client.get("/api/v1/users/me", headers=headers)).json()["id"]
+            for include_versions in (False, True):
+                result = await export(client, headers, include_versions)
+                peak = await export_peak(user_id, include_versions)
+                label = "with versions" if include_versions else "resumes only"
+                print(f"  {size:6} resumes, {label:<14} {result['bytes'] / 2**20:7.1f} MiB "
+                      f"in {result['seconds']:5.2f} s, peak {peak / 2**20:5.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=2000, help="resumes imported each way")
+    parser.add_argument("--accounts", default="1000,10000", help="comma-separated account sizes to export")
+    parser.add_argument("--experiences", type=int, default=3)
+    args = parser.parse_args()
+    args.accounts = [int(size) for size in args.accounts.split(",")]
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Helpers for benchmarks that drive the FastAPI app in-process.
+
+They need a throwaway Postgres database: set BENCH_DATABASE_URL (its tables
+are dropped and recreated) before running them. Without Docker or a local
+Postgres, `pip install pgserver` and set BENCH_PGSERVER_DIR to a scratch
+directory instead: a private Postgres is started there for the run.
+"""
+import os
+import sys
+import uuid
+
+if "BENCH_DATABASE_URL" not in os.environ and os.environ.get("BENCH_PGSERVER_DIR"):
+    try:
+        import pgserver
+    except ImportError:
+        sys.exit("BENCH_PGSERVER_DIR needs the pgserver package: pip install pgserver")
+    _server = pgserver.get_server(os.environ["BENCH_PGSERVER_DIR"], cleanup_mode="stop")
+    os.environ["BENCH_DATABASE_URL"] = _server.get_uri()
+
+if "BENCH_DATABASE_URL" not in os.environ:
+    sys.exit(
+        "Set BENCH_DATABASE_URL to a throwaway Postgres database (it gets wiped), "
+        "or BENCH_PGSERVER_DIR to start one with pgserver."
+    )
+os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+
+from typing import List
+
+import httpx
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.subscription import Plan, PlanType
+import app.models  # noqa: F401  (register tables on Base.metadata)
+
+
+def reset_schema() -> None:
+    engine = create_engine(settings.DATABASE_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    # Registration puts users on the free plan, which migrations seed.
+    with engine.begin() as conn:
+        conn.execute(Plan.__table__.insert().values(
+            id=uuid.uuid4(),
+            name=PlanType.FREE,
+            display_name="Free",
+            max_exports_per_month=10,
+            max_translations_per_month=5,
+        ))
+    engine.dispose()
+
+
+def app_client(asgi_app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://bench")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize_ms(values: List[float]) -> dict:
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+    }
@@ -0,0 +1,78 @@
+"""
+Compare two reports from benchmarks.load endpoint by endpoint. Exits 1 when
+an endpoint's p95 latency rose, or its throughput fell, by more than
+--threshold percent, so it can gate a change in CI.
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+"""
+import argparse
+import json
+import sys
+from typing import Optional
+
+
+def change(base: Optional[float], head: Optional[float]) -> Optional[float]:
+    if not base or head is None:
+        return None
+    return (head - base) / base * 100
+
+
+def cell(base: Optional[float], head: Optional[float]) -> str:
+    delta = change(base, head)
+    if delta is None:
+        return f"{'-' if base is None else base} -> {'-' if head is None else head}"
+    return f"{base} -> {head} ({delta:+.0f}%)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression, percent")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+
+    print(f"base {base['meta'].get('commit')}  head {head['meta'].get('commit')}")
+    base_args, head_args = base["meta"].get("args", {}), head["meta"].get("args", {})
+    differing = sorted(key for key in base_args.keys() | head_args.keys() if base_args.get(key) != head_args.get(key))
+    if differing:
+        print(f"warning: reports were run with different arguments: {', '.join(differing)}")
+    columns = ("endpoint", "p50 ms", "p95 ms", "p99 ms", "req/s", "errors")
+    rows = []
+    regressions = []
+    for endpoint in list(base["endpoints"]) + [e for e in head["endpoints"] if e not in base["endpoints"]]:
+        old = base["endpoints"].get(endpoint, {})
+        new = head["endpoints"].get(endpoint, {})
+        rows.append((
+            endpoint,
+            cell(old.get("p50_ms"), new.get("p50_ms")),
+            cell(old.get("p95_ms"), new.get("p95_ms")),
+            cell(old.get("p99_ms"), new.get("p99_ms")),
+            cell(old.get("throughput_rps"), new.get("throughput_rps")),
+            f"{sum(old.get('errors', {}).values())} -> {sum(new.get('errors', {}).values())}",
+        ))
+
+        latency = change(old.get("p95_ms"), new.get("p95_ms"))
+        throughput = change(old.get("throughput_rps"), new.get("throughput_rps"))
+        if latency is not None and latency > args.threshold:
+            regressions.append(f"{endpoint}: p95 {latency:+.0f}%")
+        if throughput is not None and -throughput > args.threshold:
+            regressions.append(f"{endpoint}: throughput {throughput:+.0f}%")
+
+    widths = [max(len(str(row[i])) for row in rows + [columns]) for i in range(len(columns))]
+    for row in [columns] + rows:
+        print("  ".join(str(value).ljust(width) for value, width in zip(row, widths)))
+
+    if regressions:
+        print(f"\nRegressed by more than {args.threshold:g}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
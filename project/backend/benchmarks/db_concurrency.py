@@ -0,0 +1,75 @@
+"""
+Throughput of concurrent "requests" that each run one database round-trip,
+comparing the old pattern (sync psycopg2 session called from an async
+handler) with the AsyncSession used by the API.
+
+    python -m benchmarks.db_concurrency --requests 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+
+QUERY = text("SELECT pg_sleep(:delay)")
+
+
+async def run_sync(requests: int, concurrency: int, delay: float) -> float:
+    engine = create_engine(settings.DATABASE_URL, pool_size=concurrency, max_overflow=0)
+    Session = sessionmaker(bind=engine)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handler():
+        async with semaphore:
+            with Session() as db:
+                db.execute(QUERY, {"delay": delay})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handler() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+    return elapsed
+
+
+async def run_async(requests: int, concurrency: int, delay: float) -> float:
+    engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL, pool_size=concurrency, max_overflow=0
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handler():
+        async with semaphore:
+            async with engine.connect() as conn:
+                await conn.execute(QUERY, {"delay": delay})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handler() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.02, help="simulated query time (s)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, runner in (("sync_session", run_sync), ("async_session", run_async)):
+        elapsed = await runner(args.requests, args.concurrency, args.delay)
+        results[name] = {
+            "seconds": round(elapsed, 3),
+            "requests_per_second": round(args.requests / elapsed, 1),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+"""
+Stand-in for the Anthropic Messages API, for exercising AI translation
+without a real model. Replies to each message with the JSON it was sent,
+every string tagged with the target language, after a delay proportional
+to the output length so timings behave like token generation.
+
+    uvicorn benchmarks.fake_model:app --port 8001
+    ANTHROPIC_BASE_URL=http://localhost:8001 uvicorn app.main:app
+
+In-process benchmarks use `fake_client()` instead.
+"""
+import asyncio
+import json
+import os
+import re
+import uuid
+from typing import Any
+
+import httpx
+from anthropic import AsyncAnthropic
+from fastapi import FastAPI, Request
+
+# Seconds per output token (~4 characters), and per request.
+TOKEN_SECONDS = float(os.environ.get("FAKE_MODEL_TOKEN_SECONDS", "0.002"))
+REQUEST_SECONDS = float(os.environ.get("FAKE_MODEL_REQUEST_SECONDS", "0.3"))
+
+app = FastAPI()
+
+
+def _tag(value: Any, tag: str) -> Any:
+    if isinstance(value, dict):
+        return {key: _tag(item, tag) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_tag(item, tag) for item in value]
+    if isinstance(value, str):
+        return f"[{tag}] {value}"
+    return value
+
+
+@app.post("/v1/messages")
+async def create_message(request: Request):
+    body = await request.json()
+    match = re.search(r"to (\w+)\.", body.get("system") or "")
+    tag = match.group(1).lower()[:2] if match else "xx"
+    prompt = body["messages"][-1]["content"]
+    try:
+        text = json.dumps(_tag(json.loads(prompt), tag), ensure_ascii=False)
+    except json.JSONDecodeError:
+        text = f"[{tag}] {prompt}"
+
+    output_tokens = len(text) // 4 + 1
+    await asyncio.sleep(REQUEST_SECONDS + output_tokens * TOKEN_SECONDS)
+    return {
+        "id": f"msg_{uuid.uuid4().hex}",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": len(prompt) // 4 + 1, "output_tokens": output_tokens},
+    }
+
+
+def fake_client() -> AsyncAnthropic:
+    """An Anthropic client that talks to this app in-process."""
+    return AsyncAnthropic(
+        api_key="fake",
+        base_url="http://fake-model",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
@@ -0,0 +1,37 @@
+"""
+Stand-in for ObjectStorage that keeps objects in a local directory, for
+exercising PDF export and version archival without S3.
+"""
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+
+class LocalObjectStorage:
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or tempfile.mkdtemp(prefix="bench-s3-"))
+
+    async def upload_file(self, path: Path, key: str, content_type: str) -> None:
+        target = self.root / key
+        await asyncio.to_thread(target.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(shutil.copyfile, path, target)
+
+    async def put_bytes(self, key: str, body: bytes, content_type: str) -> None:
+        target = self.root / key
+        await asyncio.to_thread(target.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(target.write_bytes, body)
+
+    async def get_bytes(self, key: str) -> bytes:
+        return await asyncio.to_thread((self.root / key).read_bytes)
+
+    async def delete(self, keys: List[str]) -> None:
+        for key in keys:
+            (self.root / key).unlink(missing_ok=True)
+
+    async def exists(self, key: str) -> bool:
+        return (self.root / key).exists()
+
+    async def presigned_url(self, key: str, expires_in: int = 3600) -> str:
+        return (self.root / key).as_uri()
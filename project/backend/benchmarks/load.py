@@ -0,0 +1,387 @@
+"""
+Load test for the API. Seeds synthetic users, resumes and version
+histories, then drives each endpoint in turn at a fixed concurrency against
+the app running in-process, and reports throughput, latency percentiles and
+errors per endpoint as JSON. Compare two reports with benchmarks.compare.
+
+PDF export stores files in a local directory instead of S3 and translation
+talks to benchmarks.fake_model in-process (FAKE_MODEL_* set its delays).
+Plan limits are lifted so quotas don't turn the load into 429s.
+
+Needs Postgres: BENCH_DATABASE_URL, or BENCH_PGSERVER_DIR for a private
+one without Docker (see benchmarks.common).
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.load --output base.json
+    python -m benchmarks.load --users 50 --versions 200 --concurrency 32 \\
+        --scenarios get,patch,list --output head.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import subprocess
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import app_client, reset_schema, summarize_ms
+
+import httpx
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.core.security import create_access_token, get_password_hash
+from app.main import app
+from app.models.resume import Resume
+from app.models.subscription import Plan
+from app.models.user import User
+from app.schemas.resume import ResumeContent
+from app.services.ai_translation import ai_translation_service
+from app.services.export import export_service
+from app.services.quota import quota_service
+from app.services.versioning import resume_version_service
+from benchmarks.fake_model import fake_client
+from benchmarks.fake_storage import LocalObjectStorage
+from benchmarks.synthetic import WORDS, edit_history, make_resume
+
+logger = logging.getLogger(__name__)
+
+PASSWORD = "bench-password"
+SLOW_SCENARIOS = ("export", "translate")
+
+
+@dataclass
+class SeededResume:
+    id: str
+    content: Dict[str, Any]
+    version: int
+    # Serializes PATCHes to one resume so they don't conflict on base_version.
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+@dataclass
+class SeededUser:
+    email: str
+    headers: Dict[str, str]
+    resumes: List[SeededResume]
+
+
+class Recorder:
+    """Latency and status of every request, per endpoint."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+        self.wall_time: Dict[str, float] = defaultdict(float)
+        self.exceptions: Counter = Counter()
+
+    def add(self, endpoint: str, seconds: float, status: int) -> None:
+        self.latencies[endpoint].append(seconds)
+        if status >= 400:
+            self.errors[endpoint][str(status)] += 1
+
+    def response(self, endpoint: str, response: httpx.Response) -> httpx.Response:
+        self.add(endpoint, response.elapsed.total_seconds(), response.status_code)
+        return response
+
+    def report(self) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, latencies in self.latencies.items():
+            wall_time = self.wall_time[endpoint]
+            endpoints[endpoint] = {
+                **summarize_ms(latencies),
+                "throughput_rps": round(len(latencies) / wall_time, 2) if wall_time else None,
+                "errors": dict(self.errors[endpoint]),
+            }
+        return endpoints
+
+
+class Load:
+    def __init__(self, client: httpx.AsyncClient, users: List[SeededUser], experiences: int, seed: int):
+        self.client = client
+        self.users = users
+        self.experiences = experiences
+        self.rng = random.Random(seed)
+        self.recorder = Recorder()
+
+    def pick(self):
+        user = self.rng.choice(self.users)
+        return user, self.rng.choice(user.resumes)
+
+    def edited(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """`content` with a word typed into the summary, as an autosave would send."""
+        info = dict(content["personal_info"])
+        info["summary"] = f"{info.get('summary') or ''} {self.rng.choice(WORDS)}".strip()
+        return {**content, "personal_info": info}
+
+    # --- Scenarios: one request (or request flow) each ----------------------
+
+    async def register(self):
+        credentials = {"email": f"new-{uuid.uuid4().hex}@bench.example", "password": PASSWORD}
+        self.recorder.response(
+            "POST /auth/register",
+            await self.client.post("/api/v1/auth/register", json=credentials),
+        )
+
+    async def login(self):
+        user = self.rng.choice(self.users)
+        credentials = {"email": user.email, "password": PASSWORD}
+        self.recorder.response(
+            "POST /auth/login",
+            await self.client.post("/api/v1/auth/login", json=credentials),
+        )
+
+    async def create(self):
+        user = self.rng.choice(self.users)
+        body = {"content": make_resume(self.rng, self.experiences)}
+        self.recorder.response(
+            "POST /resumes",
+            await self.client.post("/api/v1/resumes/", json=body, headers=user.headers),
+        )
+
+    async def get(self):
+        user, resume = self.pick()
+        self.recorder.response(
+            "GET /resumes/{id}",
+            await self.client.get(f"/api/v1/resumes/{resume.id}", headers=user.headers),
+        )
+
+    async def update(self):
+        user, resume = self.pick()
+        resume.content = self.edited(resume.content)
+        response = self.recorder.response(
+            "PUT /resumes/{id}",
+            await self.client.put(
+                f"/api/v1/resumes/{resume.id}", json={"content": resume.content}, headers=user.headers
+            ),
+        )
+        if response.is_success:
+            resume.version = response.json()["current_version"]
+
+    async def patch(self):
+        user, resume = self.pick()
+        async with resume.lock:
+            content = self.edited(resume.content)
+            body = {
+                "base_version": resume.version,
+                "operations": [{
+                    "op": "replace",
+                    "path": "/personal_info/summary",
+                    "value": content["personal_info"]["summary"],
+                }],
+            }
+            response = self.recorder.response(
+                "PATCH /resumes/{id}",
+                await self.client.patch(f"/api/v1/resumes/{resume.id}", json=body, headers=user.headers),
+            )
+            if response.is_success:
+                resume.content = content
+                resume.version = response.json()["current_version"]
+
+    async def list(self):
+        user = self.rng.choice(self.users)
+        self.recorder.response(
+            "GET /resumes",
+            await self.client.get("/api/v1/resumes/", headers=user.headers),
+        )
+
+    async def list_content(self):
+        user = self.rng.choice(self.users)
+        self.recorder.response(
+            "GET /resumes?include=content",
+            await self.client.get("/api/v1/resumes/", params={"include": "content"}, headers=user.headers),
+        )
+
+    async def versions(self):
+        user, resume = self.pick()
+        self.recorder.response(
+            "GET /resumes/{id}/versions",
+            await self.client.get(f"/api/v1/resumes/{resume.id}/versions", headers=user.headers),
+        )
+
+    async def version(self):
+        user, resume = self.pick()
+        number = self.rng.randint(1, resume.version)
+        self.recorder.response(
+            "GET /resumes/{id}/versions/{version}",
+            await self.client.get(f"/api/v1/resumes/{resume.id}/versions/{number}", headers=user.headers),
+        )
+
+    async def export(self):
+        user, resume = self.pick()
+        started = time.perf_counter()
+        response = self.recorder.response(
+            "POST /resumes/{id}/export",
+            await self.client.post(f"/api/v1/resumes/{resume.id}/export", headers=user.headers),
+        )
+        job = response.json() if response.is_success else {"status": "failed"}
+        while job["status"] in ("pending", "processing"):
+            response = self.recorder.response(
+                "GET /resumes/{id}/exports/{export_id} (wait)",
+                await self.client.get(
+                    f"/api/v1/resumes/{resume.id}/exports/{job['id']}",
+                    params={"wait": 10},
+                    headers=user.headers,
+                ),
+            )
+            job = response.json() if response.is_success else {"status": "failed"}
+        # Enqueue to downloadable PDF, as the user experiences it.
+        self.recorder.add(
+            "export: enqueue to completed",
+            time.perf_counter() - started,
+            200 if job["status"] == "completed" else 500,
+        )
+
+    async def translate(self):
+        user, resume = self.pick()
+        self.recorder.response(
+            "POST /resumes/{id}/translate",
+            await self.client.post(
+                f"/api/v1/resumes/{resume.id}/translate",
+                json={"target_language": "fr"},
+                headers=user.headers,
+            ),
+        )
+
+
+SCENARIOS = (
+    "register", "login", "create", "get", "update", "patch", "list", "list_content",
+    "versions", "version", "export", "translate",
+)
+
+
+async def drive(load: Load, scenario: str, requests: int, concurrency: int) -> None:
+    """Run `requests` iterations of a scenario, `concurrency` at a time."""
+    call = getattr(load, scenario)
+    remaining = iter(range(requests))
+    before = {endpoint: len(latencies) for endpoint, latencies in load.recorder.latencies.items()}
+
+    async def worker():
+        for _ in remaining:
+            try:
+                await call()
+            except Exception:
+                if not load.recorder.exceptions[scenario]:
+                    logger.exception("Scenario %s raised", scenario)
+                load.recorder.exceptions[scenario] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    for endpoint, latencies in load.recorder.latencies.items():
+        if len(latencies) > before.get(endpoint, 0):
+            load.recorder.wall_time[endpoint] += elapsed
+
+
+async def seed(users: int, resumes_per_user: int, versions: int, experiences: int) -> List[SeededUser]:
+    """Insert users with resumes and version histories directly, bypassing the API."""
+    hashed_password = get_password_hash(PASSWORD)
+    seeded = []
+    async with SessionLocal() as db:
+        await db.execute(update(Plan).values(max_exports_per_month=None, max_translations_per_month=None))
+        for user_number in range(users):
+            user = User(email=f"user{user_number}@bench.example", hashed_password=hashed_password)
+            db.add(user)
+            await db.flush()
+
+            resumes = []
+            for resume_number in range(resumes_per_user):
+                history = [
+                    ResumeContent.model_validate(content).model_dump()
+                    for content in edit_history(
+                        versions, seed=user_number * resumes_per_user + resume_number, experiences=experiences
+                    )
+                ]
+                resume = Resume(
+                    user_id=user.id,
+                    title=f"Resume {resume_number}",
+                    content=history[-1],
+                    current_version=len(history),
+                )
+                db.add(resume)
+                await db.flush()
+                previous = None
+                for number, content in enumerate(history, start=1):
+                    db.add(resume_version_service.build_version(resume.id, number, content, previous))
+                    previous = content
+                resumes.append(SeededResume(str(resume.id), history[-1], len(history)))
+
+            token = create_access_token(subject=str(user.id))
+            seeded.append(SeededUser(user.email, {"Authorization": f"Bearer {token}"}, resumes))
+            await quota_service.ensure_subscription(db, user.id)
+        await db.commit()
+    return seeded
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> Dict[str, Any]:
+    reset_schema()
+    started = time.perf_counter()
+    users = await seed(args.users, args.resumes_per_user, args.versions, args.experiences)
+    seed_seconds = time.perf_counter() - started
+
+    export_service.storage = LocalObjectStorage()
+    ai_translation_service.client = fake_client()
+
+    async with app.router.lifespan_context(app), app_client(app) as client:
+        load = Load(client, users, args.experiences, args.seed)
+        for scenario in args.scenarios:
+            requests = args.slow_requests if scenario in SLOW_SCENARIOS else args.requests
+            await drive(load, scenario, requests, args.concurrency)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "seed_seconds": round(seed_seconds, 2),
+            "exceptions": dict(load.recorder.exceptions),
+            "args": {key: value for key, value in vars(args).items() if key != "output"},
+        },
+        "endpoints": load.recorder.report(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--resumes-per-user", type=int, default=3)
+    parser.add_argument("--versions", type=int, default=50, help="seeded history length per resume")
+    parser.add_argument("--experiences", type=int, default=5, help="work entries per resume")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=200, help="iterations per scenario")
+    parser.add_argument("--slow-requests", type=int, default=20, help="iterations of export and translate")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated, run in order")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    args = parser.parse_args()
+
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    logging.basicConfig(level=logging.WARNING)
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
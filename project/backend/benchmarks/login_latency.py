@@ -0,0 +1,78 @@
+"""
+Login and resume-read latency while a burst of logins runs concurrently,
+with bcrypt inline on the event loop (the old behaviour) versus the
+PasswordHasher thread pool.
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.login_latency
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.common import app_client, reset_schema, summarize_ms
+
+from app.core import security
+from app.main import app
+
+
+class InlineHasher:
+    async def hash(self, password):
+        return security.get_password_hash(password)
+
+    async def verify(self, plain_password, hashed_password):
+        return security.verify_password(plain_password, hashed_password)
+
+
+async def run(logins: int, reads: int) -> dict:
+    reset_schema()
+    login_times, read_times = [], []
+    async with app.router.lifespan_context(app), app_client(app) as client:
+        credentials = {"email": "bench@example.com", "password": "bench-password"}
+        await client.post("/api/v1/auth/register", json=credentials)
+        token = (await client.post("/api/v1/auth/login", json=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        resume_id = (await client.post("/api/v1/resumes/", json={}, headers=headers)).json()["id"]
+
+        async def login():
+            started = time.perf_counter()
+            response = await client.post("/api/v1/auth/login", json=credentials)
+            login_times.append(time.perf_counter() - started)
+            return response.status_code
+
+        async def read():
+            started = time.perf_counter()
+            await client.get(f"/api/v1/resumes/{resume_id}", headers=headers)
+            read_times.append(time.perf_counter() - started)
+
+        statuses = await asyncio.gather(
+            *(login() for _ in range(logins)),
+            *(read() for _ in range(reads)),
+        )
+
+    return {
+        "login": summarize_ms(login_times),
+        "resume_read": summarize_ms(read_times),
+        "login_503": sum(1 for status in statuses if status == 503),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    from app.api.v1.endpoints import auth
+
+    results = {}
+    pooled = auth.password_hasher
+    auth.password_hasher = InlineHasher()
+    results["inline"] = await run(args.logins, args.reads)
+    auth.password_hasher = pooled
+    results["thread_pool"] = await run(args.logins, args.reads)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
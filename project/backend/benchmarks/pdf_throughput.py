@@ -0,0 +1,47 @@
+"""
+PDFs rendered per second with 1..N WeasyPrint worker processes, for a
+synthetic resume rendered through the default template.
+
+    python -m benchmarks.pdf_throughput --max-workers 4 --jobs 40
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+from app.schemas.resume import ResumeContent
+from app.services.pdf import PDFRenderer
+from app.services.templates import template_service
+from benchmarks.synthetic import make_resume
+
+
+async def measure(workers: int, jobs: int, html: str) -> float:
+    renderer = PDFRenderer(workers=workers, timeout=120, max_tasks_per_child=0)
+    await renderer.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(renderer.render(html) for _ in range(jobs)))
+    elapsed = time.perf_counter() - started
+    renderer.shutdown()
+    return jobs / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--experiences", type=int, default=8)
+    args = parser.parse_args()
+
+    content = ResumeContent.model_validate(make_resume(random.Random(7), args.experiences))
+    html = template_service.render(content)
+
+    results = {}
+    for workers in range(1, args.max_workers + 1):
+        results[workers] = round(await measure(workers, args.jobs, html), 2)
+    print(json.dumps({"pdfs_per_second_by_workers": results}, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
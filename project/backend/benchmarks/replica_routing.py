@@ -0,0 +1,122 @@
+"""
+Where reads go with a read replica configured, checked against two plain
+databases with no replication between them: BENCH_DATABASE_URL acts as the
+primary and BENCH_REPLICA_DATABASE_URL as a replica that never catches up
+(both are wiped). Because the "replica" stays empty, a read that reaches it
+is plainly visible as a 404. Only the user accounts are copied across, so
+authentication works on both.
+
+Counts the statements each database ran for a write followed by reads
+inside the read-your-writes window, then the same reads once the window
+has passed.
+
+    BENCH_DATABASE_URL=postgresql://.../primary BENCH_REPLICA_DATABASE_URL=postgresql://.../replica \\
+        python -m benchmarks.replica_routing --window 1
+"""
+import argparse
+import json
+import os
+import sys
+
+if "BENCH_REPLICA_DATABASE_URL" not in os.environ:
+    sys.exit("Set BENCH_REPLICA_DATABASE_URL to a second throwaway Postgres database (it gets wiped).")
+os.environ["DATABASE_REPLICA_URLS"] = json.dumps([os.environ["BENCH_REPLICA_DATABASE_URL"]])
+_window = argparse.ArgumentParser(add_help=False)
+_window.add_argument("--window", type=float, default=1.0)
+os.environ["DB_READ_YOUR_WRITES_SECONDS"] = str(_window.parse_known_args()[0].window)
+
+import asyncio
+import uuid
+from collections import Counter
+
+from sqlalchemy import create_engine, event
+
+from benchmarks.common import app_client, reset_schema
+
+from app.core.config import settings
+from app.core.database import Base, engine, replica_engines
+from app.main import app
+from app.models.user import User
+from app.services.user_cache import user_cache
+
+executed = Counter()
+
+
+def count_statements(sync_engine, name: str) -> None:
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed[name] += 1
+
+
+def reset_replica() -> None:
+    replica = create_engine(settings.DATABASE_REPLICA_URLS[0])
+    Base.metadata.drop_all(replica)
+    Base.metadata.create_all(replica)
+    replica.dispose()
+
+
+def replicate_users() -> None:
+    """Copy the accounts over, as if replication had caught up on them but not on resumes."""
+    primary = create_engine(settings.DATABASE_URL)
+    replica = create_engine(settings.DATABASE_REPLICA_URLS[0])
+    with primary.connect() as source, replica.begin() as target:
+        rows = source.execute(User.__table__.select()).mappings().all()
+        target.execute(User.__table__.insert(), [dict(row) for row in rows])
+    primary.dispose()
+    replica.dispose()
+
+
+async def reads(client, headers, resume_id) -> dict:
+    statuses = {}
+    executed.clear()
+    for label, path in (
+        ("users/me", "/api/v1/users/me"),
+        ("list", "/api/v1/resumes/"),
+        ("get", f"/api/v1/resumes/{resume_id}"),
+        ("versions", f"/api/v1/resumes/{resume_id}/versions"),
+    ):
+        response = await client.get(path, headers=headers)
+        statuses[label] = response.status_code
+    return {"status": statuses, "statements": dict(executed)}
+
+
+async def run(args) -> dict:
+    reset_schema()
+    reset_replica()
+    count_statements(engine.sync_engine, "primary")
+    count_statements(replica_engines[0].sync_engine, "replica")
+
+    results = {}
+    async with app_client(app) as client:
+        email = f"{uuid.uuid4()}@example.com"
+        user = await client.post("/api/v1/auth/register", json={"email": email, "password": "benchmark-pw"})
+        login = await client.post("/api/v1/auth/login", json={"email": email, "password": "benchmark-pw"})
+        replicate_users()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        executed.clear()
+        created = await client.post("/api/v1/resumes/", json={"content": {"name": "Replica"}}, headers=headers)
+        created.raise_for_status()
+        results["write"] = {"status": created.status_code, "statements": dict(executed)}
+        resume_id = created.json()["id"]
+
+        results["reads inside window"] = await reads(client, headers, resume_id)
+        await asyncio.sleep(args.window + 0.2)
+        # Otherwise users/me is answered from the cache without any query.
+        await user_cache.invalidate(user.json()["id"])
+        results["reads after window"] = await reads(client, headers, resume_id)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter, parents=[_window]
+    )
+    args = parser.parse_args()
+    results = asyncio.run(run(args))
+    for phase, result in results.items():
+        print(f"{phase}: {json.dumps(result)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Time to serialize one resume response body, comparing FastAPI's default path
+(validate into ResumeResponse, encode, json.dumps), the same path rendered
+with orjson, and the trusted path that passes stored content through.
+
+    python -m benchmarks.resume_serialization --experiences 50 --runs 500
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+
+from app.api.v1.endpoints import resumes
+from app.models.resume import Resume, ResumeLanguage
+from app.schemas.resume import ResumeContent
+from benchmarks.synthetic import make_resume
+
+
+def build_resume(experiences: int) -> Resume:
+    content = make_resume(random.Random(42), experiences)
+    now = datetime.utcnow()
+    return Resume(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        title="Benchmark",
+        language=ResumeLanguage.EN,
+        template_id="default",
+        current_version=1,
+        created_at=now,
+        updated_at=now,
+        # Stored the way every write stores it.
+        content=ResumeContent.model_validate(content).model_dump(),
+    )
+
+
+async def validated(resume: Resume, response_class) -> bytes:
+    route = next(r for r in resumes.router.routes if r.name == "get_resume")
+    body = await serialize_response(field=route.response_field, response_content=resume)
+    return response_class(body).body
+
+
+async def trusted(resume: Resume) -> bytes:
+    return resumes._resume_response(resume).body
+
+
+async def measure(make_body, runs: int) -> float:
+    await make_body()
+    started = time.perf_counter()
+    for _ in range(runs):
+        await make_body()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+async def run(experiences: int, runs: int) -> dict:
+    resume = build_resume(experiences)
+    paths = {
+        "validated_json": lambda: validated(resume, JSONResponse),
+        "validated_orjson": lambda: validated(resume, ORJSONResponse),
+        "trusted_orjson": lambda: trusted(resume),
+    }
+    bodies = {name: await make_body() for name, make_body in paths.items()}
+    expected = json.loads(bodies["validated_json"])
+    for name, body in bodies.items():
+        assert json.loads(body) == expected, f"{name} serializes differently"
+
+    results = {"experiences": experiences, "body_bytes": len(bodies["trusted_orjson"])}
+    for name, make_body in paths.items():
+        results[f"{name}_ms"] = round(await measure(make_body, runs), 4)
+    results["speedup"] = round(results["validated_json_ms"] / results["trusted_orjson_ms"], 1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experiences", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.experiences, args.runs)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Full-text search latency over a large synthetic corpus (100k resumes by
+default, in English, Russian and French), for a user with a typical number
+of resumes and for one with thousands. For comparison it also times what
+searching in the client costs: downloading every resume with its content.
+The heavy user's searches are repeated without the GIN index.
+
+Rows are inserted directly and Postgres computes the search vectors, so
+seeding also shows the cost of maintaining them on write.
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.search --resumes 100000
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+
+from benchmarks.common import app_client, reset_schema, summarize_ms
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.main import app
+from app.models.resume import Resume, ResumeLanguage, ResumeVersion
+from app.models.user import User
+from app.schemas.resume import ResumeContent
+from benchmarks.synthetic import make_resume
+
+RU_WORDS = "разработал внедрил руководил сервис платформа данные команда клиенты аналитика облако безопасность".split()
+FR_WORDS = "conçu développé dirigé plateforme service données équipe clients analytique nuage sécurité".split()
+RARE_TERM = "zookeeper"  # in one resume out of RARE_EVERY
+RARE_EVERY = 500
+
+QUERIES = {
+    "common word": "engineer",
+    "rare word": RARE_TERM,
+    "phrase": '"data pipeline"',
+    "two words": "cloud security",
+    "russian": "сервис платформы",
+    "french": "données équipe",
+}
+
+
+def localized(rng: random.Random, language: ResumeLanguage, experiences: int) -> dict:
+    content = make_resume(rng, experiences)
+    words = {ResumeLanguage.RU: RU_WORDS, ResumeLanguage.FR: FR_WORDS}.get(language)
+    if words:
+        def phrase(count):
+            return " ".join(rng.choice(words) for _ in range(count)).capitalize() + "."
+        content["personal_info"]["summary"] = phrase(40)
+        for entry in content["work_experience"]:
+            entry["description"] = phrase(30)
+            entry["achievements"] = [phrase(12) for _ in entry["achievements"]]
+    return ResumeContent.model_validate(content).model_dump()
+
+
+def seed(resumes: int, typical: int, heavy: int, experiences: int, batch: int = 2000):
+    """Returns (typical user id, heavy user id). The rest go to filler users of `typical` resumes."""
+    engine = create_engine(settings.DATABASE_URL)
+    rng = random.Random(7)
+    languages = [ResumeLanguage.EN] * 3 + [ResumeLanguage.RU, ResumeLanguage.FR]
+    owners = []
+    user_rows = []
+    for number in range(max(1, (resumes - heavy) // typical)):
+        user_rows.append({"id": uuid.uuid4(), "email": f"search{number}@bench.example", "hashed_password": "-"})
+        owners.extend([user_rows[-1]["id"]] * typical)
+    user_rows.append({"id": uuid.uuid4(), "email": "heavy@bench.example", "hashed_password": "-"})
+    owners.extend([user_rows[-1]["id"]] * heavy)
+
+    started = time.perf_counter()
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), user_rows)
+        for offset in range(0, len(owners), batch):
+            rows = []
+            for number in range(offset, min(offset + batch, len(owners))):
+                language = rng.choice(languages)
+                content = localized(rng, language, experiences)
+                if number % RARE_EVERY == 0:
+                    content["personal_info"]["summary"] += f" Ran {RARE_TERM} clusters."
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "user_id": owners[number],
+                    "title": f"{content['work_experience'][0]['position']} {number}",
+                    "language": language,
+                    "content": content,
+                    "template_id": "default",
+                    "current_version": 2,
+                    "created_at": now,
+                    "updated_at": now - timedelta(minutes=number),
+                })
+            conn.execute(Resume.__table__.insert(), rows)
+    resume_seconds = time.perf_counter() - started
+
+    # One earlier version per resume, indexed the way the app indexes them.
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO resume_versions (id, resume_id, version, is_snapshot, content, source, created_at, "
+            "updated_at, search_vector) "
+            "SELECT gen_random_uuid(), id, 1, true, content, 'manual', created_at, created_at, "
+            "resume_search_vector(language, NULL, content) FROM resumes"
+        ))
+        conn.execute(text(f"ANALYZE {Resume.__tablename__}, {ResumeVersion.__tablename__}"))
+    version_seconds = time.perf_counter() - started
+    engine.dispose()
+    print(
+        f"seeded {len(owners)} resumes in {resume_seconds:.1f} s "
+        f"({len(owners) / resume_seconds:.0f}/s with generated search vectors), "
+        f"{len(owners)} versions in {version_seconds:.1f} s"
+    )
+    return str(user_rows[0]["id"]), str(user_rows[-1]["id"])
+
+
+async def timed(client, headers, runs: int, **params) -> dict:
+    samples = []
+    hits = 0
+    for _ in range(runs):
+        response = await client.get("/api/v1/resumes/search", params=params, headers=headers)
+        response.raise_for_status()
+        samples.append(response.elapsed.total_seconds())
+        hits = len(response.json()["items"])
+    return {**summarize_ms(samples), "hits": hits}
+
+
+async def download_all(client, headers) -> dict:
+    """What client-side search has to fetch first."""
+    started = time.perf_counter()
+    size = count = 0
+    cursor = None
+    while True:
+        params = {"include": "content", "limit": 100, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/resumes/", params=params, headers=headers)
+        response.raise_for_status()
+        size += len(response.content)
+        page = response.json()
+        count += len(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    return {"resumes": count, "bytes": size, "ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+def print_row(label: str, result: dict) -> None:
+    print(f"  {label:<28} p50 {result['p50_ms']:7.2f} ms  p95 {result['p95_ms']:7.2f} ms  {result['hits']} hits")
+
+
+async def run(args) -> None:
+    reset_schema()
+    typical_id, heavy_id = seed(args.resumes, args.typical, args.heavy, args.experiences)
+    users = {
+        f"typical user ({args.typical} resumes)": typical_id,
+        f"heavy user ({args.heavy} resumes)": heavy_id,
+    }
+
+    async with app_client(app) as client:
+        for label, user_id in users.items():
+            headers = {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+            print(f"\n{label}")
+            for name, query in QUERIES.items():
+                print_row(name, await timed(client, headers, args.runs, q=query))
+            print_row("common word, with versions", await timed(
+                client, headers, args.runs, q=QUERIES["common word"], include="versions"
+            ))
+            downloaded = await download_all(client, headers)
+            print(f"  client-side: download {downloaded['resumes']} resumes, "
+                  f"{downloaded['bytes'] / 1024:.0f} KiB in {downloaded['ms']} ms")
+
+        engine = create_engine(settings.DATABASE_URL)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_resumes_search_vector"))
+        headers = {"Authorization": f"Bearer {create_access_token(subject=heavy_id)}"}
+        print("\nheavy user, without the GIN index")
+        for name in ("common word", "rare word"):
+            print_row(name, await timed(client, headers, args.runs, q=QUERIES[name]))
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE INDEX ix_resumes_search_vector ON resumes USING gin (search_vector)"
+            ))
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=100_000)
+    parser.add_argument("--typical", type=int, default=20, help="resumes per ordinary user")
+    parser.add_argument("--heavy", type=int, default=5000, help="resumes of the one heavy user")
+    parser.add_argument("--experiences", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold-start cost of the API process: how long `import app.main` takes in a
+fresh interpreter, and where that time goes, package by package and module
+by module (from `python -X importtime`). tests/test_startup.py holds the
+import to a budget and checks that the heavy SDKs stay lazy.
+
+    python -m benchmarks.startup_profile --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+MEASURE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed}))
+"""
+
+
+def measure() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_times() -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for every module app.main imports."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"], capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(own), int(cumulative)))
+    return rows
+
+
+def by_package(rows: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for name, own, _ in rows:
+        package = name.split(".")[0]
+        if package == "app":
+            # Our own modules, one level down: app.services, app.api, ...
+            package = ".".join(name.split(".")[:2])
+        totals[package] += own
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    median_ms = statistics.median(run["seconds"] for run in runs) * 1000
+
+    rows = import_times()
+    total = sum(own for _, own, _ in rows)
+    print(f"import app.main: median {median_ms:.0f} ms over {args.runs} runs")
+    print(f"\nSelf time by package (one -X importtime run, {total / 1000:.0f} ms in total):")
+    for package, own in sorted(by_package(rows).items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {own / 1000:8.1f} ms  {own / total:5.1%}  {package}")
+    print("\nSlowest modules (self time):")
+    for name, own, cumulative in sorted(rows, key=lambda row: -row[1])[:args.top]:
+        print(f"  {own / 1000:8.1f} ms  (with imports {cumulative / 1000:.1f} ms)  {name}")
+
+
+if __name__ == "__main__":
+    main()
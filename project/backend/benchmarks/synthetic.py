@@ -0,0 +1,77 @@
+"""Synthetic resume documents and edit histories shared by the benchmarks."""
+import copy
+import random
+from typing import Any, Dict, List
+
+WORDS = (
+    "led designed built shipped migrated scaled reduced improved launched owned "
+    "platform service pipeline latency revenue customers team roadmap api cloud "
+    "data model frontend backend mobile analytics growth infrastructure security"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_resume(rng: random.Random, experiences: int = 5) -> Dict[str, Any]:
+    return {
+        "personal_info": {
+            "first_name": "Alex",
+            "last_name": "Doe",
+            "email": "alex@example.com",
+            "phone": "+1 555 0100",
+            "location": "Paris, France",
+            "linkedin": None,
+            "website": None,
+            "summary": sentence(rng, 40),
+        },
+        "work_experience": [
+            {
+                "company": f"Company {i}",
+                "position": "Software Engineer",
+                "location": "Remote",
+                "start_date": f"Jan {2010 + i}",
+                "end_date": f"Dec {2011 + i}",
+                "is_current": False,
+                "description": sentence(rng, 30),
+                "achievements": [sentence(rng) for _ in range(4)],
+            }
+            for i in range(experiences)
+        ],
+        "education": [
+            {
+                "institution": "University of Somewhere",
+                "degree": "MSc",
+                "field_of_study": "Computer Science",
+                "location": None,
+                "start_date": "2005",
+                "end_date": "2010",
+                "gpa": None,
+                "achievements": [],
+            }
+        ],
+        "skills": [{"name": word, "level": "advanced"} for word in WORDS[:12]],
+        "languages": [{"name": "English", "proficiency": "fluent"}],
+    }
+
+
+def edit_history(saves: int, seed: int = 42, experiences: int = 5) -> List[Dict[str, Any]]:
+    """Simulate autosaves: each save types a few characters into one field."""
+    rng = random.Random(seed)
+    content = make_resume(rng, experiences)
+    history = [copy.deepcopy(content)]
+    for _ in range(saves - 1):
+        roll = rng.random()
+        if roll < 0.4:
+            content["personal_info"]["summary"] += " " + rng.choice(WORDS)
+        elif roll < 0.8 and content["work_experience"]:
+            entry = rng.choice(content["work_experience"])
+            entry["description"] += " " + rng.choice(WORDS)
+        elif roll < 0.9:
+            content["skills"].append({"name": rng.choice(WORDS), "level": None})
+        else:
+            entry = rng.choice(content["work_experience"])
+            entry["achievements"].append(sentence(rng, 8))
+        history.append(copy.deepcopy(content))
+    return history
@@ -0,0 +1,67 @@
+"""
+HTML rendering cost per resume template: compiling a template from source
+and from the bytecode cache, rendering a document, and serving the same
+document again from the rendered-HTML cache, keyed by hashing the content
+or by a digest the caller already has.
+
+    python -m benchmarks.template_render --experiences 10 --runs 500
+"""
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from app.schemas.resume import ResumeContent
+from app.services.templates import TemplateService
+from benchmarks.synthetic import make_resume
+
+
+def per_call_ms(fn, runs: int) -> float:
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def compile_ms(template_id: str, bytecode_dir: str) -> float:
+    # A new service per call, like a freshly started worker.
+    service = TemplateService(bytecode_cache_dir=bytecode_dir, html_cache_size=0)
+    started = time.perf_counter()
+    service.env.get_template(f"{template_id}.html")
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--experiences", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+
+    content = ResumeContent.model_validate(make_resume(random.Random(42), args.experiences))
+    bytecode_dir = tempfile.mkdtemp(prefix="bench-templates-")
+    try:
+        uncached = TemplateService(bytecode_cache_dir="", html_cache_size=0)
+        cached = TemplateService(bytecode_cache_dir="", html_cache_size=16)
+        uncached.load()
+        cached.load()
+
+        print(f"{args.experiences} work experiences, {args.runs} runs")
+        for template_id in uncached.template_ids():
+            from_source = compile_ms(template_id, "")
+            compile_ms(template_id, bytecode_dir)  # fills the bytecode cache
+            from_bytecode = compile_ms(template_id, bytecode_dir)
+            render = per_call_ms(lambda: uncached.render(content, template_id), args.runs)
+            hit = per_call_ms(lambda: cached.render(content, template_id), args.runs)
+            keyed_hit = per_call_ms(lambda: cached.render(content, template_id, digest="etag"), args.runs)
+            size = len(uncached.render(content, template_id))
+            print(
+                f"{template_id}: compile {from_source:.2f} ms, from bytecode {from_bytecode:.2f} ms; "
+                f"render {render:.3f} ms, cached {hit:.3f} ms, cached by digest {keyed_hit:.4f} ms; {size} bytes"
+            )
+    finally:
+        shutil.rmtree(bytecode_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
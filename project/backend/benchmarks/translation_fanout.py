@@ -0,0 +1,99 @@
+"""
+Translating a resume into every other language: one POST /translate per
+language, one after the other, against a single POST /translations that
+translates them concurrently and saves the siblings in one transaction.
+Runs against the in-process fake model; every run uses a new resume so
+translation memory never answers.
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.translation_fanout --runs 5 --experiences 4
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import create_engine, update
+
+from benchmarks.common import app_client, reset_schema, summarize_ms
+from benchmarks.fake_model import fake_client
+from benchmarks.synthetic import make_resume
+
+from app.core.config import settings
+from app.main import app
+from app.models.resume import ResumeLanguage
+from app.models.subscription import Plan
+from app.services.ai_translation import ai_translation_service
+
+
+def unlimited_translations() -> None:
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.begin() as conn:
+        conn.execute(update(Plan.__table__).values(max_translations_per_month=None))
+    engine.dispose()
+
+
+async def new_resume(client, headers, seed: int, experiences: int) -> str:
+    record = {"title": f"Fan-out {seed}", "language": "en", "content": make_resume(random.Random(seed), experiences)}
+    response = await client.post("/api/v1/resumes/", json=record, headers=headers)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def one_by_one(client, headers, resume_id: str, languages) -> float:
+    started = time.perf_counter()
+    for language in languages:
+        response = await client.post(
+            f"/api/v1/resumes/{resume_id}/translate", json={"target_language": language}, headers=headers
+        )
+        response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def fan_out(client, headers, resume_id: str, languages) -> float:
+    started = time.perf_counter()
+    response = await client.post(
+        f"/api/v1/resumes/{resume_id}/translations", json={"target_languages": languages}, headers=headers
+    )
+    response.raise_for_status()
+    assert all(result["status"] == "created" for result in response.json()["results"]), response.json()
+    return time.perf_counter() - started
+
+
+async def run(args) -> None:
+    reset_schema()
+    unlimited_translations()
+    ai_translation_service.client = fake_client()
+    ai_translation_service._semaphore = asyncio.Semaphore(args.max_concurrency)
+    languages = [language.value for language in ResumeLanguage if language != ResumeLanguage.EN]
+
+    async with app_client(app) as client:
+        credentials = {"email": "fanout@example.com", "password": "benchmark-pw"}
+        (await client.post("/api/v1/auth/register", json=credentials)).raise_for_status()
+        token = (await client.post("/api/v1/auth/login", json=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        sequential, concurrent = [], []
+        for run_number in range(args.runs):
+            resume_id = await new_resume(client, headers, 2 * run_number, args.experiences)
+            sequential.append(await one_by_one(client, headers, resume_id, languages))
+            resume_id = await new_resume(client, headers, 2 * run_number + 1, args.experiences)
+            concurrent.append(await fan_out(client, headers, resume_id, languages))
+
+    print(f"en -> {', '.join(languages)}, {args.experiences} work experiences, "
+          f"{args.max_concurrency} model requests in flight, p50/p95 over {args.runs} runs")
+    for label, samples in (("POST /translate per language", sequential), ("POST /translations", concurrent)):
+        result = summarize_ms(samples)
+        print(f"  {label:<30} {result['p50_ms'] / 1000:6.2f} / {result['p95_ms'] / 1000:6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--experiences", type=int, default=4)
+    parser.add_argument("--max-concurrency", type=int, default=settings.TRANSLATION_MAX_CONCURRENCY)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Wall-clock time to translate a synthetic resume against the fake model
+server: the whole document in one request versus section-parallel
+translation at increasing concurrency. Runs the fake server in-process.
+
+    python -m benchmarks.translation_latency --experiences 8
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from app.schemas.resume import ResumeContent
+from app.services.ai_translation import AITranslationService
+from benchmarks.fake_model import fake_client
+from benchmarks.synthetic import make_resume
+
+
+async def whole_document(content: ResumeContent) -> float:
+    client = fake_client()
+    started = time.perf_counter()
+    await client.messages.create(
+        model="fake",
+        max_tokens=4096,
+        system="Translate to French.",
+        messages=[{"role": "user", "content": content.model_dump_json()}],
+    )
+    return time.perf_counter() - started
+
+
+async def sectioned(content: ResumeContent, concurrency: int) -> float:
+    service = AITranslationService(
+        model="fake", max_tokens=2048, max_concurrency=concurrency, client=fake_client()
+    )
+    started = time.perf_counter()
+    await service.translate_resume(content, "fr")
+    return time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experiences", type=int, default=8)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    content = ResumeContent.model_validate(make_resume(random.Random(7), args.experiences))
+    sections = len(AITranslationService(
+        model="fake", max_tokens=2048, max_concurrency=1, client=fake_client()
+    ).split_sections(content.model_dump()))
+
+    results = {
+        "sections": sections,
+        "whole_document_seconds": round(await whole_document(content), 2),
+        "sectioned_seconds_by_concurrency": {},
+    }
+    concurrency = 1
+    while concurrency <= args.max_concurrency:
+        seconds = await sectioned(content, concurrency)
+        results["sectioned_seconds_by_concurrency"][concurrency] = round(seconds, 2)
+        concurrency *= 2
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
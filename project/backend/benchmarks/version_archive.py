@@ -0,0 +1,167 @@
+"""
+Archiving old resume versions to object storage: how much the
+resume_versions table and its indexes shrink, how fast a pass archives,
+and what reading a version costs when it is hot, archived, and archived
+with its object already cached.
+
+Objects go to a local directory standing in for S3 (benchmarks.fake_storage);
+point AWS_S3_ENDPOINT_URL at MinIO and pass --s3 to use the real client.
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.version_archive --resumes 300 --saves 120
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import bindparam, create_engine, func, insert, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from benchmarks.common import app_client, reset_schema, summarize_ms
+from benchmarks.fake_storage import LocalObjectStorage
+from benchmarks.synthetic import edit_history
+
+from app.core.config import settings
+from app.core.hashing import content_hash
+from app.core.security import create_access_token
+from app.main import app
+from app.models.resume import Resume, ResumeLanguage, ResumeVersion
+from app.models.user import User
+from app.services.storage import object_storage
+from app.services.version_archive import version_archive
+from app.services.versioning import ResumeVersionService
+
+
+def seed(resumes: int, saves: int, interval: int):
+    """Every resume gets the same autosave history, spread over the last `saves` days."""
+    engine = create_engine(settings.DATABASE_URL)
+    history = edit_history(saves)
+    service = ResumeVersionService(snapshot_interval=interval, coalesce_seconds=0)
+    template = []
+    previous = None
+    for number, content in enumerate(history, start=1):
+        row = service.build_version(uuid.uuid4(), number, content, previous)
+        template.append((row.is_snapshot, row.content, row.delta, content_hash(content), content))
+        previous = content
+
+    user_id = uuid.uuid4()
+    now = datetime.utcnow()
+    statement = insert(ResumeVersion.__table__).values(
+        search_vector=func.resume_search_vector(
+            bindparam("language", type_=Resume.__table__.c.language.type), None, bindparam("full", type_=JSONB)
+        )
+    )
+    resume_ids = []
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert().values(id=user_id, email="archive@bench.example", hashed_password="-"))
+        for _ in range(resumes):
+            resume_id = uuid.uuid4()
+            resume_ids.append(resume_id)
+            conn.execute(Resume.__table__.insert().values(
+                id=resume_id, user_id=user_id, title="Archived", language=ResumeLanguage.EN,
+                content=history[-1], template_id="default", current_version=saves, created_at=now, updated_at=now,
+            ))
+            conn.execute(statement, [
+                {
+                    "id": uuid.uuid4(), "resume_id": resume_id, "version": number, "is_snapshot": is_snapshot,
+                    "content": content, "delta": delta, "content_hash": digest, "source": "manual",
+                    "created_at": now - timedelta(days=saves - number),
+                    "updated_at": now - timedelta(days=saves - number),
+                    "language": ResumeLanguage.EN, "full": full,
+                }
+                for number, (is_snapshot, content, delta, digest, full) in enumerate(template, start=1)
+            ])
+    engine.dispose()
+    return str(user_id), resume_ids, history
+
+
+def sizes() -> dict:
+    engine = create_engine(settings.DATABASE_URL, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        conn.execute(text("VACUUM FULL ANALYZE resume_versions"))
+        row = conn.execute(text(
+            "SELECT pg_table_size('resume_versions'), pg_indexes_size('resume_versions'), "
+            "pg_relation_size('ix_resume_versions_search_vector')"
+        )).one()
+    engine.dispose()
+    return {"table": row[0], "indexes": row[1], "gin": row[2]}
+
+
+def print_sizes(label: str, measured: dict) -> None:
+    print(f"  {label:<16} table {measured['table'] / 2**20:7.1f} MiB   indexes {measured['indexes'] / 2**20:6.1f} MiB "
+          f"(search GIN {measured['gin'] / 2**20:5.1f} MiB)")
+
+
+async def read_ms(client, headers, resume_id, version: int, runs: int, clear_cache: bool) -> dict:
+    samples = []
+    for _ in range(runs):
+        if clear_cache:
+            version_archive.cache.clear()
+        response = await client.get(f"/api/v1/resumes/{resume_id}/versions/{version}", headers=headers)
+        response.raise_for_status()
+        samples.append(response.elapsed.total_seconds())
+    return summarize_ms(samples)
+
+
+async def run(args) -> None:
+    reset_schema()
+    started = time.perf_counter()
+    user_id, resume_ids, history = seed(args.resumes, args.saves, args.interval)
+    print(f"seeded {args.resumes} resumes x {args.saves} versions in {time.perf_counter() - started:.1f} s")
+    before = sizes()
+
+    version_archive.storage = object_storage if args.s3 else LocalObjectStorage()
+    version_archive.after = timedelta(days=args.after_days) if args.after_days > 0 else None
+    version_archive.keep_versions = args.keep
+    started = time.perf_counter()
+    archived = 0
+    while True:
+        resumes, versions = await version_archive.archive_pass()
+        archived += versions
+        if not resumes:
+            break
+    seconds = time.perf_counter() - started
+    after = sizes()
+
+    print(f"\narchived {archived} of {args.resumes * args.saves} versions in {seconds:.1f} s "
+          f"({archived / seconds:.0f} versions/s)")
+    if isinstance(version_archive.storage, LocalObjectStorage):
+        objects = list(version_archive.storage.root.rglob("*.json.gz"))
+        total = sum(path.stat().st_size for path in objects)
+        print(f"  {len(objects)} objects, {total / 2**20:.1f} MiB gzipped")
+    print_sizes("before", before)
+    print_sizes("after", after)
+
+    headers = {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+    resume_id = resume_ids[0]
+    hot, cold = args.saves - 1, args.interval  # a delta in the current block; the end of the first block
+    async with app_client(app) as client:
+        for version in (hot, cold):
+            response = await client.get(f"/api/v1/resumes/{resume_id}/versions/{version}", headers=headers)
+            assert response.json()["content"] == history[version - 1], version
+        print(f"\nGET /versions/{{n}}, p50/p95 over {args.runs} runs")
+        for label, version, clear in (
+            (f"hot (v{hot})", hot, False),
+            (f"archived (v{cold})", cold, True),
+            (f"archived, cached (v{cold})", cold, False),
+        ):
+            result = await read_ms(client, headers, resume_id, version, args.runs, clear)
+            print(f"  {label:<26} {result['p50_ms']:6.2f} / {result['p95_ms']:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=300)
+    parser.add_argument("--saves", type=int, default=120, help="versions per resume, one a day")
+    parser.add_argument("--interval", type=int, default=settings.RESUME_VERSION_SNAPSHOT_INTERVAL)
+    parser.add_argument("--keep", type=int, default=settings.RESUME_ARCHIVE_KEEP_VERSIONS)
+    parser.add_argument("--after-days", type=int, default=settings.RESUME_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--s3", action="store_true", help="archive to AWS_S3_BUCKET instead of a local directory")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
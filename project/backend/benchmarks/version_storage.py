@@ -0,0 +1,59 @@
+"""
+Storage per resume for a synthetic autosave history, comparing a full copy
+per version with snapshots + JSON-patch deltas, and the worst-case time to
+rebuild a version.
+
+    python -m benchmarks.version_storage --saves 500 --interval 20
+"""
+import argparse
+import json
+import time
+import uuid
+
+from app.services.versioning import ResumeVersionService
+from benchmarks.synthetic import edit_history
+
+
+def size(value) -> int:
+    return len(json.dumps(value, separators=(",", ":")).encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--saves", type=int, default=500)
+    parser.add_argument("--interval", type=int, default=20)
+    args = parser.parse_args()
+
+    history = edit_history(args.saves)
+    service = ResumeVersionService(snapshot_interval=args.interval)
+    resume_id = uuid.uuid4()
+
+    rows = []
+    previous = None
+    for number, content in enumerate(history, start=1):
+        rows.append(service.build_version(resume_id, number, content, previous))
+        previous = content
+
+    full_bytes = sum(size(content) for content in history)
+    compact_bytes = sum(size(row.content) if row.is_snapshot else size(row.delta) for row in rows)
+
+    # Worst case: the version just before the next snapshot.
+    target = args.interval if args.interval <= len(rows) else len(rows)
+    started = time.perf_counter()
+    for _ in range(100):
+        rebuilt = service.replay(rows[:target])[-1][1]
+    rebuild_ms = (time.perf_counter() - started) * 10
+    assert rebuilt == history[target - 1]
+
+    print(json.dumps({
+        "saves": args.saves,
+        "snapshot_interval": args.interval,
+        "full_copy_bytes": full_bytes,
+        "snapshot_delta_bytes": compact_bytes,
+        "ratio": round(full_bytes / compact_bytes, 1),
+        "worst_case_rebuild_ms": round(rebuild_ms, 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Tests that need Postgres run against TEST_DATABASE_URL, whose tables are
+dropped and recreated; without it they are skipped. It has to be set
+before the app is imported, since the engines are built from settings.
+"""
+import os
+
+import pytest
+
+if os.environ.get("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+
+
+@pytest.fixture(scope="session")
+def database() -> str:
+    """A freshly created schema; the sync URL of the database."""
+    if not os.environ.get("TEST_DATABASE_URL"):
+        pytest.skip("set TEST_DATABASE_URL to a throwaway Postgres database")
+
+    from sqlalchemy import create_engine
+
+    import app.models  # noqa: F401  (register tables on Base.metadata)
+    from app.core.config import settings
+    from app.core.database import Base
+
+    engine = create_engine(settings.DATABASE_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return settings.DATABASE_URL
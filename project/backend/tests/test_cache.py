@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import InMemorySharedCache, SharedCacheBackend
+
+
+def test_incomplete_shared_cache_backend_fails_to_instantiate():
+    class GetOnly(SharedCacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_in_memory_shared_cache_round_trip():
+    async def round_trip():
+        cache = InMemorySharedCache()
+        await cache.set("user:1", "alex", ttl=60)
+        stored = await cache.get("user:1")
+        await cache.delete("user:1")
+        return stored, await cache.get("user:1")
+
+    assert asyncio.run(round_trip()) == ("alex", None)
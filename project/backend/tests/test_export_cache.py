@@ -0,0 +1,149 @@
+import asyncio
+import shutil
+
+import pytest
+from moto import mock_aws
+
+from app.schemas.resume import ResumeContent
+from app.services import export as export_module
+from app.services.export import ExportService
+from app.services.export_cache import LocalFileCache
+from app.services.storage import ObjectStorage
+from app.services.templates import TEMPLATES_DIR, TemplateService
+
+BUCKET = "export-bucket"
+RESUME_ID = "5b0f1a52-8a3e-4a43-9d53-3f4f2b8f7c11"
+CONTENT = {
+    "personal_info": {
+        "first_name": "Alex",
+        "last_name": "Doe",
+        "email": "alex@example.com",
+        "summary": "Backend engineer.",
+    },
+    "work_experience": [
+        {"company": "Acme", "position": "Engineer", "start_date": "2020", "achievements": ["Shipped it."]},
+    ],
+    "skills": [{"name": "Python", "level": "advanced"}],
+}
+
+
+class CountingRenderer:
+    """Writes a placeholder PDF where WeasyPrint would, counting renders."""
+
+    def __init__(self):
+        self.renders = 0
+
+    async def render_to_file(self, html, path, template_id="default"):
+        self.renders += 1
+        path.write_bytes(b"%PDF-1.4 " + template_id.encode())
+
+
+@pytest.fixture
+def templates(tmp_path, monkeypatch):
+    directory = tmp_path / "templates"
+    directory.mkdir()
+    for template_id in ("default", "modern"):
+        shutil.copyfile(TEMPLATES_DIR / "default.html", directory / f"{template_id}.html")
+        shutil.copyfile(TEMPLATES_DIR / "default.css", directory / f"{template_id}.css")
+    (directory / "modern.css").write_text("body { font-family: serif; }")
+    service = TemplateService(templates_dir=directory, bytecode_cache_dir="")
+    monkeypatch.setattr(export_module, "template_service", service)
+    return service
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    renderer = CountingRenderer()
+    monkeypatch.setattr(export_module, "pdf_renderer", renderer)
+    return renderer
+
+
+@pytest.fixture
+def s3():
+    with mock_aws():
+        storage = ObjectStorage(bucket=BUCKET)
+        storage.client.create_bucket(Bucket=BUCKET)
+        yield storage
+
+
+def new_service(storage, cache_dir) -> ExportService:
+    service = ExportService(storage=storage)
+    service.local_cache = LocalFileCache(str(cache_dir), max_bytes=1024 * 1024)
+    return service
+
+
+def stored_keys(storage) -> list:
+    listing = storage.client.list_objects_v2(Bucket=BUCKET)
+    return sorted(item["Key"] for item in listing.get("Contents", []))
+
+
+def test_unchanged_export_renders_and_uploads_once(s3, templates, renderer, tmp_path):
+    service = new_service(s3, tmp_path / "cache")
+    content = ResumeContent.model_validate(CONTENT)
+
+    first = asyncio.run(service.render_to_storage(RESUME_ID, content))
+    # Equal content built separately, as a later request would.
+    second = asyncio.run(service.render_to_storage(RESUME_ID, ResumeContent.model_validate(CONTENT)))
+
+    assert first == second
+    assert renderer.renders == 1
+    assert stored_keys(s3) == [first]
+
+
+def test_object_store_serves_when_local_cache_is_cold(s3, templates, renderer, tmp_path):
+    content = ResumeContent.model_validate(CONTENT)
+    first = asyncio.run(new_service(s3, tmp_path / "one").render_to_storage(RESUME_ID, content))
+    # Another process: empty local cache, same bucket.
+    second = asyncio.run(new_service(s3, tmp_path / "two").render_to_storage(RESUME_ID, content))
+
+    assert first == second
+    assert renderer.renders == 1
+    assert stored_keys(s3) == [first]
+
+
+def test_object_deleted_from_the_bucket_is_uploaded_again(s3, templates, renderer, tmp_path):
+    service = new_service(s3, tmp_path / "cache")
+    content = ResumeContent.model_validate(CONTENT)
+    key = asyncio.run(service.render_to_storage(RESUME_ID, content))
+    s3.client.delete_object(Bucket=BUCKET, Key=key)
+
+    assert asyncio.run(service.render_to_storage(RESUME_ID, content)) == key
+    # From the local copy, without rendering again.
+    assert renderer.renders == 1
+    assert stored_keys(s3) == [key]
+
+    s3.client.delete_object(Bucket=BUCKET, Key=key)
+    cold = new_service(s3, tmp_path / "cold")
+    assert asyncio.run(cold.render_to_storage(RESUME_ID, content)) == key
+    assert renderer.renders == 2
+    assert stored_keys(s3) == [key]
+
+
+def test_cache_key_follows_template_and_content(s3, templates, renderer, tmp_path):
+    service = new_service(s3, tmp_path / "cache")
+    content = ResumeContent.model_validate(CONTENT)
+    edited = ResumeContent.model_validate({**CONTENT, "skills": [{"name": "Go", "level": "advanced"}]})
+
+    keys = [
+        asyncio.run(service.render_to_storage(RESUME_ID, content, "default")),
+        asyncio.run(service.render_to_storage(RESUME_ID, content, "modern")),
+        asyncio.run(service.render_to_storage(RESUME_ID, edited, "default")),
+        asyncio.run(service.render_to_storage(RESUME_ID, content, "default", "fr")),
+    ]
+    assert len(set(keys)) == 4
+    assert renderer.renders == 4
+
+    # Each of them is reused from then on.
+    for key, args in zip(keys, [(content, "default"), (content, "modern"), (edited, "default")]):
+        assert asyncio.run(service.render_to_storage(RESUME_ID, *args)) == key
+    assert renderer.renders == 4
+    assert stored_keys(s3) == sorted(keys)
+
+
+def test_template_change_invalidates_key(templates):
+    content = ResumeContent.model_validate(CONTENT)
+    before = ExportService.export_digest(content, "modern", "en")
+    (templates.templates_dir / "modern.css").write_text("body { font-family: sans-serif; }")
+    templates._versions.clear()
+
+    assert ExportService.export_digest(content, "modern", "en") != before
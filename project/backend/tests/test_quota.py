@@ -0,0 +1,61 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.subscription import Plan, PlanType, Subscription
+from app.models.user import User
+from app.services.quota import QuotaExceeded, QuotaService
+
+LIMIT = 10
+REQUESTS = 100
+
+
+async def consume_in_parallel(kind: str, requests: int):
+    """(granted, counter) after `requests` concurrent consume() calls by one user."""
+    # An engine of its own: each test runs on a new event loop.
+    engine = create_async_engine(settings.ASYNC_DATABASE_URL, pool_size=25, max_overflow=0)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with sessions() as db:
+            plan = await db.scalar(select(Plan).where(Plan.name == PlanType.FREE))
+            if plan is None:
+                db.add(Plan(
+                    name=PlanType.FREE,
+                    display_name="Free",
+                    max_exports_per_month=LIMIT,
+                    max_translations_per_month=LIMIT,
+                ))
+            user = User(email=f"quota-{uuid.uuid4().hex[:12]}@example.com", hashed_password="-")
+            db.add(user)
+            await db.commit()
+
+        quota = QuotaService(plan_cache_ttl=300)
+
+        async def attempt() -> bool:
+            async with sessions() as db:
+                try:
+                    await quota.consume(db, user.id, kind)
+                    return True
+                except QuotaExceeded:
+                    return False
+
+        granted = await asyncio.gather(*(attempt() for _ in range(requests)))
+        used_column = getattr(Subscription, f"{kind}_used")
+        async with sessions() as db:
+            counter = await db.scalar(select(used_column).where(Subscription.user_id == user.id))
+        return sum(granted), counter
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("kind", ["exports", "translations"])
+def test_parallel_consume_stops_at_the_limit(database, kind):
+    granted, counter = asyncio.run(consume_in_parallel(kind, REQUESTS))
+
+    assert granted == LIMIT
+    assert counter == LIMIT
+
@@ -0,0 +1,87 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Heavy SDKs that must only load on first use, not with the app.
+LAZY_MODULES = ["boto3", "botocore", "anthropic", "weasyprint"]
+# Median `import app.main` in a fresh interpreter; generous so that slow CI
+# machines pass, while loading an SDK eagerly again would not.
+BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "3000"))
+RUNS = 3
+
+MEASURE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+# Records filesystem writes, and any look at the configured cache
+# directories, made while importing the app.
+TOUCHES = """
+import os, sys
+root = sys.argv[1]
+touched = []
+
+def hook(event, args):
+    if event in ("os.mkdir", "os.rename", "os.remove", "os.rmdir"):
+        touched.append((event, str(args[0])))
+    elif event == "open" and (
+        any(flag in str(args[1] or "") for flag in "wax+")
+        or (args[2] or 0) & (os.O_WRONLY | os.O_RDWR | os.O_CREAT)
+    ):
+        touched.append((event, str(args[0])))
+    elif event in ("os.scandir", "os.listdir") and str(args[0]).startswith(root):
+        touched.append((event, str(args[0])))
+
+sys.addaudithook(hook)
+import app.main
+print(repr(touched))
+"""
+
+
+def import_app() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE % (LAZY_MODULES,)],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_app_import_is_lazy_and_within_budget():
+    runs = [import_app() for _ in range(RUNS)]
+
+    assert runs[0]["loaded"] == []
+    median_ms = statistics.median(run["seconds"] for run in runs) * 1000
+    assert median_ms <= BUDGET_MS, f"import app.main took {median_ms:.0f} ms, budget is {BUDGET_MS:g} ms"
+
+
+def test_app_import_touches_no_files(tmp_path):
+    exports = tmp_path / "exports"
+    (exports / "resume").mkdir(parents=True)
+    (exports / "resume" / "cached.pdf").write_bytes(b"%PDF")
+    env = {
+        **os.environ,
+        "PYTHONDONTWRITEBYTECODE": "1",
+        "EXPORT_CACHE_DIR": str(exports),
+        "TEMPLATE_BYTECODE_CACHE_DIR": str(tmp_path / "templates"),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", TOUCHES, str(tmp_path)],
+        cwd=Path(__file__).resolve().parents[1],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip().splitlines()[-1] == "[]"
+    assert not (tmp_path / "templates").exists()
@@ -0,0 +1,31 @@
+import asyncio
+import threading
+
+from moto import mock_aws
+
+from app.services.storage import ObjectStorage
+
+
+def test_first_presigned_url_builds_the_client_off_the_event_loop():
+    storage = ObjectStorage(bucket="export-bucket")
+    connect = storage._connect
+    threads = []
+
+    def recording_connect():
+        threads.append(threading.current_thread())
+        connect()
+
+    storage._connect = recording_connect
+
+    async def sign():
+        loop_thread = threading.current_thread()
+        first = await storage.presigned_url("exports/a.pdf", 3600)
+        second = await storage.presigned_url("exports/a.pdf", 3600)
+        return loop_thread, first, second
+
+    with mock_aws():
+        loop_thread, first, second = asyncio.run(sign())
+
+    assert len(threads) == 1 and threads[0] is not loop_thread
+    assert first == second
+    assert "exports/a.pdf" in first
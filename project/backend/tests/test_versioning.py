@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.resume import Resume, ResumeVersion
+from app.models.user import User
+from app.services.versioning import ResumeVersionService
+
+WINDOW = 60
+
+
+async def autosave(saves: int, interval: timedelta):
+    """Versions of a resume after `saves` manual saves, `interval` apart."""
+    engine = create_async_engine(settings.ASYNC_DATABASE_URL)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    service = ResumeVersionService(coalesce_seconds=WINDOW)
+    try:
+        async with sessions() as db:
+            user = User(email=f"versions-{uuid.uuid4().hex[:12]}@example.com", hashed_password="-")
+            db.add(user)
+            await db.flush()
+            resume = Resume(user_id=user.id, content={"summary": "start"}, current_version=1)
+            db.add(resume)
+            await db.flush()
+            db.add(service.build_version(resume.id, 1, resume.content))
+            await db.commit()
+
+        for i in range(saves):
+            async with sessions() as db:
+                resume = await db.get(Resume, resume.id)
+                await service.save_content(db, resume, {"summary": f"draft {i}"})
+                await db.commit()
+            # Let `interval` pass by moving the history back in time.
+            async with sessions() as db:
+                await db.execute(
+                    update(ResumeVersion)
+                    .where(ResumeVersion.resume_id == resume.id)
+                    .values(
+                        created_at=ResumeVersion.created_at - interval,
+                        updated_at=ResumeVersion.updated_at - interval,
+                    )
+                )
+                await db.commit()
+
+        async with sessions() as db:
+            history = await service.get_history(db, resume.id)
+        return [(row.version, content["summary"]) for row, content in history]
+    finally:
+        await engine.dispose()
+
+
+def test_saves_within_the_window_coalesce(database):
+    history = asyncio.run(autosave(3, timedelta(seconds=10)))
+
+    assert history == [(1, "draft 2")]
+
+
+def test_steady_saves_still_get_a_version_per_window(database):
+    # A save every 20 s for 100 s: the version created at 0 s takes the
+    # saves until 60 s, when a new one starts.
+    history = asyncio.run(autosave(6, timedelta(seconds=20)))
+
+    assert history == [(2, "draft 5"), (1, "draft 2")]
@@ -5,12 +5,13 @@ import Link from 'next/link'
 import { useRouter } from 'next/navigation'
 import { api } from '@/lib/api'
 import { useAuthStore } from '@/lib/store'
-import { Resume } from '@/types/resume'
+import { Page, ResumeSummary } from '@/types/resume'
 
 export default function DashboardPage() {
   const router = useRouter()
   const { token, logout } = useAuthStore()
-  const [resumes, setResumes] = useState<Resume[]>([])
+  const [resumes, setResumes] = useState<ResumeSummary[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [loading, setLoading] = useState(true)
 
   useEffect(() => {
@@ -21,8 +22,9 @@ export default function DashboardPage() {
 
     const fetchResumes = async () => {
       try {
-        const response = await api.get('/api/v1/resumes/')
-        setResumes(response.data)
+        const response = await api.get<Page<ResumeSummary>>('/api/v1/resumes/')
+        setResumes(response.data.items)
+        setNextCursor(response.data.next_cursor)
       } catch (error) {
         console.error('Failed to fetch resumes:', error)
       } finally {
@@ -33,6 +35,20 @@ export default function DashboardPage() {
     fetchResumes()
   }, [token, router])
 
+  const loadMore = async () => {
+    if (!nextCursor) return
+
+    try {
+      const response = await api.get<Page<ResumeSummary>>('/api/v1/resumes/', {
+        params: { cursor: nextCursor },
+      })
+      setResumes([...resumes, ...response.data.items])
+      setNextCursor(response.data.next_cursor)
+    } catch (error) {
+      console.error('Failed to fetch resumes:', error)
+    }
+  }
+
   const createNewResume = async () => {
     try {
       const response = await api.post('/api/v1/resumes/', {
@@ -99,6 +115,15 @@ export default function DashboardPage() {
             ))}
           </div>
         )}
+
+        {nextCursor && (
+          <button
+            onClick={loadMore}
+            className="mt-8 px-6 py-3 text-primary-600 hover:underline"
+          >
+            Load more
+          </button>
+        )}
       </main>
     </div>
   )
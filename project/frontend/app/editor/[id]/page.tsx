@@ -1,10 +1,12 @@
 'use client'
 
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { useRouter, useParams } from 'next/navigation'
+import axios from 'axios'
 import { api } from '@/lib/api'
+import { makePatch } from '@/lib/jsonPatch'
 import { useAuthStore } from '@/lib/store'
-import { Resume, ResumeContent } from '@/types/resume'
+import { ExportJob, Resume, ResumeContent } from '@/types/resume'
 import ResumeEditor from '@/components/resume/ResumeEditor'
 import ResumePreview from '@/components/resume/ResumePreview'
 
@@ -15,6 +17,14 @@ export default function EditorPage() {
   const [resume, setResume] = useState<Resume | null>(null)
   const [loading, setLoading] = useState(true)
   const [saving, setSaving] = useState(false)
+  const [exporting, setExporting] = useState(false)
+  // ETag of the version being edited; sent back as If-Match on save so a
+  // stale tab can't overwrite newer changes. A ref, so debounced saves
+  // always see the latest one.
+  const etag = useRef<string | null>(null)
+  // Content and version the server last confirmed; autosave sends only the
+  // JSON Patch from it to the current content.
+  const saved = useRef<Resume | null>(null)
 
   useEffect(() => {
     if (!token) {
@@ -26,6 +36,8 @@ export default function EditorPage() {
       try {
         const response = await api.get(`/api/v1/resumes/${params.id}`)
         setResume(response.data)
+        saved.current = response.data
+        etag.current = response.headers['etag'] ?? null
       } catch (error) {
         console.error('Failed to fetch resume:', error)
         router.push('/dashboard')
@@ -37,14 +49,66 @@ export default function EditorPage() {
     fetchResume()
   }, [token, params.id, router])
 
-  const handleUpdate = async (content: ResumeContent) => {
-    if (!resume) return
+  // Saves go out one at a time: edits made while one is in flight wait in
+  // `pending`, newest only, and go out as a single patch once it settles,
+  // against the version and ETag it returned. Overlapping requests would
+  // share a base, and the later one would fail as if another tab had
+  // written.
+  const inFlight = useRef<Promise<void> | null>(null)
+  const pending = useRef<ResumeContent | null>(null)
+
+  const handleUpdate = (content: ResumeContent) => {
+    pending.current = content
+    if (!inFlight.current) {
+      inFlight.current = flushSaves()
+    }
+    return inFlight.current
+  }
+
+  const flushSaves = async () => {
+    try {
+      while (pending.current) {
+        const content = pending.current
+        pending.current = null
+        await saveContent(content)
+      }
+    } catch (error) {
+      console.error('Failed to save resume:', error)
+    } finally {
+      inFlight.current = null
+    }
+  }
+
+  const saveContent = async (content: ResumeContent) => {
+    const base = saved.current
+    if (!base) return
+
+    const operations = makePatch(base.content, content)
+    if (operations.length === 0) return
 
     setSaving(true)
     try {
-      const response = await api.put(`/api/v1/resumes/${resume.id}`, { content })
-      setResume(response.data)
+      const response = await api.patch(
+        `/api/v1/resumes/${base.id}`,
+        { base_version: base.current_version, operations },
+        { headers: etag.current ? { 'If-Match': etag.current } : {} }
+      )
+      // The reply carries metadata only; the content is what we just sent.
+      saved.current = { ...response.data, content }
+      setResume(saved.current)
+      etag.current = response.headers['etag'] ?? null
     } catch (error) {
+      const status = axios.isAxiosError(error) ? error.response?.status : undefined
+      if (status === 409 || status === 412) {
+        alert('This resume was changed elsewhere. Reloading the latest version.')
+        // Queued edits were made on top of the version that lost.
+        pending.current = null
+        const response = await api.get(`/api/v1/resumes/${base.id}`)
+        setResume(response.data)
+        saved.current = response.data
+        etag.current = response.headers['etag'] ?? null
+        return
+      }
       console.error('Failed to save resume:', error)
     } finally {
       setSaving(false)
@@ -52,8 +116,33 @@ export default function EditorPage() {
   }
 
   const handleExportPDF = async () => {
-    // TODO: Implement PDF export
-    alert('PDF export coming soon!')
+    if (!resume) return
+
+    setExporting(true)
+    try {
+      let job: ExportJob = (await api.post(`/api/v1/resumes/${resume.id}/export`)).data
+      // The PDF is rendered in the background; long-poll until it is ready.
+      while (job.status === 'pending' || job.status === 'processing') {
+        const response = await api.get(
+          `/api/v1/resumes/${resume.id}/exports/${job.id}`,
+          { params: { wait: 20 } }
+        )
+        job = response.data
+      }
+      if (job.status !== 'completed' || !job.url) {
+        throw new Error(job.error || 'Export failed')
+      }
+      window.open(job.url, '_blank')
+    } catch (error) {
+      console.error('Failed to export resume:', error)
+      if (axios.isAxiosError(error) && error.response?.status === 429) {
+        alert(error.response.data.detail)
+      } else {
+        alert('PDF export failed, please try again.')
+      }
+    } finally {
+      setExporting(false)
+    }
   }
 
   if (loading) {
@@ -88,9 +177,10 @@ export default function EditorPage() {
             {saving && <span className="text-sm text-gray-500">Saving...</span>}
             <button
               onClick={handleExportPDF}
-              className="px-4 py-2 bg-primary-600 text-white rounded-lg font-medium hover:bg-primary-700 transition"
+              disabled={exporting}
+              className="px-4 py-2 bg-primary-600 text-white rounded-lg font-medium hover:bg-primary-700 transition disabled:opacity-50"
             >
-              Export PDF
+              {exporting ? 'Exporting...' : 'Export PDF'}
             </button>
           </div>
         </div>
@@ -0,0 +1,45 @@
+import { PatchOperation } from '@/types/resume'
+
+const escape = (key: string) => key.replace(/~/g, '~0').replace(/\//g, '~1')
+
+const isObject = (value: unknown): value is Record<string, unknown> =>
+  typeof value === 'object' && value !== null && !Array.isArray(value)
+
+// RFC 6902 operations that turn `src` into `dst`. Mirrors make_patch in the
+// backend's app/core/json_patch.py.
+export function makePatch(src: unknown, dst: unknown, path = ''): PatchOperation[] {
+  if (src === dst) return []
+
+  if (isObject(src) && isObject(dst)) {
+    const ops: PatchOperation[] = []
+    for (const key of Object.keys(src)) {
+      if (!(key in dst)) ops.push({ op: 'remove', path: `${path}/${escape(key)}` })
+    }
+    for (const [key, value] of Object.entries(dst)) {
+      const child = `${path}/${escape(key)}`
+      if (!(key in src)) {
+        ops.push({ op: 'add', path: child, value })
+      } else {
+        ops.push(...makePatch(src[key], value, child))
+      }
+    }
+    return ops
+  }
+
+  if (Array.isArray(src) && Array.isArray(dst)) {
+    const ops: PatchOperation[] = []
+    const common = Math.min(src.length, dst.length)
+    for (let i = 0; i < common; i++) {
+      ops.push(...makePatch(src[i], dst[i], `${path}/${i}`))
+    }
+    for (let i = common; i < dst.length; i++) {
+      ops.push({ op: 'add', path: `${path}/${i}`, value: dst[i] })
+    }
+    for (let i = src.length - 1; i >= common; i--) {
+      ops.push({ op: 'remove', path: `${path}/${i}` })
+    }
+    return ops
+  }
+
+  return [{ op: 'replace', path, value: dst }]
+}
@@ -51,14 +51,41 @@ export interface ResumeContent {
 
 export type ResumeLanguage = 'en' | 'ru' | 'fr'
 
-export interface Resume {
+export interface ResumeSummary {
   id: string
   user_id: string
   title: string
   language: ResumeLanguage
   template_id: string
-  content: ResumeContent
   current_version: number
   created_at: string
   updated_at: string
 }
+
+export interface Resume extends ResumeSummary {
+  content: ResumeContent
+}
+
+export interface PatchOperation {
+  op: 'add' | 'remove' | 'replace' | 'move' | 'copy' | 'test'
+  path: string
+  value?: unknown
+  from?: string
+}
+
+export interface Page<T> {
+  items: T[]
+  next_cursor: string | null
+}
+
+export type ExportStatus = 'pending' | 'processing' | 'completed' | 'failed'
+
+export interface ExportJob {
+  id: string
+  resume_id: string
+  status: ExportStatus
+  url: string | null
+  error: string | null
+  created_at: string
+  finished_at: string | null
+}